@@ -6,6 +6,8 @@ import streamlit as st
 from services.database_manager import DatabaseManager
 from services.auth_manager import AuthManager
 from services.ai_assistant import AIAssistant
+from services.summary_service import SummaryService
+from services.maintenance_scheduler import MaintenanceScheduler
 
 # Page config
 st.set_page_config(page_title="Multi-Domain Platform", layout="wide")
@@ -19,6 +21,16 @@ def get_db_manager():
 def get_auth_manager():
     return AuthManager(get_db_manager())
 
+@st.cache_resource
+def get_summary_service():
+    return SummaryService(get_db_manager())
+
+@st.cache_resource
+def get_maintenance_scheduler():
+    scheduler = MaintenanceScheduler(get_db_manager())
+    scheduler.start()
+    return scheduler
+
 @st.cache_resource
 def get_ai_assistant():
     return AIAssistant()
@@ -34,6 +46,8 @@ if 'current_page' not in st.session_state:
 # Get services
 db_manager = get_db_manager()
 auth_manager = get_auth_manager()
+summary_service = get_summary_service()
+maintenance_scheduler = get_maintenance_scheduler()
 ai_assistant = get_ai_assistant()
 
 def main():
@@ -82,7 +96,7 @@ def show_main_app():
         st.markdown("---")
         
         # Simple navigation - using selectbox
-        page_options = ["Dashboard", "🛡️ Cybersecurity", "📊 Data Science", "💻 IT Operations", "🤖 AI Assistant"]
+        page_options = ["Dashboard", "🛡️ Cybersecurity", "📊 Data Science", "💻 IT Operations", "🔎 Search", "🗄️ Archive", "🧰 Maintenance", "🤖 AI Assistant"]
         page = st.selectbox("Go to Page", page_options)
         
         # Map selection to actual page
@@ -94,6 +108,12 @@ def show_main_app():
             st.session_state.current_page = "datascience"
         elif page == "💻 IT Operations":
             st.session_state.current_page = "itops"
+        elif page == "🔎 Search":
+            st.session_state.current_page = "search"
+        elif page == "🗄️ Archive":
+            st.session_state.current_page = "archive"
+        elif page == "🧰 Maintenance":
+            st.session_state.current_page = "maintenance"
         elif page == "🤖 AI Assistant":
             st.session_state.current_page = "ai_assistant"
         
@@ -101,9 +121,10 @@ def show_main_app():
         
         # Quick stats
         try:
-            incidents = len(db_manager.fetch_all("SELECT id FROM cyber_incidents"))
-            datasets = len(db_manager.fetch_all("SELECT id FROM datasets_metadata"))
-            tickets = len(db_manager.fetch_all("SELECT id FROM it_tickets"))
+            with db_manager.read_only():
+                incidents = summary_service.total('cyber_incidents')
+                datasets = summary_service.total('datasets_metadata')
+                tickets = summary_service.total('it_tickets')
             
             st.subheader("📈 Quick Stats")
             st.metric("Incidents", incidents)
@@ -127,16 +148,18 @@ def show_main_app():
             st.write(f"Welcome to the Dashboard, {st.session_state.username}!")
             
             # Show quick overview
+            active = ('Open', 'In Progress')
             col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Active Incidents", 
-                         len(db_manager.fetch_all("SELECT id FROM cyber_incidents WHERE status IN ('Open', 'In Progress')")))
-            with col2:
-                st.metric("Total Datasets", 
-                         len(db_manager.fetch_all("SELECT id FROM datasets_metadata")))
-            with col3:
-                st.metric("Open Tickets", 
-                         len(db_manager.fetch_all("SELECT id FROM it_tickets WHERE status IN ('Open', 'In Progress')")))
+            with db_manager.read_only():
+                with col1:
+                    st.metric("Active Incidents", 
+                             summary_service.total('cyber_incidents', active))
+                with col2:
+                    st.metric("Total Datasets", 
+                             summary_service.total('datasets_metadata'))
+                with col3:
+                    st.metric("Open Tickets", 
+                             summary_service.total('it_tickets', active))
             
             st.info("Select a domain page from the sidebar to manage data.")
             
@@ -149,6 +172,15 @@ def show_main_app():
         elif st.session_state.current_page == "itops":
             from pages.itoperations import show_itops
             show_itops(db_manager)
+        elif st.session_state.current_page == "search":
+            from pages.search import show_search
+            show_search(db_manager)
+        elif st.session_state.current_page == "archive":
+            from pages.archive import show_archive
+            show_archive(db_manager)
+        elif st.session_state.current_page == "maintenance":
+            from pages.maintenance import show_maintenance
+            show_maintenance(db_manager, maintenance_scheduler)
         elif st.session_state.current_page == "ai_assistant":
             from pages.ai_assistant import show_ai_assistant
             show_ai_assistant(db_manager)
@@ -157,4 +189,8 @@ def show_main_app():
         st.info(f"Current page: {st.session_state.current_page}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        main()
+    finally:
+        # Hand this run's pooled connection back for other sessions
+        db_manager.release_connection()
\ No newline at end of file
@@ -1,7 +1,12 @@
 import sqlite3
 import os
+import time
+from datetime import datetime
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "DATA", "intelligence_platform.db")
+SCHEMA_VERSION = 2  # bump when _create_tables changes
+BACKUP_DIR = os.path.join(os.path.dirname(DB_PATH), "backups")
+BACKUP_GENERATIONS = 5
 
 def ensure_data_dir():
     data_dir = os.path.dirname(DB_PATH)
@@ -13,10 +18,33 @@ def connect_database(path=None):
     db_file = path or DB_PATH
     conn = sqlite3.connect(db_file, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    # ensure tables exist
-    _create_tables(conn)
+    # ensure tables exist (skipped once the stored schema version is current)
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        _create_tables(conn)
     return conn
 
+def backup_database(conn, pages_per_step=256, step_sleep=0.005):
+    """Copy the live DB into a new file under DATA/backups a few pages at a time.
+    Sleeping between steps lets other writers in; keeps the newest BACKUP_GENERATIONS."""
+    os.makedirs(BACKUP_DIR, exist_ok=True)
+    dest = os.path.join(BACKUP_DIR, datetime.now().strftime("backup-%Y%m%d-%H%M%S-%f.db"))
+    started = time.perf_counter()
+    target = sqlite3.connect(dest + ".partial")
+    try:
+        conn.backup(target, pages=pages_per_step,
+                    progress=lambda status, remaining, total: remaining and time.sleep(step_sleep))
+        ok = target.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    finally:
+        target.close()
+    if not ok:
+        os.remove(dest + ".partial")
+        raise sqlite3.DatabaseError("backup failed integrity_check")
+    os.replace(dest + ".partial", dest)
+    for old in sorted(f for f in os.listdir(BACKUP_DIR) if f.endswith(".db"))[:-BACKUP_GENERATIONS]:
+        os.remove(os.path.join(BACKUP_DIR, old))
+    return {"path": dest, "bytes": os.path.getsize(dest),
+            "seconds": round(time.perf_counter() - started, 3)}
+
 def _create_tables(conn):
     cur = conn.cursor()
     # users table
@@ -50,4 +78,28 @@ def _create_tables(conn):
         status TEXT,
         created_date TEXT
     )""")
+    # daily incident counts kept exact by triggers (backs the trend chart)
+    cur.execute("""CREATE TABLE IF NOT EXISTS incident_daily_counts (
+        day TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (day, severity)
+    ) WITHOUT ROWID""")
+    add_new = """INSERT INTO incident_daily_counts (day, severity, count)
+            SELECT date(new.date), COALESCE(new.severity, ''), 1 WHERE date(new.date) IS NOT NULL
+            ON CONFLICT (day, severity) DO UPDATE SET count = count + 1;"""
+    remove_old = """UPDATE incident_daily_counts SET count = count - 1
+            WHERE day = date(old.date) AND severity = COALESCE(old.severity, '');
+            DELETE FROM incident_daily_counts WHERE count <= 0;"""
+    cur.execute(f"""CREATE TRIGGER IF NOT EXISTS trg_incidents_insert_daily
+        AFTER INSERT ON cyber_incidents BEGIN {add_new} END""")
+    cur.execute(f"""CREATE TRIGGER IF NOT EXISTS trg_incidents_delete_daily
+        AFTER DELETE ON cyber_incidents BEGIN {remove_old} END""")
+    cur.execute(f"""CREATE TRIGGER IF NOT EXISTS trg_incidents_update_daily
+        AFTER UPDATE OF date, severity ON cyber_incidents BEGIN {remove_old} {add_new} END""")
+    cur.execute("DELETE FROM incident_daily_counts")
+    cur.execute("""INSERT INTO incident_daily_counts (day, severity, count)
+        SELECT date(date), COALESCE(severity, ''), COUNT(*) FROM cyber_incidents
+        WHERE date(date) IS NOT NULL GROUP BY 1, 2""")
+    cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
@@ -6,6 +6,23 @@ def get_all_incidents(conn):
     rows = cur.fetchall()
     return pd.DataFrame([dict(r) for r in rows])
 
+def get_incident_trend(conn, start=None, end=None):
+    """Incidents per day from the trigger-maintained daily counts"""
+    sql = "SELECT day, SUM(count) AS count FROM incident_daily_counts WHERE 1 = 1"
+    params = []
+    if start:
+        sql += " AND day >= ?"
+        params.append(start)
+    if end:
+        sql += " AND day <= ?"
+        params.append(end)
+    sql += " GROUP BY day ORDER BY day"
+    cur = conn.cursor()
+    cur.execute(sql, params)
+    rows = cur.fetchall()
+    return pd.Series([r['count'] for r in rows],
+                     index=pd.to_datetime([r['day'] for r in rows]), dtype='int64')
+
 def insert_incident(conn, title, severity, status, date=None):
     cur = conn.cursor()
     cur.execute(
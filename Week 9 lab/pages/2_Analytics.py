@@ -1,7 +1,6 @@
 import streamlit as st
-import pandas as pd
 from app.data.db import connect_database
-from app.data.incidents import get_all_incidents
+from app.data.incidents import get_all_incidents, get_incident_trend
 
 st.set_page_config(page_title="Analytics", layout="wide")
 
@@ -23,11 +22,6 @@ else:
     st.bar_chart(counts)
 
     st.subheader("Incidents over time (if dates present)")
-    if 'date' in incidents.columns and incidents['date'].notnull().any():
-        try:
-            df = incidents.dropna(subset=['date'])
-            df['date'] = pd.to_datetime(df['date'])
-            df2 = df.groupby(df['date'].dt.date).size()
-            st.line_chart(df2)
-        except Exception as e:
-            st.write("Could not parse dates:", e)
+    trend = get_incident_trend(conn)
+    if not trend.empty:
+        st.line_chart(trend)
@@ -1,5 +1,5 @@
 import streamlit as st
-from app.data.db import connect_database
+from app.data.db import connect_database, backup_database
 from app.data.users import get_user_role
 
 st.set_page_config(page_title="Settings", layout="wide")
@@ -18,8 +18,15 @@ try:
 except Exception:
     st.write("Could not fetch role from DB (not critical for demo).")
 
+if st.button("Back up DB"):
+    result = backup_database(conn)
+    st.success(f"Backup written to {result['path']} "
+               f"({result['bytes'] / 1e6:.1f} MB in {result['seconds']}s, integrity ok)")
+
 if st.button("Delete local demo DB (reset)"):
     import os
+    # keep a copy so a reset can be undone by restoring the latest backup
+    backup_database(conn)
     dbfile = conn.execute('PRAGMA database_list').fetchall()[0]['file']
     conn.close()
     if os.path.exists(dbfile):
@@ -0,0 +1,21 @@
+# Take an online backup of the platform database (safe while the app is running)
+#   python backup_database.py          new generation, keeps the newest 7
+#   python backup_database.py --list   show the kept generations
+import sys
+from services.database_manager import DatabaseManager
+from services.backup_service import BackupService
+
+db_manager = DatabaseManager('database/platform.db')
+backup_service = BackupService(db_manager)
+
+if '--list' not in sys.argv:
+    metrics = backup_service.backup()
+    print(f"💾 Backup {metrics['generation']}: {metrics['bytes'] / 1e6:.1f} MB "
+          f"in {metrics['duration_seconds']:.2f}s ({metrics['mb_per_second']} MB/s), integrity ok")
+    for filename, stats in metrics['files'].items():
+        print(f"   {filename}: {stats['pages']} pages in {stats['steps']} step(s)")
+
+for backup in backup_service.list_backups():
+    print(f"   {backup['generation']}  {backup['bytes'] / 1e6:8.1f} MB  {backup['created_at']}")
+
+db_manager.close()
@@ -2,8 +2,33 @@
 Database utilities (legacy - for backward compatibility)
 New code should use DatabaseManager from services
 """
+import threading
+from typing import Dict
 from services.database_manager import DatabaseManager
 
+_managers: Dict[str, DatabaseManager] = {}
+_managers_lock = threading.Lock()
+
+def get_database_manager(db_path: str = "database/platform.db") -> DatabaseManager:
+    """
+    Get the shared DatabaseManager for a database path
+    
+    The manager (and its schema check) is created once per path and
+    reused by every later call.
+    
+    Args:
+        db_path: Path to database file
+        
+    Returns:
+        DatabaseManager: Shared manager for db_path
+    """
+    with _managers_lock:
+        manager = _managers.get(db_path)
+        if manager is None:
+            manager = DatabaseManager(db_path)
+            _managers[db_path] = manager
+        return manager
+
 # For backward compatibility with existing code
 def connect_database(db_path: str = "database/platform.db"):
     """
@@ -15,5 +40,4 @@ def connect_database(db_path: str = "database/platform.db"):
     Returns:
         sqlite3.Connection: Database connection
     """
-    db_manager = DatabaseManager(db_path)
-    return db_manager.connect()
\ No newline at end of file
+    return get_database_manager(db_path).connect()
\ No newline at end of file
@@ -5,6 +5,7 @@ Contains database connection utilities and legacy compatibility functions
 
 # Import the main DatabaseManager from services for backward compatibility
 from services.database_manager import DatabaseManager
+from database.db import get_database_manager
 
 # Legacy function for backward compatibility with Week 10 code
 def connect_database(db_path: str = "database/platform.db"):
@@ -18,8 +19,7 @@ def connect_database(db_path: str = "database/platform.db"):
     Returns:
         sqlite3.Connection: Database connection object
     """
-    db_manager = DatabaseManager(db_path)
-    return db_manager.connect()
+    return get_database_manager(db_path).connect()
 
 # Export for public API
-__all__ = ['DatabaseManager', 'connect_database']
\ No newline at end of file
+__all__ = ['DatabaseManager', 'connect_database', 'get_database_manager']
\ No newline at end of file
@@ -1,79 +1,120 @@
 # import_csv_data.py
 import pandas as pd
-import sqlite3
 from datetime import datetime
+from services.database_manager import DatabaseManager
+from services.rollup_service import RollupService
 
 # Connect to database
-conn = sqlite3.connect('database/platform.db')
-cursor = conn.cursor()
+db_manager = DatabaseManager('database/platform.db')
+
+def archived_ids(view, column):
+    """External ids already moved to archive.db (re-importing them would revive them)"""
+    return {row[column] for row in db_manager.fetch_all(
+        f"SELECT {column} FROM {view} WHERE {column} IS NOT NULL")}
+
+def claim_legacy_rows(table, key_column, rows, natural_key, schemas=('main',)):
+    """
+    Give rows imported before the CSV ids were stored their id back
+    
+    Earlier imports left key_column NULL, so upserting on it would insert
+    every such record again. For each CSV id not in the table yet, the
+    oldest record without an id whose natural_key columns match takes it,
+    looking in the hot table first and then in the archived one.
+    """
+    existing = set()
+    for schema in schemas:
+        existing |= {row[key_column] for row in db_manager.fetch_all(
+            f"SELECT {key_column} FROM {schema}.{table} WHERE {key_column} IS NOT NULL")}
+    pending = [row for row in rows if row[key_column] not in existing]
+    if not pending:
+        return
+    match = ' AND '.join(f"{column} IS ?" for column in natural_key)
+    with db_manager.transaction() as conn:
+        for row in pending:
+            params = (row[key_column],) + tuple(row[column] for column in natural_key)
+            for schema in schemas:
+                if conn.execute(
+                    f"UPDATE {schema}.{table} SET {key_column} = ? WHERE id = "
+                    f"(SELECT MIN(id) FROM {schema}.{table} WHERE {key_column} IS NULL AND {match})",
+                    params
+                ).rowcount:
+                    break
+    db_manager.invalidate(table)
+
+# Re-running the import upserts on the CSV ids: new rows are inserted, changed
+# rows updated and unchanged rows left alone. The import date is only set once.
+# Records from imports that predate the ids are matched up first.
 
 print("📊 Importing CSV data into database...")
 
 # 1. Import cyber_incidents.csv
 try:
     incidents_df = pd.read_csv('cyber_incidents.csv')
-    for _, row in incidents_df.iterrows():
-        cursor.execute("""
-            INSERT INTO cyber_incidents 
-            (title, severity, status, description, reported_by, date)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            row['title'],
-            row.get('priority', 'Medium'),  # Map priority to severity
-            row.get('status', 'Open'),
-            row.get('description', ''),
-            f"User_{row.get('reported_by', 1)}",
-            datetime.now().strftime('%Y-%m-%d')
-        ))
-    print(f"✅ Imported {len(incidents_df)} incidents")
+    rows = [{
+        'incident_id': str(row['incident_id']),
+        'title': row['title'],
+        'severity': row.get('priority', 'Medium'),  # Map priority to severity
+        'status': row.get('status', 'Open'),
+        'description': row.get('description', ''),
+        'reported_by': f"User_{row.get('reported_by', 1)}",
+        'date': datetime.now().strftime('%Y-%m-%d')
+    } for _, row in incidents_df.iterrows()]
+    claim_legacy_rows('cyber_incidents', 'incident_id', rows, ('title', 'description'),
+                      schemas=('main', 'archive'))
+    archived = archived_ids('incidents_archive', 'incident_id')
+    written = db_manager.upsert('cyber_incidents',
+        (row for row in rows if row['incident_id'] not in archived),
+        conflict_keys=['incident_id'],
+        update_columns=['title', 'severity', 'status', 'description', 'reported_by'])
+    print(f"✅ Synced {len(incidents_df)} incidents ({written} new or changed)")
 except FileNotFoundError:
     print("⚠️ cyber_incidents.csv not found")
 
 # 2. Import datasets_metadata.csv  
 try:
     datasets_df = pd.read_csv('datasets_metadata.csv')
-    for _, row in datasets_df.iterrows():
-        cursor.execute("""
-            INSERT INTO datasets_metadata 
-            (name, description, created_at)
-            VALUES (?, ?, ?)
-        """, (
-            row['name'],
-            row.get('description', ''),
-            row.get('created_at', datetime.now().isoformat())
-        ))
-    print(f"✅ Imported {len(datasets_df)} datasets")
+    rows = [{
+        'dataset_id': str(row['dataset_id']),
+        'name': row['name'],
+        'description': row.get('description', ''),
+        'created_at': row.get('created_at', datetime.now().isoformat())
+    } for _, row in datasets_df.iterrows()]
+    claim_legacy_rows('datasets_metadata', 'dataset_id', rows, ('name', 'description'))
+    written = db_manager.upsert('datasets_metadata', rows, conflict_keys=['dataset_id'])
+    print(f"✅ Synced {len(datasets_df)} datasets ({written} new or changed)")
 except FileNotFoundError:
     print("⚠️ datasets_metadata.csv not found")
 
 # 3. Import it_tickets.csv
 try:
     tickets_df = pd.read_csv('it_tickets.csv')
-    for _, row in tickets_df.iterrows():
-        cursor.execute("""
-            INSERT INTO it_tickets 
-            (title, priority, status, assigned_to, description, created_date)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            row.get('subject', row.get('title', '')),
-            row.get('priority', 'Medium'),
-            row.get('status', 'Open'),
-            f"User_{row.get('assigned_to', 1)}",
-            row.get('description', ''),
-            datetime.now().strftime('%Y-%m-%d')
-        ))
-    print(f"✅ Imported {len(tickets_df)} tickets")
+    rows = [{
+        'ticket_id': str(row['ticket_id']),
+        'title': row.get('subject', row.get('title', '')),
+        'priority': row.get('priority', 'Medium'),
+        'status': row.get('status', 'Open'),
+        'assigned_to': f"User_{row.get('assigned_to', 1)}",
+        'description': row.get('description', ''),
+        'created_date': datetime.now().strftime('%Y-%m-%d')
+    } for _, row in tickets_df.iterrows()]
+    claim_legacy_rows('it_tickets', 'ticket_id', rows, ('title', 'description'),
+                      schemas=('main', 'archive'))
+    archived = archived_ids('tickets_archive', 'ticket_id')
+    written = db_manager.upsert('it_tickets',
+        (row for row in rows if row['ticket_id'] not in archived),
+        conflict_keys=['ticket_id'],
+        update_columns=['title', 'priority', 'status', 'assigned_to', 'description'])
+    print(f"✅ Synced {len(tickets_df)} tickets ({written} new or changed)")
 except FileNotFoundError:
     print("⚠️ it_tickets.csv not found")
 
-# 4. Create a default admin user
-cursor.execute("""
-    INSERT OR IGNORE INTO users 
-    (username, password_hash, role) 
-    VALUES (?, ?, ?)
-""", ('admin', 'admin123', 'admin'))
+# 4. Create a default admin user (left alone if it already exists)
+db_manager.upsert('users', [{'username': 'admin', 'password_hash': 'admin123', 'role': 'admin'}],
+                  conflict_keys=['username'], update_columns=[])
+
+# 5. Recount the trend buckets of the imported days
+RollupService(db_manager).refresh()
 
-conn.commit()
-conn.close()
+db_manager.close()
 print("\n🎉 Data import complete!")
 print("Refresh your dashboard to see the data.")
\ No newline at end of file
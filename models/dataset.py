@@ -9,7 +9,8 @@ class Dataset:
     
     def __init__(self, id: int = None, name: str = "", source: str = "", 
                  category: str = "", size: int = 0, description: str = "",
-                 created_at: str = None):
+                 created_at: str = None, dataset_id: str = None,
+                 created_at_epoch: int = None):
         """
         Initialize a Dataset object
         
@@ -21,6 +22,8 @@ class Dataset:
             size: Size in bytes
             description: Dataset description
             created_at: Creation timestamp
+            dataset_id: Id of the dataset in the source system it was imported from
+            created_at_epoch: Unix seconds of the date (derived by the database)
         """
         self.__id = id
         self.__name = name
@@ -29,6 +32,8 @@ class Dataset:
         self.__size = size if size is not None else 0  # Convert None to 0
         self.__description = description
         self.__created_at = created_at or datetime.now().isoformat()
+        self.__dataset_id = dataset_id
+        self.__created_at_epoch = created_at_epoch
     
     # Getter methods
     @property
@@ -59,6 +64,14 @@ class Dataset:
     def created_at(self) -> str:
         return self.__created_at
     
+    @property
+    def dataset_id(self) -> str:
+        return self.__dataset_id
+    
+    @property
+    def created_at_epoch(self) -> int:
+        return self.__created_at_epoch
+    
     # Business logic methods
     def calculate_size_mb(self) -> float:
         """Calculate size in megabytes"""
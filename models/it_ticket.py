@@ -12,7 +12,9 @@ class ITTicket:
     
     def __init__(self, id: int = None, title: str = "", priority: str = "Medium",
                  status: str = "Open", assigned_to: str = "", description: str = "",
-                 created_date: str = None, created_at: str = None):
+                 created_date: str = None, created_at: str = None,
+                 closed_at: str = None, ticket_id: str = None,
+                 created_date_epoch: int = None):
         """
         Initialize an ITTicket object
         
@@ -25,6 +27,9 @@ class ITTicket:
             description: Ticket description
             created_date: Ticket creation date
             created_at: Creation timestamp
+            closed_at: When the record was last closed (set by the database)
+            ticket_id: Id of the ticket in the source system it was imported from
+            created_date_epoch: Unix seconds of the date (derived by the database)
         """
         self.__id = id
         self.__title = title
@@ -34,6 +39,9 @@ class ITTicket:
         self.__description = description
         self.__created_date = created_date or datetime.now().strftime("%Y-%m-%d")
         self.__created_at = created_at or datetime.now().isoformat()
+        self.__closed_at = closed_at
+        self.__ticket_id = ticket_id
+        self.__created_date_epoch = created_date_epoch
     
     # Getter methods
     @property
@@ -68,6 +76,18 @@ class ITTicket:
     def created_at(self) -> str:
         return self.__created_at
     
+    @property
+    def closed_at(self) -> str:
+        return self.__closed_at
+    
+    @property
+    def ticket_id(self) -> str:
+        return self.__ticket_id
+    
+    @property
+    def created_date_epoch(self) -> int:
+        return self.__created_date_epoch
+    
     # Business logic methods
     def assign_to(self, staff_name: str) -> None:
         """Assign ticket to a staff member"""
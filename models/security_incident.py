@@ -12,7 +12,9 @@ class SecurityIncident:
     
     def __init__(self, id: int = None, title: str = "", severity: str = "Medium",
                  status: str = "Open", description: str = "", reported_by: str = "",
-                 date: str = None, created_at: str = None):
+                 date: str = None, created_at: str = None,
+                 closed_at: str = None, incident_id: str = None,
+                 date_epoch: int = None):
         """
         Initialize a SecurityIncident object
         
@@ -25,6 +27,9 @@ class SecurityIncident:
             reported_by: Who reported the incident
             date: Incident date
             created_at: Creation timestamp
+            closed_at: When the record was last closed (set by the database)
+            incident_id: Id of the incident in the source system it was imported from
+            date_epoch: Unix seconds of the date (derived by the database)
         """
         self.__id = id
         self.__title = title
@@ -34,6 +39,9 @@ class SecurityIncident:
         self.__reported_by = reported_by
         self.__date = date or datetime.now().strftime("%Y-%m-%d")
         self.__created_at = created_at or datetime.now().isoformat()
+        self.__closed_at = closed_at
+        self.__incident_id = incident_id
+        self.__date_epoch = date_epoch
     
     # Getter methods
     @property
@@ -64,6 +72,18 @@ class SecurityIncident:
     def date(self) -> str:
         return self.__date
     
+    @property
+    def closed_at(self) -> str:
+        return self.__closed_at
+    
+    @property
+    def incident_id(self) -> str:
+        return self.__incident_id
+    
+    @property
+    def date_epoch(self) -> int:
+        return self.__date_epoch
+    
     # Setter methods
     def update_status(self, new_status: str) -> None:
         """Update incident status"""
@@ -4,6 +4,7 @@ AI Assistant Page - Get AI-powered assistance
 import streamlit as st
 from services.ai_assistant import AIAssistant
 from services.database_manager import DatabaseManager
+from services import page_queries
 
 def show_ai_assistant(db_manager: DatabaseManager):
     """
@@ -95,18 +96,23 @@ def show_ai_assistant(db_manager: DatabaseManager):
         st.subheader("AI-Powered Incident Analysis")
         
         try:
-            # Get incidents for analysis
-            incidents_data = db_manager.fetch_all("SELECT * FROM cyber_incidents")
+            # Only ids and titles of the latest incidents for the picker;
+            # the chosen incident is loaded below
+            incidents_data = db_manager.fetch_all(page_queries.INCIDENT_PICKER,
+                                                  (page_queries.PICKER_LIMIT,), row_type='tuple')
             
             if incidents_data:
-                incident_options = {f"{inc['id']}: {inc['title']}": inc for inc in incidents_data}
+                incident_options = {f"{id}: {title}": id for id, title in incidents_data}
                 selected_incident_key = st.selectbox(
                     "Select Incident to Analyze",
                     list(incident_options.keys())
                 )
                 
                 if selected_incident_key:
-                    selected_incident = incident_options[selected_incident_key]
+                    selected_incident = db_manager.fetch_one(
+                        page_queries.INCIDENT_BY_ID,
+                        (incident_options[selected_incident_key],)
+                    )
                     
                     # Display incident details
                     with st.expander("View Incident Details"):
@@ -127,18 +133,23 @@ def show_ai_assistant(db_manager: DatabaseManager):
         st.subheader("AI-Powered Dataset Analysis")
         
         try:
-            # Get datasets for analysis
-            datasets_data = db_manager.fetch_all("SELECT * FROM datasets_metadata")
+            # Only ids and names of the latest datasets for the picker;
+            # the chosen dataset is loaded below
+            datasets_data = db_manager.fetch_all(page_queries.DATASET_PICKER,
+                                                 (page_queries.PICKER_LIMIT,), row_type='tuple')
             
             if datasets_data:
-                dataset_options = {f"{ds['id']}: {ds['name']}": ds for ds in datasets_data}
+                dataset_options = {f"{id}: {name}": id for id, name in datasets_data}
                 selected_dataset_key = st.selectbox(
                     "Select Dataset to Analyze",
                     list(dataset_options.keys())
                 )
                 
                 if selected_dataset_key:
-                    selected_dataset = dataset_options[selected_dataset_key]
+                    selected_dataset = db_manager.fetch_one(
+                        page_queries.DATASET_BY_ID,
+                        (dataset_options[selected_dataset_key],)
+                    )
                     
                     # Display dataset details
                     with st.expander("View Dataset Details"):
@@ -0,0 +1,91 @@
+"""
+Archive Page - Browse archived incidents and tickets and run archival
+"""
+import streamlit as st
+import pandas as pd
+from services.database_manager import DatabaseManager, DatabaseBusyError
+from services.archive_service import ArchiveService
+
+ARCHIVE_LABELS = {
+    'cyber_incidents': "🛡️ Incidents",
+    'it_tickets': "💻 Tickets",
+}
+PAGE_SIZE = 50
+
+def show_archive(db_manager: DatabaseManager):
+    """
+    Display archive browser page
+
+    Args:
+        db_manager: DatabaseManager instance
+    """
+    st.title("🗄️ Archive")
+
+    archive_service = ArchiveService(db_manager)
+
+    tab1, tab2 = st.tabs(["Browse Archive", "Run Archival"])
+
+    with tab1:
+        table = st.selectbox("Archived records", list(ARCHIVE_LABELS),
+                             format_func=lambda name: ARCHIVE_LABELS[name])
+
+        # Keys of the pages seen so far, so Previous can step back
+        if st.session_state.get('archive_table') != table:
+            st.session_state.archive_table = table
+            st.session_state.archive_keys = [None]
+
+        try:
+            with db_manager.read_only():
+                rows, next_key = archive_service.browse(
+                    table, after_key=st.session_state.archive_keys[-1], limit=PAGE_SIZE
+                )
+        except DatabaseBusyError:
+            st.warning("The database is busy right now. Please try again in a moment.")
+            rows, next_key = [], None
+        except Exception as e:
+            st.error(f"Error loading archive: {e}")
+            rows, next_key = [], None
+
+        if rows:
+            page = len(st.session_state.archive_keys)
+            st.caption(f"Page {page} · most recently closed first")
+            st.dataframe(pd.DataFrame(rows), use_container_width=True)
+
+            col1, col2 = st.columns(2)
+            with col1:
+                if page > 1 and st.button("⬅️ Previous"):
+                    st.session_state.archive_keys.pop()
+                    st.rerun()
+            with col2:
+                if next_key is not None and st.button("Next ➡️"):
+                    st.session_state.archive_keys.append(next_key)
+                    st.rerun()
+        else:
+            st.info("Nothing has been archived yet.")
+
+    with tab2:
+        st.subheader("Move closed records to archive.db")
+
+        try:
+            stats = archive_service.stats()
+            col1, col2 = st.columns(2)
+            for col, (table, counts) in zip((col1, col2), stats.items()):
+                with col:
+                    st.metric(f"{ARCHIVE_LABELS[table]} (live)", counts['hot'])
+                    st.metric("Closed, still live", counts['closed_hot'])
+                    st.metric("Archived", counts['archived'])
+        except Exception as e:
+            st.error(f"Error reading archive statistics: {e}")
+
+        with st.form("run_archival"):
+            days = st.number_input("Archive records closed more than this many days ago",
+                                   min_value=1, value=90)
+            if st.form_submit_button("Archive Now"):
+                try:
+                    moved = archive_service.archive(older_than_days=int(days))
+                    st.success(", ".join(f"{ARCHIVE_LABELS[table]}: {count} archived"
+                                         for table, count in moved.items()))
+                except DatabaseBusyError:
+                    st.warning("The database is busy right now. Please try again in a moment.")
+                except Exception as e:
+                    st.error(f"Error archiving: {e}")
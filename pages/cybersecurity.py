@@ -4,10 +4,16 @@ Refactored from procedural code to OOP
 """
 import streamlit as st
 import pandas as pd
-from datetime import datetime
-from services.database_manager import DatabaseManager
+from datetime import date, datetime, timedelta
+from services.database_manager import DatabaseManager, DatabaseBusyError
+from services.summary_service import SummaryService
+from services.rollup_service import RollupService
+from services import page_queries
 from models.security_incident import SecurityIncident
 
+# Listing periods: days back from today (None = all time)
+PERIODS = {"All time": None, "Last 7 days": 7, "Last 30 days": 30, "Last 90 days": 90}
+
 def show_cybersecurity(db_manager: DatabaseManager):
     """
     Display cybersecurity page
@@ -22,14 +28,26 @@ def show_cybersecurity(db_manager: DatabaseManager):
     with tab1:
         st.subheader("Security Incidents")
         
+        period = st.selectbox("Period", list(PERIODS))
+        
         try:
-            # Fetch incidents using OOP
-            incidents_data = db_manager.fetch_all("SELECT * FROM cyber_incidents ORDER BY date DESC")
-            incidents = [SecurityIncident(**data) for data in incidents_data]
+            # Fetch incidents straight into a typed DataFrame; a period is an
+            # index range on date_epoch rather than a filter over every row
+            if PERIODS[period] is None:
+                incidents_df = db_manager.fetch_frame(page_queries.INCIDENTS,
+                                                      (page_queries.LISTING_LIMIT,))
+                if len(incidents_df) == page_queries.LISTING_LIMIT:
+                    st.caption(f"Showing the latest {page_queries.LISTING_LIMIT:,} incidents; "
+                               f"pick a period to see others.")
+            else:
+                where, params = db_manager.date_range(
+                    'cyber_incidents', 'date', start=date.today() - timedelta(days=PERIODS[period] - 1)
+                )
+                incidents_df = db_manager.fetch_frame(
+                    page_queries.INCIDENTS_IN_PERIOD.format(where=where), params
+                )
             
-            if incidents:
-                # Convert to DataFrame for display
-                incidents_df = pd.DataFrame([incident.to_dict() for incident in incidents])
+            if not incidents_df.empty:
                 
                 # Allow filtering
                 status_filter = st.selectbox(
@@ -51,7 +69,9 @@ def show_cybersecurity(db_manager: DatabaseManager):
                 )
                 
                 if selected_id:
-                    selected_incident = next((i for i in incidents if i.id == selected_id), None)
+                    selected_incident = SecurityIncident(**db_manager.fetch_one(
+                        page_queries.INCIDENT_BY_ID, (selected_id,)
+                    ))
                     
                     col1, col2 = st.columns(2)
                     with col1:
@@ -69,11 +89,18 @@ def show_cybersecurity(db_manager: DatabaseManager):
                     with col2:
                         if st.button("Delete Incident", type="secondary"):
                             if db_manager.delete('cyber_incidents', selected_id):
+                                # Trend buckets are recounted on the write path, not by the charts
+                                RollupService(db_manager).refresh()
                                 st.success("Incident deleted")
                                 st.rerun()
             else:
-                st.info("No security incidents found. Add some using the 'Add Incident' tab.")
+                if PERIODS[period] is None:
+                    st.info("No security incidents found. Add some using the 'Add Incident' tab.")
+                else:
+                    st.info(f"No security incidents in the {period.lower()}.")
                 
+        except DatabaseBusyError:
+            st.warning("The database is busy right now. Please try again in a moment.")
         except Exception as e:
             st.error(f"Error loading incidents: {e}")
     
@@ -94,7 +121,7 @@ def show_cybersecurity(db_manager: DatabaseManager):
             )
             description = st.text_area("Description", placeholder="Detailed description of the incident...")
             reported_by = st.text_input("Reported By", placeholder="Your name or department")
-            date = st.date_input("Incident Date", datetime.now())
+            incident_date = st.date_input("Incident Date", datetime.now())
             
             submitted = st.form_submit_button("Add Incident")
             
@@ -109,12 +136,13 @@ def show_cybersecurity(db_manager: DatabaseManager):
                         status=status,
                         description=description,
                         reported_by=reported_by or "Anonymous",
-                        date=date.strftime("%Y-%m-%d")
+                        date=incident_date.strftime("%Y-%m-%d")
                     )
                     
                     # Save to database
                     incident_id = db_manager.insert('cyber_incidents', incident.to_dict())
                     if incident_id:
+                        RollupService(db_manager).refresh()
                         st.success(f"Incident added successfully! ID: {incident_id}")
                         st.rerun()
                     else:
@@ -122,32 +150,37 @@ def show_cybersecurity(db_manager: DatabaseManager):
     
     with tab3:
         st.subheader("Incident Analytics")
+        grain = st.radio("Trend granularity", ["day", "week", "month"],
+                         horizontal=True, format_func=str.title)
         
         try:
-            incidents_data = db_manager.fetch_all("SELECT * FROM cyber_incidents")
-            if incidents_data:
-                incidents_df = pd.DataFrame(incidents_data)
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.subheader("Incidents by Severity")
-                    severity_counts = incidents_df['severity'].value_counts()
-                    st.bar_chart(severity_counts)
-                
-                with col2:
-                    st.subheader("Incidents by Status")
-                    status_counts = incidents_df['status'].value_counts()
-                    st.bar_chart(status_counts)
-                
-                # Trend analysis
-                if 'date' in incidents_df.columns and not incidents_df['date'].isna().all():
-                    st.subheader("Incidents Over Time")
-                    incidents_df['date'] = pd.to_datetime(incidents_df['date'], errors='coerce')
-                    daily_incidents = incidents_df.groupby(incidents_df['date'].dt.date).size()
-                    st.line_chart(daily_incidents)
-            else:
-                st.info("No incident data available for analytics")
+            # Aggregations run on the read-only pool and never block the forms
+            with db_manager.read_only():
+                summary_service = SummaryService(db_manager)
+                if summary_service.total('cyber_incidents') > 0:
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.subheader("Incidents by Severity")
+                        severity_counts = pd.Series(summary_service.counts('cyber_incidents', 'severity'))
+                        st.bar_chart(severity_counts)
+                    
+                    with col2:
+                        st.subheader("Incidents by Status")
+                        status_counts = pd.Series(summary_service.counts('cyber_incidents', 'status'))
+                        st.bar_chart(status_counts)
+                    
+                    # Trend analysis (precomputed day/week/month buckets)
+                    trend = RollupService(db_manager).series('cyber_incidents', grain)
+                    if trend:
+                        st.subheader("Incidents Over Time")
+                        incidents_over_time = pd.Series(
+                            [row['count'] for row in trend],
+                            index=pd.to_datetime([row['bucket'] for row in trend])
+                        )
+                        st.line_chart(incidents_over_time)
+                else:
+                    st.info("No incident data available for analytics")
                 
         except Exception as e:
             st.error(f"Error in analytics: {e}")
\ No newline at end of file
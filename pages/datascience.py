@@ -4,7 +4,9 @@ Refactored from procedural code to OOP
 """
 import streamlit as st
 import pandas as pd
-from services.database_manager import DatabaseManager
+from services.database_manager import DatabaseManager, DatabaseBusyError
+from services.summary_service import SummaryService
+from services import page_queries
 from models.dataset import Dataset
 
 def show_datascience(db_manager: DatabaseManager):
@@ -22,21 +24,24 @@ def show_datascience(db_manager: DatabaseManager):
         st.subheader("Available Datasets")
         
         try:
-            # Fetch datasets using OOP
-            datasets_data = db_manager.fetch_all("SELECT * FROM datasets_metadata ORDER BY created_at DESC")
-            datasets = [Dataset(**data) for data in datasets_data]
+            # Fetch the most recent datasets straight into a typed DataFrame
+            datasets_df = db_manager.fetch_frame(page_queries.DATASETS,
+                                                 (page_queries.LISTING_LIMIT,))
+            if len(datasets_df) == page_queries.LISTING_LIMIT:
+                st.caption(f"Showing the latest {page_queries.LISTING_LIMIT:,} datasets; "
+                           f"size and category metrics cover those.")
             
-            if datasets:
-                # Convert to DataFrame for display
-                datasets_df = pd.DataFrame([dataset.to_dict() for dataset in datasets])
+            if not datasets_df.empty:
+                sizes = pd.to_numeric(datasets_df['size'], errors='coerce').fillna(0)
+                datasets_df['size_mb'] = sizes / (1024 * 1024)
                 
                 # Display metrics
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    total_datasets = len(datasets)
+                    total_datasets = SummaryService(db_manager).total('datasets_metadata')
                     st.metric("Total Datasets", total_datasets)
                 with col2:
-                    total_size_gb = sum(dataset.calculate_size_gb() for dataset in datasets)
+                    total_size_gb = sizes.sum() / (1024 * 1024 * 1024)
                     st.metric("Total Size", f"{total_size_gb:.2f} GB")
                 with col3:
                     categories = datasets_df['category'].nunique()
@@ -80,13 +85,19 @@ def show_datascience(db_manager: DatabaseManager):
                     )
                     
                     if selected_name:
-                        selected_dataset = next((d for d in datasets if d.name == selected_name), None)
+                        selected_id = int(datasets_df.loc[datasets_df['name'] == selected_name, 'id'].iloc[0])
+                        selected_data = db_manager.fetch_one(
+                            page_queries.DATASET_BY_ID, (selected_id,)
+                        )
+                        selected_dataset = Dataset(**selected_data) if selected_data else None
                         if selected_dataset:
                             with st.expander("View Full Details"):
                                 st.json(selected_dataset.to_dict())
             else:
                 st.info("No datasets found. Add some using the 'Add Dataset' tab.")
                 
+        except DatabaseBusyError:
+            st.warning("The database is busy right now. Please try again in a moment.")
         except Exception as e:
             st.error(f"Error loading datasets: {e}")
     
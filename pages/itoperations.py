@@ -4,10 +4,15 @@ Refactored from procedural code to OOP
 """
 import streamlit as st
 import pandas as pd
-from datetime import datetime
-from services.database_manager import DatabaseManager
+from datetime import date, datetime, timedelta
+from services.database_manager import DatabaseManager, DatabaseBusyError
+from services.summary_service import SummaryService
+from services import page_queries
 from models.it_ticket import ITTicket
 
+# Listing periods: days back from today (None = all time)
+PERIODS = {"All time": None, "Last 7 days": 7, "Last 30 days": 30, "Last 90 days": 90}
+
 def show_itops(db_manager: DatabaseManager):
     """
     Display IT operations page
@@ -22,14 +27,27 @@ def show_itops(db_manager: DatabaseManager):
     with tab1:
         st.subheader("IT Support Tickets")
         
+        period = st.selectbox("Period", list(PERIODS))
+        
         try:
-            # Fetch tickets using OOP
-            tickets_data = db_manager.fetch_all("SELECT * FROM it_tickets ORDER BY created_date DESC")
-            tickets = [ITTicket(**data) for data in tickets_data]
+            # Fetch tickets straight into a typed DataFrame; a period is an
+            # index range on created_date_epoch rather than a filter over every row
+            if PERIODS[period] is None:
+                tickets_df = db_manager.fetch_frame(page_queries.TICKETS,
+                                                    (page_queries.LISTING_LIMIT,))
+                if len(tickets_df) == page_queries.LISTING_LIMIT:
+                    st.caption(f"Showing the latest {page_queries.LISTING_LIMIT:,} tickets; "
+                               f"pick a period to see others.")
+            else:
+                where, params = db_manager.date_range(
+                    'it_tickets', 'created_date',
+                    start=date.today() - timedelta(days=PERIODS[period] - 1)
+                )
+                tickets_df = db_manager.fetch_frame(
+                    page_queries.TICKETS_IN_PERIOD.format(where=where), params
+                )
             
-            if tickets:
-                # Convert to DataFrame for display
-                tickets_df = pd.DataFrame([ticket.to_dict() for ticket in tickets])
+            if not tickets_df.empty:
                 
                 # Filter options
                 col1, col2 = st.columns(2)
@@ -63,7 +81,9 @@ def show_itops(db_manager: DatabaseManager):
                 )
                 
                 if selected_id:
-                    selected_ticket = next((t for t in tickets if t.id == selected_id), None)
+                    selected_ticket = ITTicket(**db_manager.fetch_one(
+                        page_queries.TICKET_BY_ID, (selected_id,)
+                    ))
                     
                     col1, col2, col3 = st.columns(3)
                     
@@ -73,22 +93,26 @@ def show_itops(db_manager: DatabaseManager):
                             ITTicket.STATUS_VALUES,
                             index=ITTicket.STATUS_VALUES.index(selected_ticket.status)
                         )
-                        if st.button("Update Status") and new_status != selected_ticket.status:
-                            selected_ticket.update_status(new_status)
-                            db_manager.update('it_tickets', selected_id, {'status': new_status})
-                            st.success(f"Status updated to {new_status}")
-                            st.rerun()
                     
                     with col2:
                         new_assignee = st.text_input(
                             "Assign To",
                             value=selected_ticket.assigned_to or ""
                         )
-                        if st.button("Assign") and new_assignee != selected_ticket.assigned_to:
-                            selected_ticket.assign_to(new_assignee)
-                            db_manager.update('it_tickets', selected_id, {'assigned_to': new_assignee})
-                            st.success(f"Assigned to {new_assignee}")
-                            st.rerun()
+                    
+                    if st.button("Save Changes"):
+                        # Status change and reassignment land as one atomic write
+                        with db_manager.transaction():
+                            if new_status != selected_ticket.status:
+                                selected_ticket.update_status(new_status)
+                                db_manager.update('it_tickets', selected_id, {'status': new_status})
+                            # A blank box on an unassigned ticket is not a change
+                            if new_assignee.strip() != (selected_ticket.assigned_to or "").strip():
+                                assignee = new_assignee.strip() or None
+                                selected_ticket.assign_to(assignee)
+                                db_manager.update('it_tickets', selected_id, {'assigned_to': assignee})
+                        st.success("Ticket updated")
+                        st.rerun()
                     
                     with col3:
                         if st.button("Close Ticket", type="secondary"):
@@ -97,8 +121,13 @@ def show_itops(db_manager: DatabaseManager):
                             st.success("Ticket closed")
                             st.rerun()
             else:
-                st.info("No IT tickets found. Add some using the 'Add Ticket' tab.")
+                if PERIODS[period] is None:
+                    st.info("No IT tickets found. Add some using the 'Add Ticket' tab.")
+                else:
+                    st.info(f"No IT tickets in the {period.lower()}.")
                 
+        except DatabaseBusyError:
+            st.warning("The database is busy right now. Please try again in a moment.")
         except Exception as e:
             st.error(f"Error loading tickets: {e}")
     
@@ -151,38 +180,32 @@ def show_itops(db_manager: DatabaseManager):
         st.subheader("Ticket Analytics")
         
         try:
-            tickets_data = db_manager.fetch_all("SELECT * FROM it_tickets")
-            if tickets_data:
-                tickets_df = pd.DataFrame(tickets_data)
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.subheader("Tickets by Priority")
-                    priority_counts = tickets_df['priority'].value_counts()
-                    st.bar_chart(priority_counts)
-                
-                with col2:
-                    st.subheader("Tickets by Status")
-                    status_counts = tickets_df['status'].value_counts()
-                    st.bar_chart(status_counts)
-                
-                # Resolution time analysis
-                if 'created_date' in tickets_df.columns and 'status' in tickets_df.columns:
+            # Aggregations run on the read-only pool and never block the forms
+            with db_manager.read_only():
+                summary_service = SummaryService(db_manager)
+                if summary_service.total('it_tickets') > 0:
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.subheader("Tickets by Priority")
+                        priority_counts = pd.Series(summary_service.counts('it_tickets', 'priority'))
+                        st.bar_chart(priority_counts)
+                    
+                    with col2:
+                        st.subheader("Tickets by Status")
+                        status_counts = summary_service.counts('it_tickets', 'status')
+                        st.bar_chart(pd.Series(status_counts))
+                    
+                    # Resolution time analysis
                     st.subheader("Resolution Trends")
                     # For demo - would need actual resolution dates in real implementation
-                    open_tickets = len(tickets_df[tickets_df['status'] == 'Open'])
-                    in_progress = len(tickets_df[tickets_df['status'] == 'In Progress'])
-                    resolved = len(tickets_df[tickets_df['status'] == 'Resolved'])
-                    closed = len(tickets_df[tickets_df['status'] == 'Closed'])
-                    
                     resolution_data = pd.DataFrame({
-                        'Status': ['Open', 'In Progress', 'Resolved', 'Closed'],
-                        'Count': [open_tickets, in_progress, resolved, closed]
+                        'Status': ITTicket.STATUS_VALUES,
+                        'Count': [status_counts.get(status, 0) for status in ITTicket.STATUS_VALUES]
                     })
                     st.bar_chart(resolution_data.set_index('Status'))
-            else:
-                st.info("No ticket data available for analytics")
+                else:
+                    st.info("No ticket data available for analytics")
                 
         except Exception as e:
             st.error(f"Error in analytics: {e}")
\ No newline at end of file
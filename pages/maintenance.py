@@ -0,0 +1,67 @@
+"""
+Maintenance Page - Storage health and the background maintenance tasks
+"""
+import streamlit as st
+import pandas as pd
+from services.database_manager import DatabaseManager
+from services.maintenance_scheduler import MaintenanceScheduler
+
+SCHEMA_LABELS = {
+    'main': "🗃️ platform.db",
+    'archive': "🗄️ archive.db",
+}
+
+def show_maintenance(db_manager: DatabaseManager, scheduler: MaintenanceScheduler):
+    """
+    Display maintenance page
+
+    Args:
+        db_manager: DatabaseManager instance
+        scheduler: Running MaintenanceScheduler
+    """
+    st.title("🧰 Maintenance")
+
+    tab1, tab2 = st.tabs(["Storage", "Scheduled Tasks"])
+
+    with tab1:
+        try:
+            report = scheduler.report()
+            col1, col2 = st.columns(2)
+            for col, (schema, entry) in zip((col1, col2), report.items()):
+                with col:
+                    st.subheader(SCHEMA_LABELS[schema])
+                    st.metric("File size", f"{entry['file_bytes'] / 1e6:.1f} MB")
+                    st.metric("Free pages", entry['freelist_count'],
+                              f"{entry['free_fraction']:.1%} of {entry['page_count']}",
+                              delta_color="off")
+                    st.metric("WAL size", f"{entry['wal_bytes'] / 1e6:.1f} MB")
+                    st.caption(f"auto_vacuum: {entry['auto_vacuum']}")
+                    if entry['tables']:
+                        st.dataframe(pd.DataFrame(entry['tables']), use_container_width=True)
+        except Exception as e:
+            st.error(f"Error reading storage report: {e}")
+
+    with tab2:
+        stats = scheduler.stats()
+        st.caption(f"Background thread {'running' if stats['running'] else 'stopped'} · "
+                   f"app idle for {stats['idle_seconds']}s · "
+                   f"tasks run after {scheduler.idle_seconds:g}s without requests")
+        st.dataframe(pd.DataFrame([
+            {'task': name, 'interval (s)': scheduler.intervals.get(name), 'runs': task['runs'],
+             'cancelled': task['cancelled'], 'failures': task['failures'],
+             'last run': task['last_run'], 'seconds': task['last_seconds'],
+             'due': name in stats['due']}
+            for name, task in stats['tasks'].items()
+        ]), use_container_width=True)
+
+        task = st.selectbox("Task", list(stats['tasks']))
+        if st.button("Run Now"):
+            try:
+                result = scheduler.run(task)
+                if result is None:
+                    st.warning("The database was busy; the task will run in the next idle window.")
+                else:
+                    st.success(f"{task} finished")
+                    st.json(result)
+            except Exception as e:
+                st.error(f"Error running {task}: {e}")
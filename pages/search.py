@@ -0,0 +1,78 @@
+"""
+Search Page - Find incidents, tickets and datasets from one search box
+"""
+import streamlit as st
+from services.database_manager import DatabaseManager, DatabaseBusyError
+from services.search_service import SearchService
+
+DOMAIN_LABELS = {
+    'incidents': "🛡️ Incident",
+    'tickets': "💻 Ticket",
+    'datasets': "📊 Dataset",
+}
+
+def show_search(db_manager: DatabaseManager):
+    """
+    Display unified search page
+
+    Args:
+        db_manager: DatabaseManager instance
+    """
+    st.title("🔎 Search")
+
+    search_service = SearchService(db_manager)
+
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        query = st.text_input("Search incidents, tickets and datasets",
+                              placeholder="e.g. phishing email")
+    with col2:
+        domains = st.multiselect(
+            "Domains",
+            list(DOMAIN_LABELS),
+            default=list(DOMAIN_LABELS),
+            format_func=lambda domain: DOMAIN_LABELS[domain]
+        )
+
+    # Start again from the first page whenever the search changes
+    search_key = (query, tuple(domains))
+    if st.session_state.get('search_key') != search_key:
+        st.session_state.search_key = search_key
+        st.session_state.search_offset = 0
+
+    if not query.strip() or not domains:
+        st.info("Type a word or two to search across all domains.")
+        return
+
+    try:
+        with db_manager.read_only():
+            results, next_offset = search_service.search(
+                query, domains, limit=20, offset=st.session_state.search_offset
+            )
+    except DatabaseBusyError:
+        st.warning("The database is busy right now. Please try again in a moment.")
+        return
+    except Exception as e:
+        st.error(f"Error searching: {e}")
+        return
+
+    if not results:
+        st.info("No matches found.")
+        return
+
+    for result in results:
+        st.markdown(f"**{DOMAIN_LABELS[result['domain']]} #{result['id']}** · "
+                    f"{result['label']}  \n{result['title']}")
+        if result['snippet']:
+            st.caption(result['snippet'])
+
+    # Pagination
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.session_state.search_offset > 0 and st.button("⬅️ Previous"):
+            st.session_state.search_offset = max(0, st.session_state.search_offset - 20)
+            st.rerun()
+    with col2:
+        if next_offset is not None and st.button("Next ➡️"):
+            st.session_state.search_offset = next_offset
+            st.rerun()
@@ -0,0 +1,144 @@
+"""
+Archive Service Class
+Moves long-closed incidents and tickets into archive.db and pages through them
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from services.database_manager import DatabaseManager
+from services.migrations import ARCHIVE_TABLES, CLOSED_STATUSES
+from services.summary_service import SummaryService
+
+class ArchiveService:
+    """Hot/cold archival of closed records"""
+    
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize ArchiveService with database manager
+        
+        Args:
+            db_manager: DatabaseManager instance for data access
+        """
+        self.db_manager = db_manager
+    
+    @staticmethod
+    def _check_table(table: str) -> None:
+        if table not in ARCHIVE_TABLES:
+            raise ValueError(f"Table is not archived: {table}")
+    
+    def archive(self, older_than_days: int = 90, batch_size: int = 500,
+                tables: Iterable[str] = None, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """
+        Move records closed for longer than older_than_days into archive.db
+        
+        Each batch is two short transactions, so the live pages are never
+        locked out for long. SQLite does not commit across attached WAL
+        databases atomically, so the copy into archive.db commits first and
+        only rows confirmed present there are then deleted from the hot
+        table. A batch interrupted in between leaves a copy in both files;
+        the next run updates the copy in place (an upsert rather than
+        INSERT OR REPLACE, whose implicit delete would skip archive.db's
+        count trigger) and finishes the move.
+        
+        Args:
+            older_than_days: Minimum days since closed_at
+            batch_size: Records moved per transaction
+            tables: Tables to archive (default: all archived tables)
+            max_batches: Stop after this many batches per table (default: until done)
+        
+        Returns:
+            Dict: Number of records moved per table
+        """
+        tables = list(tables) if tables else list(ARCHIVE_TABLES)
+        for table in tables:
+            self._check_table(table)
+        statuses = ', '.join(['?'] * len(CLOSED_STATUSES))
+        moved = {}
+        for table in tables:
+            names = sorted(self.db_manager.statements.columns(table))
+            columns = ', '.join(names)
+            updates = ', '.join(f"{name} = excluded.{name}" for name in names if name != 'id')
+            moved[table] = 0
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                with self.db_manager.transaction() as conn:
+                    ids = [row[0] for row in conn.execute(
+                        f"SELECT id FROM main.{table} WHERE status IN ({statuses}) "
+                        f"AND closed_at < datetime('now', ?) ORDER BY closed_at LIMIT ?",
+                        CLOSED_STATUSES + (f"-{int(older_than_days)} days", batch_size)
+                    ).fetchall()]
+                    if ids:
+                        marks = ', '.join(['?'] * len(ids))
+                        conn.execute(
+                            f"INSERT INTO archive.{table} ({columns}, archived_at) "
+                            f"SELECT {columns}, CURRENT_TIMESTAMP FROM main.{table} "
+                            f"WHERE id IN ({marks}) ON CONFLICT (id) DO UPDATE SET {updates}",
+                            ids
+                        )
+                if not ids:
+                    break
+                with self.db_manager.transaction() as conn:
+                    deleted = conn.execute(
+                        f"DELETE FROM main.{table} WHERE id IN ({marks}) "
+                        f"AND id IN (SELECT id FROM archive.{table} WHERE id IN ({marks}))",
+                        ids + ids
+                    ).rowcount
+                self.db_manager.invalidate(table)
+                moved[table] += deleted
+                batches += 1
+                if len(ids) < batch_size:
+                    break
+        return moved
+    
+    def browse(self, table: str, after_key: tuple = None,
+               limit: int = 50) -> Tuple[List[Dict[str, Any]], Optional[tuple]]:
+        """
+        Page through archived records, most recently closed first
+        
+        Args:
+            table: Archived table name
+            after_key: Key returned with the previous page (None for the first page)
+            limit: Records per page
+        
+        Returns:
+            Tuple: (rows, next_key) as returned by DatabaseManager.paginate
+        """
+        self._check_table(table)
+        cold_view = ARCHIVE_TABLES[table][1]
+        return self.db_manager.paginate(cold_view, order_by='closed_at', after_key=after_key,
+                                        limit=limit, descending=True)
+    
+    def view(self, table: str, include_archive: bool = True) -> str:
+        """
+        Name to read a table through
+        
+        Args:
+            table: Archived table name
+            include_archive: Read hot and cold rows together (False: only the hot table)
+        
+        Returns:
+            str: View or table name for FROM clauses
+        """
+        self._check_table(table)
+        return ARCHIVE_TABLES[table][0] if include_archive else table
+    
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get hot/cold sizes
+        
+        Read from the trigger-maintained domain_summary and archive_counts
+        tables rather than counting the tables themselves.
+        
+        Returns:
+            Dict: Per table, rows in the hot table, closed rows still hot and archived rows
+        """
+        summary_service = SummaryService(self.db_manager)
+        stats = {}
+        for table in ARCHIVE_TABLES:
+            archived = self.db_manager.fetch_one(
+                "SELECT count FROM archive_counts WHERE table_name = ?", (table,)
+            )
+            stats[table] = {
+                'hot': summary_service.total(table),
+                'closed_hot': summary_service.total(table, CLOSED_STATUSES),
+                'archived': archived['count'] if archived else 0,
+            }
+        return stats
@@ -0,0 +1,205 @@
+"""
+Backup Service Class
+Online backups of the live database in rotating, verified generations
+"""
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from services.database_manager import DatabaseManager
+from services.connection_pool import read_only_uri
+
+class BackupService:
+    """Step-wise copies made with the sqlite3 online backup API"""
+    
+    MANIFEST = "manifest.json"
+    
+    def __init__(self, db_manager: DatabaseManager, backup_dir: Optional[str] = None,
+                 generations: int = 7, pages_per_step: int = 256,
+                 step_sleep: float = 0.005):
+        """
+        Initialize BackupService with database manager
+        
+        Args:
+            db_manager: DatabaseManager instance whose files are backed up
+            backup_dir: Directory holding the generations (defaults to backups/
+                        next to the database)
+            generations: Number of verified backups to keep
+            pages_per_step: Pages copied per backup step
+            step_sleep: Seconds to pause between steps, easing the disk load on
+                        the live app
+        """
+        self.db_manager = db_manager
+        self.backup_dir = backup_dir or os.path.join(os.path.dirname(db_manager.db_path), "backups")
+        self.generations = generations
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep
+        self._lock = threading.Lock()
+        self._last: Optional[Dict[str, Any]] = None
+    
+    def _sources(self) -> Dict[str, str]:
+        """File name inside a generation -> schema on the backup connection"""
+        sources = {os.path.basename(self.db_manager.db_path): 'main'}
+        if os.path.exists(self.db_manager.archive_path):
+            sources[os.path.basename(self.db_manager.archive_path)] = 'archive'
+        return sources
+    
+    @contextmanager
+    def _snapshot(self, schemas: List[str]):
+        """
+        Read-only connection holding one read transaction over every schema
+        
+        The copies are taken from this single point in time. main's snapshot
+        is pinned before archive.db's; ArchiveService commits its copy into
+        archive.db before deleting from main, so a concurrent archive run can
+        at worst leave records in both files (which the next run repairs),
+        never in neither. In WAL mode writers keep going meanwhile.
+        """
+        # Read-only source: the backup never takes a write lock on the live files
+        conn = sqlite3.connect(read_only_uri(self.db_manager.db_path), uri=True,
+                               isolation_level=None, check_same_thread=False)
+        try:
+            if 'archive' in schemas:
+                conn.execute("ATTACH DATABASE ? AS archive",
+                             (read_only_uri(self.db_manager.archive_path),))
+            conn.execute("BEGIN")
+            for schema in schemas:
+                conn.execute(f"SELECT COUNT(*) FROM {schema}.sqlite_master").fetchone()
+            yield conn
+        finally:
+            conn.close()
+    
+    def _copy(self, source: sqlite3.Connection, schema: str, target_path: str) -> Dict[str, Any]:
+        """
+        Copy one schema of the snapshot connection page range by page range
+        
+        The source's read transaction stays open across steps, so writes from
+        other connections neither restart the copy nor end up in it.
+        """
+        partial = target_path + ".partial"
+        if os.path.exists(partial):
+            os.remove(partial)
+        progress = {'steps': 0, 'pages': 0}
+        
+        def on_step(status, remaining, total):
+            progress.update(steps=progress['steps'] + 1, pages=total)
+            if remaining and self.step_sleep:
+                time.sleep(self.step_sleep)
+        
+        target = sqlite3.connect(partial)
+        try:
+            source.backup(target, pages=self.pages_per_step, progress=on_step, name=schema)
+            # A self-contained file: the copy inherits WAL mode from the source
+            target.execute("PRAGMA journal_mode = DELETE")
+            result = target.execute("PRAGMA integrity_check").fetchall()
+        finally:
+            target.close()
+        
+        integrity = [row[0] for row in result]
+        if integrity != ['ok']:
+            os.remove(partial)
+            raise sqlite3.DatabaseError(
+                f"Backup of {schema} failed integrity_check: {'; '.join(integrity[:5])}"
+            )
+        os.replace(partial, target_path)
+        return {
+            'pages': progress['pages'],
+            'steps': progress['steps'],
+            'bytes': os.path.getsize(target_path),
+        }
+    
+    def backup(self) -> Dict[str, Any]:
+        """
+        Take a new backup generation and drop the oldest beyond the limit
+        
+        platform.db and archive.db are copied from one read transaction, so
+        the generation is a single point in time. Each file is copied into a
+        .partial file, checked with
+        PRAGMA integrity_check and only then renamed into place; a
+        generation that fails verification is removed and never rotates a
+        good one out.
+        
+        Returns:
+            Dict: Metrics of the backup (generation path, per-file pages,
+                  steps and bytes, total bytes, duration and throughput in MB/s)
+        """
+        with self._lock:
+            os.makedirs(self.backup_dir, exist_ok=True)
+            name = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+            path = os.path.join(self.backup_dir, name)
+            os.makedirs(path)
+            
+            started = time.perf_counter()
+            files = {}
+            sources = self._sources()
+            try:
+                with self._snapshot(list(sources.values())) as source:
+                    for filename, schema in sources.items():
+                        files[filename] = self._copy(source, schema, os.path.join(path, filename))
+            except Exception:
+                shutil.rmtree(path, ignore_errors=True)
+                raise
+            duration = time.perf_counter() - started
+            
+            total_bytes = sum(stats['bytes'] for stats in files.values())
+            metrics = {
+                'generation': name,
+                'path': path,
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'files': files,
+                'bytes': total_bytes,
+                'duration_seconds': round(duration, 4),
+                'mb_per_second': round(total_bytes / 1e6 / duration, 2) if duration else None,
+                'verified': True,
+            }
+            with open(os.path.join(path, self.MANIFEST), 'w') as f:
+                json.dump(metrics, f, indent=2)
+            
+            self._rotate()
+            self._last = metrics
+            return metrics
+    
+    def _rotate(self) -> None:
+        for old in self.list_backups()[self.generations:]:
+            shutil.rmtree(old['path'], ignore_errors=True)
+    
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """
+        Get the verified generations on disk
+        
+        Returns:
+            List[Dict]: Manifest of each generation, newest first
+        """
+        if not os.path.isdir(self.backup_dir):
+            return []
+        backups = []
+        for name in sorted(os.listdir(self.backup_dir), reverse=True):
+            manifest = os.path.join(self.backup_dir, name, self.MANIFEST)
+            # Generations without a manifest never finished
+            if not os.path.isfile(manifest):
+                continue
+            with open(manifest) as f:
+                metrics = json.load(f)
+            metrics['path'] = os.path.join(self.backup_dir, name)
+            backups.append(metrics)
+        return backups
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get backup statistics
+        
+        Returns:
+            Dict: Number and total size of kept generations and the metrics
+                  of the latest one (None before the first backup)
+        """
+        backups = self.list_backups()
+        return {
+            'generations': len(backups),
+            'bytes': sum(backup['bytes'] for backup in backups),
+            'latest': self._last or (backups[0] if backups else None),
+        }
@@ -0,0 +1,111 @@
+"""
+Change Detector Service Class
+Notices writes made by other processes so process-local caches stay correct
+"""
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Set
+
+class ChangeDetector:
+    """Polls PRAGMA data_version and per-table change counters"""
+    
+    def __init__(self, db_path: str, on_change: Callable[[Iterable[str]], None],
+                 poll_interval: float = 0.25, derived_tables: Iterable[str] = ()):
+        """
+        Initialize ChangeDetector
+        
+        Args:
+            db_path: Path to SQLite database file
+            on_change: Called with the names of tables changed by other connections
+            poll_interval: Minimum seconds between two checks of the database
+            derived_tables: Tables without change counters (summaries, rollups,
+                            search indexes) reported as changed on every commit
+                            made elsewhere, since they can be rebuilt directly
+        """
+        self.db_path = db_path
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.derived_tables = frozenset(derived_tables)
+        
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._counters: Dict[str, int] = {}
+        self._last_poll = 0.0
+        self._stats = {'polls': 0, 'changes_seen': 0, 'tables_invalidated': 0}
+    
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                         isolation_level=None)
+        return self._conn
+    
+    def _read_counters(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        try:
+            rows = conn.execute("SELECT table_name, version FROM table_change_counters").fetchall()
+        except sqlite3.OperationalError:
+            return {}  # schema not migrated yet
+        return {name: version for name, version in rows}
+    
+    def poll(self, force: bool = False) -> Set[str]:
+        """
+        Check for commits made through other connections
+        
+        PRAGMA data_version only changes when another connection commits, so
+        an idle database costs one pragma per poll_interval. When it moves,
+        the trigger-maintained counters say exactly which tables changed.
+        The derived tables have no counters, so any such commit reports them.
+        
+        Args:
+            force: Ignore poll_interval and check now
+        
+        Returns:
+            Set[str]: Tables changed since the previous poll
+        """
+        now = time.monotonic()
+        if not force and now - self._last_poll < self.poll_interval:
+            return set()
+        
+        with self._lock:
+            self._last_poll = now
+            self._stats['polls'] += 1
+            conn = self._connection()
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version == self._data_version:
+                return set()
+            
+            counters = self._read_counters(conn)
+            first_poll = self._data_version is None
+            changed = {name for name, version in counters.items()
+                       if self._counters.get(name) != version}
+            changed |= self.derived_tables
+            self._data_version = data_version
+            self._counters = counters
+            if first_poll:
+                return set()
+            self._stats['changes_seen'] += 1
+            self._stats['tables_invalidated'] += len(changed)
+        
+        if changed:
+            self.on_change(changed)
+        return changed
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get detector statistics
+        
+        Returns:
+            Dict: Poll count, changes observed and tables invalidated
+        """
+        with self._lock:
+            return dict(self._stats)
+    
+    def close(self) -> None:
+        """Close the detector's private connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._data_version = None
+            self._counters = {}
\ No newline at end of file
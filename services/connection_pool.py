@@ -0,0 +1,285 @@
+"""
+Connection Pool Service Class
+Hands each thread its own SQLite connection from a bounded pool
+so concurrent Streamlit sessions never share a cursor or transaction
+"""
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Set
+from urllib.parse import quote
+
+class PoolTimeoutError(sqlite3.OperationalError):
+    """Raised when no pooled connection becomes available in time"""
+
+def read_only_uri(db_path: str) -> str:
+    """SQLite URI that opens db_path read-only"""
+    return f"file:{quote(os.path.abspath(db_path))}?mode=ro"
+
+class _Lease:
+    """Book-keeping for a connection checked out by one thread"""
+    
+    __slots__ = ('connection', 'thread', 'depth', 'checked_out_at')
+    
+    def __init__(self, connection: sqlite3.Connection, thread: threading.Thread):
+        self.connection = connection
+        self.thread = thread
+        self.depth = 0
+        self.checked_out_at = time.monotonic()
+
+class ConnectionPool:
+    """Bounded pool of SQLite connections with thread-local checkout"""
+    
+    _RECLAIM_POLL_SECONDS = 0.05
+    
+    def __init__(self, db_path: str, max_size: int = 8,
+                 max_idle_seconds: float = 300.0,
+                 health_check_interval: float = 30.0,
+                 timeout: float = 10.0,
+                 on_connect: Optional[Callable[[sqlite3.Connection], None]] = None,
+                 cached_statements: int = 128,
+                 read_only: bool = False):
+        """
+        Initialize ConnectionPool
+        
+        Args:
+            db_path: Path to SQLite database file
+            max_size: Maximum number of open connections
+            max_idle_seconds: Idle connections older than this are closed
+            health_check_interval: Idle time after which a connection is pinged before reuse
+            timeout: Seconds to wait for a free connection before giving up
+            on_connect: Optional hook run on every newly opened connection
+            cached_statements: Size of sqlite3's prepared-statement cache per connection
+            read_only: Open connections with mode=ro and PRAGMA query_only, so they
+                       can never take a write lock
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.db_path = db_path
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+        self.on_connect = on_connect
+        self.cached_statements = cached_statements
+        self.read_only = read_only
+        
+        self._lock = threading.Condition()
+        self._local = threading.local()
+        self._idle: List[tuple] = []  # (connection, released_at)
+        self._leases: Set[_Lease] = set()
+        self._opening = 0  # slots reserved by threads opening a connection
+        self._stats = {
+            'created': 0,
+            'reused': 0,
+            'evicted_idle': 0,
+            'health_check_failures': 0,
+            'reclaimed': 0,
+            'waits': 0,
+            'timeouts': 0,
+        }
+    
+    # ------------------------------------------------------------------
+    # Connection lifecycle
+    # ------------------------------------------------------------------
+    def _open(self) -> sqlite3.Connection:
+        """Open a new connection and apply the connect hook (called without the lock)"""
+        if self.read_only:
+            conn = sqlite3.connect(read_only_uri(self.db_path), uri=True,
+                                   check_same_thread=False,
+                                   cached_statements=self.cached_statements)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=self.cached_statements)
+        conn.row_factory = sqlite3.Row
+        try:
+            if self.on_connect:
+                self.on_connect(conn)
+            if self.read_only:
+                # After the hook, which may still need to create TEMP views
+                conn.execute("PRAGMA query_only = ON")
+        except BaseException:
+            self._discard(conn)
+            raise
+        return conn
+    
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        """Ping a connection to check it is still usable"""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+    
+    @staticmethod
+    def _discard(conn: sqlite3.Connection) -> None:
+        """Close a connection, ignoring errors"""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    
+    def _evict_idle(self, now: float) -> None:
+        """Close idle connections that exceeded max_idle_seconds"""
+        keep = []
+        for conn, released_at in self._idle:
+            if now - released_at > self.max_idle_seconds:
+                self._discard(conn)
+                self._stats['evicted_idle'] += 1
+            else:
+                keep.append((conn, released_at))
+        self._idle = keep
+    
+    def _reclaim_dead_leases(self) -> None:
+        """Return connections held by threads that have exited"""
+        for lease in list(self._leases):
+            if not lease.thread.is_alive():
+                self._leases.discard(lease)
+                if lease.connection.in_transaction:
+                    lease.connection.rollback()
+                self._idle.append((lease.connection, time.monotonic()))
+                self._stats['reclaimed'] += 1
+    
+    def _open_count(self) -> int:
+        return len(self._idle) + len(self._leases) + self._opening
+    
+    def _checkout(self) -> Optional[sqlite3.Connection]:
+        """
+        Take an idle connection, or reserve a slot for a new one (lock must be held)
+        
+        Returns None when a slot was reserved: the caller opens the connection
+        after releasing the lock, so a slow connect hook (PRAGMAs, ATTACH)
+        never blocks other threads' acquire/release.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            now = time.monotonic()
+            self._evict_idle(now)
+            
+            while self._idle:
+                conn, released_at = self._idle.pop()
+                if now - released_at > self.health_check_interval and not self._is_healthy(conn):
+                    self._discard(conn)
+                    self._stats['health_check_failures'] += 1
+                    continue
+                self._stats['reused'] += 1
+                return conn
+            
+            if self._open_count() < self.max_size:
+                self._opening += 1
+                return None
+            
+            self._reclaim_dead_leases()
+            if self._idle:
+                continue
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._stats['timeouts'] += 1
+                raise PoolTimeoutError(
+                    f"No database connection available after {self.timeout}s "
+                    f"(pool size {self.max_size})"
+                )
+            self._stats['waits'] += 1
+            # Wake periodically: leases held by exited threads never notify
+            self._lock.wait(min(remaining, self._RECLAIM_POLL_SECONDS))
+    
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Check out the calling thread's connection
+        
+        Re-entrant: a thread that already holds a connection gets the same one back.
+        
+        Returns:
+            sqlite3.Connection: Connection leased to the current thread
+        """
+        lease = getattr(self._local, 'lease', None)
+        if lease is None:
+            with self._lock:
+                conn = self._checkout()
+            opened = conn is None
+            if opened:
+                try:
+                    conn = self._open()
+                except BaseException:
+                    with self._lock:
+                        self._opening -= 1
+                        self._lock.notify()
+                    raise
+            with self._lock:
+                if opened:
+                    self._opening -= 1
+                    self._stats['created'] += 1
+                lease = _Lease(conn, threading.current_thread())
+                self._leases.add(lease)
+            self._local.lease = lease
+        lease.depth += 1
+        return lease.connection
+    
+    def release(self, force: bool = False) -> None:
+        """
+        Release the calling thread's connection back to the pool
+        
+        Args:
+            force: Return the connection even if nested acquires are outstanding
+        """
+        lease = getattr(self._local, 'lease', None)
+        if lease is None:
+            return
+        lease.depth = 0 if force else lease.depth - 1
+        if lease.depth > 0:
+            return
+        self._local.lease = None
+        with self._lock:
+            self._leases.discard(lease)
+            if lease.connection.in_transaction:
+                lease.connection.rollback()
+            self._idle.append((lease.connection, time.monotonic()))
+            self._lock.notify()
+    
+    def current(self) -> Optional[sqlite3.Connection]:
+        """Return the connection leased to the calling thread, if any"""
+        lease = getattr(self._local, 'lease', None)
+        return lease.connection if lease else None
+    
+    @contextmanager
+    def connection(self):
+        """Context manager that leases a connection for the enclosed block"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release()
+    
+    def close_all(self) -> None:
+        """Close every pooled connection, idle or leased"""
+        with self._lock:
+            for conn, _ in self._idle:
+                self._discard(conn)
+            for lease in self._leases:
+                self._discard(lease.connection)
+            self._idle = []
+            self._leases = set()
+            self._lock.notify_all()
+        self._local = threading.local()
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get pool statistics
+        
+        Returns:
+            Dict: Counters plus current in-use and idle connection counts
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_use'] = len(self._leases)
+            stats['idle'] = len(self._idle)
+            stats['max_size'] = self.max_size
+            stats['read_only'] = self.read_only
+        return stats
@@ -3,149 +3,1004 @@ Database Manager Service Class
 Handles all database operations following Single Responsibility Principle
 Refactored from procedural db.py to OOP
 """
+import calendar
 import sqlite3
 import os
-from typing import Optional, List, Dict, Any
+import re
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple
+from services.connection_pool import ConnectionPool, read_only_uri
+from services.pragma_profile import PragmaProfile
+from services.schema_migrator import SchemaMigrator
+from services.query_cache import QueryCache, tables_read_by, table_written_by
+from services.change_detector import ChangeDetector
+from services.statement_registry import StatementRegistry
+from services.write_queue import WriteQueue
+from services.retry_policy import RetryPolicy, DatabaseBusyError
+from services.snapshot_replica import SnapshotReplica
+from services.row_types import ROW_TYPES, row_builder
+from services.migrations import (MIGRATIONS, DERIVED_TABLES, ARCHIVE_TABLES, CLOSED_STATUSES,
+                                 ROLLUP_DATE_COLUMNS, EPOCH_COLUMNS)
+
+# Low-cardinality columns that fetch_frame/fetch_arrow store as categoricals
+CATEGORICAL_COLUMNS = ('status', 'severity', 'priority', 'category')
+
+# EXPLAIN QUERY PLAN step walking a whole table, in rowid or index order
+# (not a virtual table's own index or an already materialized subquery)
+_FULL_SCAN = re.compile(r'SCAN (TABLE )?\w+( USING (COVERING )?INDEX \w+)?')
+_LIMIT = re.compile(r'\bLIMIT\b', re.IGNORECASE)
 
 class DatabaseManager:
     """Manages database connections and operations for the multi-domain platform"""
     
-    def __init__(self, db_path: str = "database/platform.db"):
+    def __init__(self, db_path: str = "database/platform.db", pool_size: int = 8,
+                 max_idle_seconds: float = 300.0,
+                 profile: Optional[PragmaProfile] = None,
+                 query_cache: Optional[QueryCache] = None, cache_results: bool = True,
+                 detect_external_changes: bool = True, statement_cache_size: int = 256,
+                 write_behind: bool = False, retry_policy: Optional[RetryPolicy] = None,
+                 snapshot_interval: Optional[float] = None,
+                 archive_path: Optional[str] = None):
         """
         Initialize DatabaseManager with database path
         
         Args:
             db_path: Path to SQLite database file
+            pool_size: Maximum number of pooled connections
+            max_idle_seconds: Idle pooled connections older than this are closed
+            profile: PRAGMA performance profile applied to every new connection
+                     (defaults to WAL journaling with NORMAL sync)
+            query_cache: Cache for fetch_one/fetch_all results (a default one is created)
+            cache_results: Set False to disable result caching entirely
+            detect_external_changes: Poll for commits by other processes and drop
+                                     the cached results they affect
+            statement_cache_size: Prepared statements sqlite3 keeps per connection
+            write_behind: Route writes through a single writer thread with group commit
+            retry_policy: Backoff used when the database is locked (a default one is created)
+            snapshot_interval: Serve read_only() blocks from a backup copy refreshed in
+                               the background this often (None reads the live
+                               file read-only)
+            archive_path: Cold-storage database attached as "archive" on every
+                          connection (defaults to archive.db next to db_path)
         """
         self.db_path = db_path
-        self.connection: Optional[sqlite3.Connection] = None
+        self.archive_path = archive_path or os.path.join(os.path.dirname(db_path), "archive.db")
+        self.profile = profile or PragmaProfile()
+        self.retry_policy = retry_policy or RetryPolicy()
         self._ensure_data_dir()
-        self._create_tables()
+        self._pool = ConnectionPool(db_path, max_size=pool_size,
+                                    max_idle_seconds=max_idle_seconds,
+                                    on_connect=self._prepare_connection,
+                                    cached_statements=statement_cache_size)
+        self._tx = threading.local()
+        self._ro = threading.local()
+        self._last_activity = time.monotonic()
+        self.query_cache = (query_cache or QueryCache()) if cache_results else None
+        if self.query_cache is not None:
+            for derived, sources in DERIVED_TABLES.items():
+                self.query_cache.add_dependency(derived, *sources)
+        self.migrator = SchemaMigrator(MIGRATIONS)
+        self.statements = StatementRegistry()
+        self.statements.set_loader(self.connect)
+        self._apply_migrations()
+        self._snapshot: Optional[SnapshotReplica] = None
+        if snapshot_interval is not None:
+            self._snapshot = SnapshotReplica(db_path, refresh_interval=snapshot_interval)
+        self._readers = ConnectionPool(
+            self._snapshot.snapshot_path if self._snapshot else db_path,
+            max_size=pool_size, max_idle_seconds=max_idle_seconds,
+            on_connect=self._prepare_reader,
+            cached_statements=statement_cache_size, read_only=True
+        )
+        self._change_detector = None
+        if self.query_cache is not None and detect_external_changes:
+            self._change_detector = ChangeDetector(db_path, on_change=self.invalidate_changed,
+                                                   derived_tables=DERIVED_TABLES)
+            self._change_detector.poll(force=True)  # baseline before anything is cached
+        self._write_queue: Optional[WriteQueue] = None
+        if write_behind:
+            self.enable_write_behind()
     
     def _ensure_data_dir(self) -> None:
         """Ensure database directory exists"""
         data_dir = os.path.dirname(self.db_path)
         os.makedirs(data_dir, exist_ok=True)
     
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """Connection held by the calling thread, or None if it has none"""
+        return self._pool.current()
+    
     def connect(self) -> sqlite3.Connection:
         """
-        Establish database connection
+        Get the calling thread's database connection
+        
+        Each thread checks out its own connection from the pool and keeps it
+        until release_connection() is called or the thread exits.
         
         Returns:
             sqlite3.Connection: Database connection object
         """
-        if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.connection.row_factory = sqlite3.Row
-        return self.connection
+        self._last_activity = time.monotonic()
+        conn = self._pool.current()
+        if conn is None:
+            conn = self._pool.acquire()
+        return conn
+    
+    def release_connection(self) -> None:
+        """Return the calling thread's connections to their pools"""
+        self._pool.release(force=True)
+        self._readers.release(force=True)
+    
+    @contextmanager
+    def read_only(self):
+        """
+        Route the reads in a block to a read-only connection
+        
+        Dashboards and analytics wrap their queries in this block so they run
+        on a separate mode=ro / query_only pool (or on the snapshot copy when
+        snapshot_interval is set). Those connections can never take the write
+        lock, so long aggregations do not hold up the forms. Writes made via
+        insert/update/delete and reads inside transaction() still use the
+        thread's read-write connection.
+        
+        Usage:
+            with db_manager.read_only():
+                counts = db_manager.count_by('it_tickets', 'status')
+        
+        Yields:
+            DatabaseManager: This manager
+        """
+        depth = getattr(self._ro, 'depth', 0)
+        self._ro.depth = depth + 1
+        try:
+            yield self
+        finally:
+            self._ro.depth = depth
     
-    def _create_tables(self) -> None:
-        """Create database tables if they don't exist"""
+    def _uses_replica(self) -> bool:
+        """Reads go to the read-only pool inside read_only() but outside transactions"""
+        return getattr(self._ro, 'depth', 0) > 0 and not self.in_transaction()
+    
+    def _read_connection(self) -> sqlite3.Connection:
+        """Connection for a read: the read-only pool's or the thread's own"""
+        if not self._uses_replica():
+            return self.connect()
+        self._last_activity = time.monotonic()
+        conn = self._readers.current()
+        if conn is None:
+            conn = self._readers.acquire()
+        return conn
+    
+    @property
+    def last_activity(self) -> float:
+        """time.monotonic() of the last request for a connection"""
+        return self._last_activity
+    
+    def idle_seconds(self) -> float:
+        """Seconds since any thread last asked for a connection"""
+        return time.monotonic() - self._last_activity
+    
+    def refresh_snapshot(self) -> bool:
+        """
+        Bring the snapshot copy up to date now
+        
+        Returns:
+            bool: True if a new copy was taken (False when snapshots are off)
+        """
+        return self._snapshot.refresh() if self._snapshot is not None else False
+    
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Get connection pool statistics
+        
+        Returns:
+            Dict: Pool counters (created, reused, evicted, in use, idle...)
+        """
+        return self._pool.stats()
+    
+    def diagnostics(self) -> Dict[str, Any]:
+        """
+        Report the configured and effective connection settings
+        
+        Returns:
+            Dict: SQLite version, configured profile, live PRAGMA values and pool stats
+        """
+        return {
+            'sqlite_version': sqlite3.sqlite_version,
+            'db_path': self.db_path,
+            'profile': self.profile.to_dict(),
+            'pragmas': PragmaProfile.read(self.connect()),
+            'pool': self.pool_stats(),
+            'query_cache': self.cache_stats(),
+            'statements': self.statement_stats(),
+            'locks': self.lock_stats(),
+            'readers': self._readers.stats(),
+            'snapshot': self._snapshot.stats() if self._snapshot is not None else {},
+        }
+    
+    def _apply_migrations(self) -> None:
+        """
+        Bring the schema up to date (two header PRAGMA reads when already current)
+        
+        archive.db's user_version records the schema version its tables
+        mirror, so the archive DDL check and the statement registry's schema
+        scan only run after a migration or on a new archive.db. Otherwise the
+        registry loads the schema on first use.
+        """
         conn = self.connect()
-        cursor = conn.cursor()
+        applied = self.migrator.migrate(conn)
+        latest = self.migrator.latest_version
+        archived_version = conn.execute("PRAGMA archive.user_version").fetchone()[0]
+        if applied or archived_version < latest:
+            self._ensure_archive_schema(conn)
+            conn.execute(f"PRAGMA archive.user_version = {int(latest)}")
+            self.statements.refresh(conn)
+        self._pool.release(force=True)
+    
+    # ------------------------------------------------------------------
+    # Archive attachment
+    # ------------------------------------------------------------------
+    def _prepare_connection(self, conn: sqlite3.Connection) -> None:
+        """Connect hook for read-write connections: PRAGMAs, archive.db and its views"""
+        self.profile.apply(conn)
+        conn.execute("ATTACH DATABASE ? AS archive", (self.archive_path,))
+        conn.execute(f"PRAGMA archive.auto_vacuum = {self.profile.auto_vacuum}")
+        conn.execute(f"PRAGMA archive.journal_mode = {self.profile.journal_mode}")
+        conn.execute(f"PRAGMA archive.synchronous = {self.profile.synchronous}")
+        self._create_archive_views(conn)
+    
+    def _prepare_reader(self, conn: sqlite3.Connection) -> None:
+        """Connect hook for read-only connections"""
+        self.profile.apply_read_only(conn)
+        conn.execute("ATTACH DATABASE ? AS archive", (read_only_uri(self.archive_path),))
+        self._create_archive_views(conn)
+    
+    @staticmethod
+    def _table_columns(conn: sqlite3.Connection, schema: str, table: str) -> List[str]:
+        return [row[1] for row in conn.execute(f'PRAGMA {schema}.table_info("{table}")')]
+    
+    def _ensure_archive_schema(self, conn: sqlite3.Connection) -> None:
+        """
+        Create or extend the archive.db copies of the archived tables
         
-        # Users table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                role TEXT DEFAULT 'user',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Cyber incidents table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS cyber_incidents (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                severity TEXT NOT NULL,
-                status TEXT DEFAULT 'Open',
-                description TEXT,
-                reported_by TEXT,
-                date TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Datasets metadata table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS datasets_metadata (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                source TEXT,
-                category TEXT,
-                size INTEGER,
-                description TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # IT tickets table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS it_tickets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                priority TEXT NOT NULL,
-                status TEXT DEFAULT 'Open',
-                assigned_to TEXT,
-                description TEXT,
-                created_date TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        Each cold table mirrors its hot table's definition plus archived_at;
+        columns added to the hot table by later migrations are added here too.
+        archive_counts keeps each cold table's row count up to date by
+        trigger, so archive stats never count a whole table.
+        """
+        conn.execute("CREATE TABLE IF NOT EXISTS archive.archive_counts ("
+                     "table_name TEXT PRIMARY KEY, count INTEGER NOT NULL) WITHOUT ROWID")
+        for table in ARCHIVE_TABLES:
+            ddl = conn.execute(
+                "SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+            if ddl is None:
+                continue
+            archived = self._table_columns(conn, 'archive', table)
+            if not archived:
+                conn.execute(re.sub(r'^CREATE TABLE\s+(?:IF NOT EXISTS\s+)?["`\[]?\w+["`\]]?',
+                                    f'CREATE TABLE IF NOT EXISTS archive.{table}', ddl[0]))
+                conn.execute(f"ALTER TABLE archive.{table} ADD COLUMN archived_at TIMESTAMP")
+            else:
+                for _, column, column_type, *_ in conn.execute(f'PRAGMA main.table_info("{table}")'):
+                    if column not in archived:
+                        conn.execute(f"ALTER TABLE archive.{table} ADD COLUMN {column} {column_type}")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS archive.idx_{table}_closed_at "
+                         f"ON {table} (closed_at)")
+            date_column = ROLLUP_DATE_COLUMNS.get(table)
+            if date_column:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS archive.idx_{table}_day "
+                             f"ON {table} (date({date_column}))")
+            for event, delta in (('insert', '+ 1'), ('delete', '- 1')):
+                conn.execute(f"CREATE TRIGGER IF NOT EXISTS archive.trg_{table}_{event}_count "
+                             f"AFTER {event.upper()} ON {table} BEGIN "
+                             f"UPDATE archive_counts SET count = count {delta} "
+                             f"WHERE table_name = '{table}'; END")
+            conn.execute(f"INSERT OR IGNORE INTO archive.archive_counts (table_name, count) "
+                         f"SELECT '{table}', COUNT(*) FROM archive.{table}")
+        if conn.in_transaction:
+            conn.commit()
+        self._create_archive_views(conn)
+    
+    def _create_archive_views(self, conn: sqlite3.Connection) -> None:
+        """(Re)create the per-connection TEMP views over hot and cold rows"""
+        for table, (all_view, cold_view) in ARCHIVE_TABLES.items():
+            columns = self._table_columns(conn, 'main', table)
+            archived = set(self._table_columns(conn, 'archive', table))
+            if not columns or not archived:
+                continue  # before migrations / archive schema exist
+            cold = ', '.join(column if column in archived else f"NULL AS {column}"
+                             for column in columns)
+            conn.execute(f"DROP VIEW IF EXISTS temp.{all_view}")
+            conn.execute(f"DROP VIEW IF EXISTS temp.{cold_view}")
+            conn.execute(
+                f"CREATE TEMP VIEW {all_view} AS "
+                f"SELECT {', '.join(columns)}, NULL AS archived_at FROM main.{table} "
+                f"UNION ALL SELECT {cold}, archived_at FROM archive.{table}"
             )
-        """)
+            conn.execute(f"CREATE TEMP VIEW {cold_view} AS "
+                         f"SELECT {cold}, archived_at FROM archive.{table}")
+    
+    def schema_version(self) -> int:
+        """
+        Get the schema version stored in the database
+        
+        Returns:
+            int: Current PRAGMA user_version
+        """
+        return SchemaMigrator.current_version(self.connect())
+    
+    def explain(self, sql: str, params: tuple = None) -> List[str]:
+        """
+        Get SQLite's query plan for a statement
+        
+        Args:
+            sql: SQL query string
+            params: Query parameters
+        
+        Returns:
+            List[str]: EXPLAIN QUERY PLAN detail lines
+        """
+        cursor = self.execute_query(f"EXPLAIN QUERY PLAN {sql}", params)
+        return [row['detail'] for row in cursor.fetchall()]
+    
+    def verify_query_plans(self, queries: Iterable[Tuple[str, tuple]]) -> Dict[str, List[str]]:
+        """
+        Check that queries are answered from an index, not a full table scan
+        
+        A plan step counts as a problem if it scans a whole table or sorts
+        through a temporary B-tree. Walking a table in index order is only
+        accepted when the query has a LIMIT; range filters on an index show
+        up as SEARCH steps and pass.
+        
+        Args:
+            queries: (SQL, parameters) pairs to check
+        
+        Returns:
+            Dict[str, List[str]]: Offending plan lines per query; empty when all pass
+        """
+        problems = {}
+        for sql, params in queries:
+            bounded = _LIMIT.search(sql) is not None
+            bad = [detail for detail in self.explain(sql, params)
+                   if (_FULL_SCAN.fullmatch(detail)
+                       and not (bounded and ' INDEX ' in detail))
+                   or 'TEMP B-TREE' in detail]
+            if bad:
+                problems[sql] = bad
+        return problems
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into one atomic unit of work
+        
+        The outermost block opens a BEGIN IMMEDIATE transaction and commits once
+        on exit; nested blocks become savepoints that roll back on their own.
+        Any exception rolls back the enclosing scope and is re-raised.
+        
+        Usage:
+            with db_manager.transaction():
+                db_manager.update('it_tickets', ticket_id, {'status': 'In Progress'})
+                db_manager.update('it_tickets', ticket_id, {'assigned_to': 'Alice'})
+        
+        Yields:
+            sqlite3.Connection: The calling thread's connection
+        """
+        conn = self.connect()
+        depth = getattr(self._tx, 'depth', 0)
+        savepoint = f"sp_{depth}"
+        
+        if depth == 0:
+            self._tx.written = set()
+            if not conn.in_transaction:
+                self.retry_policy.run(lambda: conn.execute("BEGIN IMMEDIATE"))
+        else:
+            conn.execute(f"SAVEPOINT {savepoint}")
+        self._tx.depth = depth + 1
+        
+        try:
+            try:
+                yield conn
+            except BaseException:
+                self._tx.depth = depth
+                if depth == 0:
+                    conn.rollback()
+                else:
+                    conn.execute(f"ROLLBACK TO {savepoint}")
+                    conn.execute(f"RELEASE {savepoint}")
+                raise
+            
+            self._tx.depth = depth
+            if depth == 0:
+                try:
+                    conn.commit()
+                except sqlite3.Error:
+                    conn.rollback()
+                    raise
+            else:
+                conn.execute(f"RELEASE {savepoint}")
+        finally:
+            if depth == 0:
+                # Invalidate once the outcome is visible to other connections
+                self.invalidate(*self._tx.written)
+                self._tx.written = set()
+    
+    def run_transaction(self, operation: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a whole unit of work, retrying it from the start if the database is locked
+        
+        Usage:
+            db_manager.run_transaction(lambda: (
+                db_manager.update('it_tickets', ticket_id, {'status': 'Closed'}),
+                db_manager.insert('it_tickets', follow_up)
+            ))
+        
+        Args:
+            operation: Callable issuing the writes; must be safe to repeat
+            args: Positional arguments for operation
+            kwargs: Keyword arguments for operation
+        
+        Returns:
+            Any: The operation's return value
+        """
+        def attempt():
+            with self.transaction():
+                return operation(*args, **kwargs)
         
-        conn.commit()
+        if self.in_transaction():
+            return attempt()  # an enclosing transaction owns the retry
+        return self.retry_policy.run(attempt)
+    
+    def lock_stats(self) -> Dict[str, float]:
+        """
+        Get lock-contention telemetry
+        
+        Returns:
+            Dict: Lock errors seen, retries, recoveries, final failures and seconds waited
+        """
+        return self.retry_policy.stats()
+    
+    def in_transaction(self) -> bool:
+        """Check whether the calling thread is inside a transaction() block"""
+        return getattr(self._tx, 'depth', 0) > 0
     
     def execute_query(self, sql: str, params: tuple = None) -> sqlite3.Cursor:
         """
         Execute a SQL query
         
+        An INSERT/UPDATE/DELETE issued outside transaction() runs as its own
+        transaction and is committed before this returns.
+        
         Args:
             sql: SQL query string
             params: Query parameters
-            
+        
         Returns:
             sqlite3.Cursor: Database cursor
         """
-        conn = self.connect()
+        return self._execute(sql, params)
+    
+    def _execute(self, sql: str, params: tuple = None, plain: bool = False) -> sqlite3.Cursor:
+        """execute_query, optionally on a cursor returning plain tuples instead of sqlite3.Row"""
+        written = table_written_by(sql)
+        if written and not self.in_transaction():
+            # Commit first and invalidate after, as transaction() does; bumping
+            # before an implicit commit lets a reader cache the old rows under
+            # the new version
+            with self.transaction():
+                return self._execute(sql, params, plain)
+        conn = self._read_connection()
         cursor = conn.cursor()
-        if params:
-            cursor.execute(sql, params)
+        if plain:
+            cursor.row_factory = None
+        if self._is_read(sql) and not self.in_transaction():
+            # Reads are idempotent, so a locked database is retried with backoff
+            self.retry_policy.run(lambda: cursor.execute(sql, params or ()))
         else:
-            cursor.execute(sql)
+            cursor.execute(sql, params or ())
+        if written and self.query_cache is not None:
+            self._mark_written(written)
         return cursor
     
-    def fetch_one(self, sql: str, params: tuple = None) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _is_read(sql: str) -> bool:
+        return sql.lstrip()[:6].upper().startswith(('SELECT', 'WITH'))
+    
+    def _cacheable(self, sql: str) -> bool:
+        """Reads are cached only outside explicit transactions and snapshot reads"""
+        if self._snapshot is not None and self._uses_replica():
+            return False  # the copy may lag the versions the cache tracks
+        return (self.query_cache is not None and not self.in_transaction()
+                and self._is_read(sql))
+    
+    def _cache_lookup(self, sql: str, params: tuple, kind: str = "rows") -> Tuple[bool, Any]:
+        if not self._cacheable(sql):
+            return False, None
+        if self._change_detector is not None:
+            self._change_detector.poll()
+        return self.query_cache.get(QueryCache.make_key(sql, params, kind))
+    
+    def _cache_snapshot(self, sql: str):
+        if not self._cacheable(sql):
+            return None
+        tables = tables_read_by(sql)
+        return self.query_cache.snapshot(tables) if tables else None
+    
+    def _cache_store(self, sql: str, params: tuple, value: Any, versions,
+                     kind: str = "rows") -> bool:
+        """Store a freshly read result; returns True if the cache now shares it"""
+        if versions is None:
+            return False
+        self.query_cache.put(QueryCache.make_key(sql, params, kind), value, versions)
+        return True
+    
+    def _mark_written(self, table: str) -> None:
+        """Record a write so cached reads of the table are invalidated"""
+        if self.in_transaction():
+            self._tx.written.add(table)
+        else:
+            self.invalidate(table)
+    
+    def invalidate(self, *tables: str) -> None:
+        """
+        Discard cached results that read the given tables
+        
+        Writes through DatabaseManager do this automatically; call it after
+        changing the database by other means.
+        
+        Args:
+            tables: Names of changed tables
+        """
+        if self.query_cache is not None and tables:
+            self.query_cache.bump(*tables)
+    
+    def invalidate_changed(self, tables: Iterable[str]) -> None:
+        """Change-detector callback: drop cached reads of tables written elsewhere"""
+        self.invalidate(*tables)
+    
+    def poll_changes(self) -> List[str]:
+        """
+        Check now for commits made by other processes
+        
+        Returns:
+            List[str]: Tables whose cached results were invalidated
+        """
+        if self._change_detector is None:
+            return []
+        return sorted(self._change_detector.poll(force=True))
+    
+    def statement_stats(self) -> Dict[str, Any]:
+        """
+        Get statement registry statistics
+        
+        Returns:
+            Dict: Compiled-SQL hit rate plus sqlite3's per-connection cache size
+        """
+        stats = self.statements.stats()
+        stats['cached_statements'] = self._pool.cached_statements
+        return stats
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get query cache statistics
+        
+        Returns:
+            Dict: Hit/miss counters and memory use (empty when caching is off)
+        """
+        if self.query_cache is None:
+            return {}
+        stats = self.query_cache.stats()
+        if self._change_detector is not None:
+            stats['external_changes'] = self._change_detector.stats()
+        return stats
+    
+    @staticmethod
+    def _check_row_type(row_type: str) -> None:
+        if row_type not in ROW_TYPES:
+            raise ValueError(f"Unknown row type: {row_type} (expected one of {', '.join(ROW_TYPES)})")
+    
+    @staticmethod
+    def _names(cursor: sqlite3.Cursor) -> Tuple[str, ...]:
+        return tuple(column[0] for column in cursor.description or ())
+    
+    def fetch_one(self, sql: str, params: tuple = None, row_type: str = 'dict') -> Any:
         """
         Fetch a single row from database
         
         Args:
             sql: SQL query string
             params: Query parameters
-            
+            row_type: 'dict', 'tuple', 'namedtuple' or 'dataclass' (see fetch_all)
+        
         Returns:
-            Optional[Dict]: Row as dictionary or None
+            Row of row_type (a dictionary by default) or None
         """
-        cursor = self.execute_query(sql, params)
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        self._check_row_type(row_type)
+        hit, result = self._cache_lookup(sql, params, kind="one")
+        if not hit:
+            versions = self._cache_snapshot(sql)
+            cursor = self._execute(sql, params, plain=True)
+            result = (self._names(cursor), cursor.fetchone())
+            self._cache_store(sql, params, result, versions, kind="one")
+        names, row = result
+        return row_builder(names, row_type)((row,))[0] if row is not None else None
     
-    def fetch_all(self, sql: str, params: tuple = None) -> List[Dict[str, Any]]:
+    def fetch_all(self, sql: str, params: tuple = None, row_type: str = 'dict') -> List[Any]:
         """
         Fetch all rows from database
         
+        Rows are read as plain tuples and cached that way; each call then
+        builds the requested form. 'tuple' only copies the list, 'namedtuple'
+        and 'dataclass' (slotted) use a class compiled once per column set,
+        and 'dict' builds a fresh dictionary per row. Listings that only
+        index or unpack their rows should ask for tuples.
+        
         Args:
             sql: SQL query string
             params: Query parameters
-            
+            row_type: 'dict', 'tuple', 'namedtuple' or 'dataclass'
+        
         Returns:
-            List[Dict]: List of rows as dictionaries
+            List: Rows of row_type (dictionaries by default)
         """
-        cursor = self.execute_query(sql, params)
+        self._check_row_type(row_type)
+        names, rows = self._fetch_rows(sql, params)
+        return row_builder(names, row_type)(rows)
+    
+    def _fetch_rows(self, sql: str, params: tuple = None) -> Tuple[Tuple[str, ...], List[tuple]]:
+        """Run a query (or serve it from the cache) as column names and plain tuples"""
+        hit, result = self._cache_lookup(sql, params, kind="tuples")
+        if hit:
+            return result
+        
+        versions = self._cache_snapshot(sql)
+        cursor = self._execute(sql, params, plain=True)
+        result = (self._names(cursor), cursor.fetchall())
+        self._cache_store(sql, params, result, versions, kind="tuples")
+        return result
+    
+    def _fetch_columns(self, sql: str, params: tuple = None) -> Tuple[List[str], List[tuple]]:
+        """Run a query and transpose the result into one tuple per column"""
+        hit, result = self._cache_lookup(sql, params, kind="columns")
+        if hit:
+            return result
+        
+        versions = self._cache_snapshot(sql)
+        cursor = self._execute(sql, params, plain=True)
+        names = list(self._names(cursor))
         rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        columns = list(zip(*rows)) if rows else [() for _ in names]
+        result = (names, columns)
+        self._cache_store(sql, params, result, versions, kind="columns")
+        return result
+    
+    def fetch_frame(self, sql: str, params: tuple = None, dtypes: Dict[str, Any] = None,
+                    categorical: Iterable[str] = CATEGORICAL_COLUMNS):
+        """
+        Fetch a query result straight into a pandas DataFrame
+        
+        Columns are built directly from the cursor's tuples, skipping the
+        per-row dicts and model objects of fetch_all().
+        
+        Args:
+            sql: SQL query string
+            params: Query parameters
+            dtypes: Optional pandas dtype per column name
+            categorical: Columns stored as pandas categoricals when no dtype is given
+        
+        Returns:
+            pandas.DataFrame: Query result
+        """
+        import pandas as pd
+        
+        names, columns = self._fetch_columns(sql, params)
+        dtypes = dtypes or {}
+        categorical = set(categorical)
+        data = {}
+        for name, values in zip(names, columns):
+            dtype = dtypes.get(name)
+            if dtype is None and name in categorical:
+                dtype = 'category'
+            if dtype is None and not values:
+                dtype = object  # pandas would otherwise default empty columns to float
+            data[name] = pd.Series(values, dtype=dtype)
+        return pd.DataFrame(data, columns=names)
+    
+    def fetch_arrow(self, sql: str, params: tuple = None,
+                    categorical: Iterable[str] = CATEGORICAL_COLUMNS):
+        """
+        Fetch a query result as a pyarrow Table
+        
+        st.dataframe renders Arrow tables directly, without the pandas
+        conversion step. Categorical columns are dictionary-encoded.
+        
+        Args:
+            sql: SQL query string
+            params: Query parameters
+            categorical: Columns to dictionary-encode
+        
+        Returns:
+            pyarrow.Table: Query result
+        """
+        import pyarrow as pa  # installed with streamlit, which depends on it
+        
+        names, columns = self._fetch_columns(sql, params)
+        categorical = set(categorical)
+        arrays = []
+        for name, values in zip(names, columns):
+            array = pa.array(values)
+            if name in categorical and pa.types.is_string(array.type):
+                array = array.dictionary_encode()
+            arrays.append(array)
+        return pa.Table.from_arrays(arrays, names=names)
+    
+    def iter_rows(self, sql: str, params: tuple = None, batch_size: int = 500,
+                  row_type: str = 'dict') -> Iterator[Any]:
+        """
+        Stream rows one batch at a time instead of loading them all
+        
+        Memory stays bounded by batch_size and the first row is available
+        as soon as SQLite produces it.
+        
+        Args:
+            sql: SQL query string
+            params: Query parameters
+            batch_size: Rows pulled from the cursor per fetchmany call
+            row_type: 'dict', 'tuple', 'namedtuple' or 'dataclass' (see fetch_all)
+        
+        Yields:
+            Each row as row_type (a dictionary by default)
+        """
+        self._check_row_type(row_type)
+        cursor = self._execute(sql, params, plain=True)
+        build = row_builder(self._names(cursor), row_type)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from build(rows)
+        finally:
+            cursor.close()
+    
+    def paginate(self, table: str, order_by: str = "id", after_key: tuple = None,
+                 limit: int = 50, descending: bool = False, where: str = None,
+                 params: tuple = None) -> Tuple[List[Dict[str, Any]], Optional[tuple]]:
+        """
+        Fetch one page of rows using keyset (seek) pagination
+        
+        Pages are positioned by the last key seen rather than an OFFSET, so
+        every page costs the same index seek however deep it is. Ties on
+        order_by are broken by id; rows whose order_by value is NULL are
+        not reachable past the first page.
+        
+        Args:
+            table: Table name
+            order_by: Column to sort on
+            after_key: Key returned with the previous page (None for the first page)
+            limit: Maximum rows per page
+            descending: Sort newest/largest first
+            where: Optional extra WHERE clause body
+            params: Parameters for the WHERE clause
+        
+        Returns:
+            Tuple: (rows, next_key); next_key is None on the last page
+        """
+        direction = "DESC" if descending else "ASC"
+        comparison = "<" if descending else ">"
+        key_columns = ["id"] if order_by == "id" else [order_by, "id"]
+        
+        conditions = []
+        query_params: tuple = ()
+        if where:
+            conditions.append(f"({where})")
+            query_params += tuple(params or ())
+        if after_key is not None:
+            if len(after_key) != len(key_columns):
+                raise ValueError(f"after_key must have {len(key_columns)} values")
+            marks = ', '.join(['?' for _ in key_columns])
+            conditions.append(f"({', '.join(key_columns)}) {comparison} ({marks})")
+            query_params += tuple(after_key)
+        
+        sql = f"SELECT * FROM {table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY " + ", ".join(f"{column} {direction}" for column in key_columns)
+        sql += " LIMIT ?"
+        
+        rows = self.fetch_all(sql, query_params + (limit + 1,))
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, tuple(last[column] for column in key_columns)
+    
+    def count(self, table: str, where: str = None, params: tuple = None) -> int:
+        """
+        Count rows in SQL without fetching them
+        
+        Args:
+            table: Table name
+            where: Optional WHERE clause body, e.g. "status IN (?, ?)"
+            params: Parameters for the WHERE clause
+        
+        Returns:
+            int: Number of matching rows
+        """
+        sql = f"SELECT COUNT(*) FROM {table}"
+        if where:
+            sql += f" WHERE {where}"
+        return self.execute_query(sql, params).fetchone()[0]
+    
+    def exists(self, table: str, where: str = None, params: tuple = None) -> bool:
+        """
+        Check whether any row matches, stopping at the first hit
+        
+        Args:
+            table: Table name
+            where: Optional WHERE clause body
+            params: Parameters for the WHERE clause
+        
+        Returns:
+            bool: True if at least one row matches
+        """
+        sql = f"SELECT 1 FROM {table}"
+        if where:
+            sql += f" WHERE {where}"
+        return self.execute_query(f"SELECT EXISTS ({sql})", params).fetchone()[0] == 1
+    
+    def count_by(self, table: str, column: str, where: str = None,
+                 params: tuple = None) -> Dict[Any, int]:
+        """
+        Count rows grouped by a column's values
+        
+        Args:
+            table: Table name
+            column: Column to group by
+            where: Optional WHERE clause body
+            params: Parameters for the WHERE clause
+        
+        Returns:
+            Dict: Mapping of column value to row count, largest first
+        """
+        sql = f"SELECT {column}, COUNT(*) FROM {table}"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" GROUP BY {column} ORDER BY COUNT(*) DESC"
+        return {row[0]: row[1] for row in self.execute_query(sql, params).fetchall()}
+    
+    @staticmethod
+    def to_epoch(value: Any, end_of_day: bool = False) -> int:
+        """
+        Convert a date bound to Unix seconds on the scale of the epoch columns
+        
+        Naive datetimes and text without an offset are taken as UTC, the same
+        way SQLite's strftime('%s') reads the stored text.
+        
+        Args:
+            value: int/float seconds, date, datetime or ISO 8601 text
+            end_of_day: For a bare date, return its last second instead of its first
+        
+        Returns:
+            int: Unix seconds
+        """
+        if isinstance(value, (int, float)):
+            return int(value)
+        if isinstance(value, str):
+            text = value.strip()
+            value = date.fromisoformat(text) if len(text) == 10 else datetime.fromisoformat(text)
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return int(value.timestamp())
+        if isinstance(value, date):
+            seconds = calendar.timegm(value.timetuple())
+            return seconds + 86399 if end_of_day else seconds
+        raise TypeError(f"Cannot use {type(value).__name__} as a date bound")
+    
+    @staticmethod
+    def _epoch_column(table: str, column: str) -> str:
+        """Epoch column for a date column (or the epoch column itself)"""
+        columns = EPOCH_COLUMNS.get(table, {})
+        if column in columns:
+            return columns[column]
+        if column in columns.values():
+            return column
+        raise ValueError(f"No epoch column is kept for {table}.{column}")
+    
+    def date_range(self, table: str, column: str, start: Any = None,
+                   end: Any = None) -> Tuple[str, tuple]:
+        """
+        Build a WHERE clause body selecting a date range through the epoch index
+        
+        Combine it with count(), paginate(), fetch_frame() and the like.
+        
+        Usage:
+            where, params = db_manager.date_range('it_tickets', 'created_date',
+                                                  start=date.today() - timedelta(days=7))
+            recent = db_manager.count('it_tickets', where, params)
+        
+        Args:
+            table: Table name
+            column: Date column (e.g. 'date') or its epoch column
+            start: First moment to include (None: no lower bound)
+            end: Last moment to include; a bare date includes that whole day
+                 (None: no upper bound)
+        
+        Returns:
+            Tuple: (where, params); rows whose date could not be parsed never match
+        """
+        epoch_column = self._epoch_column(table, column)
+        conditions = []
+        params: tuple = ()
+        if start is not None:
+            conditions.append(f"{epoch_column} >= ?")
+            params += (self.to_epoch(start),)
+        if end is not None:
+            conditions.append(f"{epoch_column} <= ?")
+            params += (self.to_epoch(end, end_of_day=True),)
+        if not conditions:
+            conditions.append(f"{epoch_column} IS NOT NULL")
+        return " AND ".join(conditions), params
+    
+    def between(self, table: str, column: str, start: Any = None, end: Any = None,
+                descending: bool = False, limit: Optional[int] = None,
+                row_type: str = 'dict') -> List[Any]:
+        """
+        Fetch the rows whose date falls in a range, in date order
+        
+        Served by an index range scan on the table's epoch column, whatever
+        text format the dates were written in.
+        
+        Args:
+            table: Table name
+            column: Date column (e.g. 'date') or its epoch column
+            start: First moment to include (date, datetime, ISO text or Unix seconds)
+            end: Last moment to include; a bare date includes that whole day
+            descending: Newest first
+            limit: Maximum rows to return
+            row_type: 'dict', 'tuple', 'namedtuple' or 'dataclass' (see fetch_all)
+        
+        Returns:
+            List: Matching rows
+        """
+        where, params = self.date_range(table, column, start, end)
+        epoch_column = self._epoch_column(table, column)
+        direction = "DESC" if descending else "ASC"
+        sql = (f"SELECT * FROM {table} WHERE {where} "
+               f"ORDER BY {epoch_column} {direction}, id {direction}")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        return self.fetch_all(sql, params, row_type=row_type)
+    
+    def _execute_write(self, table: str, sql: str, params: tuple) -> sqlite3.Cursor:
+        """Run a prepared write on the calling thread's connection and record it"""
+        cursor = self.connect().execute(sql, params)
+        self._mark_written(table)
+        return cursor
+    
+    @staticmethod
+    def _stamp_closed(table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Set closed_at on new closed records of archived tables
+        
+        Writing it in the INSERT itself saves the insert trigger's follow-up
+        UPDATE, which would log a second change and bump data_version again;
+        the trigger stays for inserts made outside DatabaseManager.
+        """
+        if table not in ARCHIVE_TABLES:
+            return rows
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        return [dict(row, closed_at=now)
+                if 'closed_at' not in row and row.get('status') in CLOSED_STATUSES else row
+                for row in rows]
     
     def insert(self, table: str, data: Dict[str, Any]) -> int:
         """
@@ -154,16 +1009,17 @@ class DatabaseManager:
         Args:
             table: Table name
             data: Dictionary of column-value pairs
-            
+        
         Returns:
             int: ID of inserted record
         """
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
-        sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        if self._routes_to_writer():
+            return self._write_queue.submit(lambda: self.insert(table, data)).result()
         
-        cursor = self.execute_query(sql, tuple(data.values()))
-        self.connection.commit()
+        data = self._stamp_closed(table, [data])[0]
+        sql = self.statements.insert(table, tuple(data.keys()))
+        with self.transaction():
+            cursor = self._execute_write(table, sql, tuple(data.values()))
         return cursor.lastrowid
     
     def update(self, table: str, record_id: int, data: Dict[str, Any]) -> bool:
@@ -174,16 +1030,17 @@ class DatabaseManager:
             table: Table name
             record_id: ID of record to update
             data: Dictionary of column-value pairs to update
-            
+        
         Returns:
             bool: True if update successful
         """
-        set_clause = ', '.join([f"{key} = ?" for key in data.keys()])
-        sql = f"UPDATE {table} SET {set_clause} WHERE id = ?"
+        if self._routes_to_writer():
+            return self._write_queue.submit(lambda: self.update(table, record_id, data)).result()
         
+        sql = self.statements.update(table, tuple(data.keys()))
         params = tuple(data.values()) + (record_id,)
-        cursor = self.execute_query(sql, params)
-        self.connection.commit()
+        with self.transaction():
+            cursor = self._execute_write(table, sql, params)
         return cursor.rowcount > 0
     
     def delete(self, table: str, record_id: int) -> bool:
@@ -193,20 +1050,384 @@ class DatabaseManager:
         Args:
             table: Table name
             record_id: ID of record to delete
-            
+        
         Returns:
             bool: True if deletion successful
         """
-        sql = f"DELETE FROM {table} WHERE id = ?"
-        cursor = self.execute_query(sql, (record_id,))
-        self.connection.commit()
+        if self._routes_to_writer():
+            return self._write_queue.submit(lambda: self.delete(table, record_id)).result()
+        
+        sql = self.statements.delete(table)
+        with self.transaction():
+            cursor = self._execute_write(table, sql, (record_id,))
         return cursor.rowcount > 0
     
+    def insert_many(self, table: str, rows: Iterable[Dict[str, Any]],
+                    chunk_size: int = 1000) -> List[range]:
+        """
+        Insert many records with executemany, committing once per chunk
+        
+        Rows are grouped by their column set so each group runs as a single
+        prepared statement. An 'id' key set to None (as produced by the
+        models' to_dict()) is ignored so SQLite assigns the id.
+        
+        Args:
+            table: Table name
+            rows: Iterable of column-value dictionaries
+            chunk_size: Number of rows written per transaction
+        
+        Returns:
+            List[range]: Ids assigned to each executed group, in write order
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if self._routes_to_writer():
+            return self._write_queue.submit(
+                lambda: self.insert_many(table, rows, chunk_size)
+            ).result()
+        
+        id_ranges: List[range] = []
+        chunk: List[Dict[str, Any]] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                id_ranges.extend(self._insert_chunk(table, chunk))
+                chunk = []
+        if chunk:
+            id_ranges.extend(self._insert_chunk(table, chunk))
+        return id_ranges
+    
+    def _insert_chunk(self, table: str, chunk: List[Dict[str, Any]]) -> List[range]:
+        """Insert one chunk of rows inside a single transaction"""
+        groups: Dict[tuple, List[tuple]] = {}
+        for row in self._stamp_closed(table, chunk):
+            if 'id' in row:
+                if row['id'] is not None:
+                    raise ValueError("insert_many assigns ids; rows must not set 'id'")
+                row = {key: value for key, value in row.items() if key != 'id'}
+            groups.setdefault(tuple(row.keys()), []).append(tuple(row.values()))
+        
+        id_ranges = []
+        with self.transaction() as conn:
+            for columns, params in groups.items():
+                conn.executemany(self.statements.insert(table, columns), params)
+                self._mark_written(table)
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                id_ranges.append(range(last_id - len(params) + 1, last_id + 1))
+        return id_ranges
+    
+    def upsert(self, table: str, rows: Iterable[Dict[str, Any]],
+               conflict_keys: Iterable[str], update_columns: Iterable[str] = None,
+               chunk_size: int = 1000) -> int:
+        """
+        Insert records, or update the existing record with the same key
+        
+        Built on INSERT ... ON CONFLICT DO UPDATE. The update only applies
+        when a value actually differs, so re-syncing an unchanged row writes
+        nothing and fires no triggers (search index, summaries, change log).
+        conflict_keys must be covered by a UNIQUE index or constraint.
+        
+        Usage:
+            db_manager.upsert('it_tickets', rows, conflict_keys=['ticket_id'],
+                              update_columns=['title', 'status', 'description'])
+        
+        Args:
+            table: Table name
+            rows: Iterable of column-value dictionaries, each including the conflict keys
+            conflict_keys: Columns identifying a record
+            update_columns: Columns overwritten on conflict (default: every other
+                            column in the row; empty to only insert new records)
+            chunk_size: Number of rows written per transaction
+        
+        Returns:
+            int: Number of records inserted or changed
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        conflict_keys = tuple(conflict_keys)
+        if not conflict_keys:
+            raise ValueError("upsert needs at least one conflict key")
+        if update_columns is not None:
+            update_columns = tuple(update_columns)
+        if self._routes_to_writer():
+            return self._write_queue.submit(
+                lambda: self.upsert(table, rows, conflict_keys, update_columns, chunk_size)
+            ).result()
+        
+        written = 0
+        chunk: List[Dict[str, Any]] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                written += self._upsert_chunk(table, chunk, conflict_keys, update_columns)
+                chunk = []
+        if chunk:
+            written += self._upsert_chunk(table, chunk, conflict_keys, update_columns)
+        return written
+    
+    def _upsert_chunk(self, table: str, chunk: List[Dict[str, Any]],
+                      conflict_keys: Tuple[str, ...],
+                      update_columns: Optional[Tuple[str, ...]]) -> int:
+        """Upsert one chunk of rows inside a single transaction"""
+        groups: Dict[tuple, List[tuple]] = {}
+        for given, row in zip(chunk, self._stamp_closed(table, chunk)):
+            if 'id' in row and row['id'] is None:
+                row = {key: value for key, value in row.items() if key != 'id'}
+            missing = [key for key in conflict_keys if key not in row]
+            if missing:
+                raise ValueError(f"upsert rows must include the conflict key(s): {', '.join(missing)}")
+            stamped = row.keys() - given.keys()
+            groups.setdefault((tuple(row.keys()), tuple(stamped)), []).append(tuple(row.values()))
+        
+        written = 0
+        with self.transaction() as conn:
+            for (columns, stamped), params in groups.items():
+                updates = update_columns
+                if updates is None:
+                    # A stamped closed_at only applies to new records
+                    updates = tuple(c for c in columns
+                                    if c not in conflict_keys and c != 'id' and c not in stamped)
+                sql = self.statements.upsert(table, columns, conflict_keys, updates)
+                # rowcount counts inserted and updated rows, not skipped ones
+                written += conn.executemany(sql, params).rowcount
+                self._mark_written(table)
+        return written
+    
+    def update_many(self, table: str, record_ids: Iterable[int], data: Dict[str, Any],
+                    chunk_size: int = 500) -> int:
+        """
+        Apply the same column values to many records
+        
+        Args:
+            table: Table name
+            record_ids: IDs of records to update
+            data: Dictionary of column-value pairs to set
+            chunk_size: Number of ids per UPDATE statement
+        
+        Returns:
+            int: Number of records updated
+        """
+        columns = tuple(data.keys())
+        return self._execute_for_ids(
+            table, lambda count: self.statements.update_in(table, columns, count),
+            tuple(data.values()), record_ids, chunk_size
+        )
+    
+    def delete_many(self, table: str, record_ids: Iterable[int], chunk_size: int = 500) -> int:
+        """
+        Delete many records by id
+        
+        Args:
+            table: Table name
+            record_ids: IDs of records to delete
+            chunk_size: Number of ids per DELETE statement
+        
+        Returns:
+            int: Number of records deleted
+        """
+        return self._execute_for_ids(
+            table, lambda count: self.statements.delete_in(table, count),
+            (), record_ids, chunk_size
+        )
+    
+    def _execute_for_ids(self, table: str, build_sql, leading_params: tuple,
+                         record_ids: Iterable[int], chunk_size: int) -> int:
+        """Run an id-keyed statement over chunks of ids in one transaction"""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        ids = list(record_ids)
+        if not ids:
+            return 0
+        if self._routes_to_writer():
+            return self._write_queue.submit(
+                lambda: self._execute_for_ids(table, build_sql, leading_params, ids, chunk_size)
+            ).result()
+        
+        affected = 0
+        with self.transaction() as conn:
+            for start in range(0, len(ids), chunk_size):
+                batch = ids[start:start + chunk_size]
+                sql = build_sql(len(batch))
+                affected += conn.execute(sql, leading_params + tuple(batch)).rowcount
+            self._mark_written(table)
+        return affected
+    
+    def enable_write_behind(self, max_batch: int = 256, max_delay: float = 0.005) -> None:
+        """
+        Send writes to a single writer thread that commits them in groups
+        
+        Writes from any thread queue up and are merged into one transaction
+        per max_batch operations or max_delay seconds, so sessions stop
+        contending for SQLite's write lock. Writes issued inside an explicit
+        transaction() still run directly on the caller's connection.
+        
+        Args:
+            max_batch: Most operations merged into one commit
+            max_delay: Seconds the writer waits for more work before committing
+        """
+        if self._write_queue is None:
+            self._write_queue = WriteQueue(self._run_write_batch, max_batch, max_delay)
+    
+    def disable_write_behind(self) -> None:
+        """Commit queued writes and stop the writer thread"""
+        write_queue, self._write_queue = self._write_queue, None
+        if write_queue is not None:
+            write_queue.stop()
+    
+    def _routes_to_writer(self) -> bool:
+        write_queue = self._write_queue
+        return (write_queue is not None and not self.in_transaction()
+                and threading.current_thread() is not write_queue.thread)
+    
+    def _run_write_batch(self, operations: List[Callable[[], Any]]) -> List[Tuple[bool, Any]]:
+        """Writer thread: run queued operations as savepoints inside one commit"""
+        outcomes = []
+        with self.transaction():
+            for operation in operations:
+                try:
+                    with self.transaction():
+                        outcomes.append((True, operation()))
+                except Exception as exc:
+                    outcomes.append((False, exc))
+        return outcomes
+    
+    def submit(self, operation: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Queue a write without waiting for it
+        
+        Usage:
+            future = db_manager.submit(db_manager.insert, 'it_tickets', ticket.to_dict())
+            ticket_id = future.result()
+        
+        Args:
+            operation: DatabaseManager write method (or any callable doing writes)
+            args: Positional arguments for operation
+            kwargs: Keyword arguments for operation
+        
+        Returns:
+            Future: Resolves to the operation's result once committed; runs
+                    immediately when write-behind mode is off
+        """
+        if self._write_queue is not None:
+            return self._write_queue.submit(lambda: operation(*args, **kwargs))
+        future: Future = Future()
+        try:
+            future.set_result(operation(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+    
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until every queued write has been committed
+        
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        if self._write_queue is not None:
+            self._write_queue.flush(timeout)
+    
+    def write_queue_stats(self) -> Dict[str, float]:
+        """
+        Get writer thread statistics
+        
+        Returns:
+            Dict: Group commit counters (empty when write-behind is off)
+        """
+        return self._write_queue.stats() if self._write_queue is not None else {}
+    
+    def changes_since(self, seq: int = 0, tables: Iterable[str] = None,
+                      limit: int = 1000) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Read the change log after a sequence number
+        
+        Triggers append one entry per inserted, updated or deleted row of the
+        domain tables. SQLite commits one writer at a time, so sequence
+        numbers become visible in order and a consumer that resumes from the
+        last seq it saw never skips an entry.
+        
+        Usage:
+            changes, cursor = db_manager.changes_since(cursor, ['it_tickets'])
+        
+        Args:
+            seq: Last sequence number already processed (0 for the start of the log)
+            tables: Only return changes to these tables (default: all)
+            limit: Maximum entries per call
+        
+        Returns:
+            Tuple: (changes, next_seq); each change has seq, table_name, row_id,
+                   op (INSERT/UPDATE/DELETE) and changed_at. next_seq is the
+                   cursor for the following call (seq itself when nothing is new).
+        """
+        sql = "SELECT seq, table_name, row_id, op, changed_at FROM changes WHERE seq > ?"
+        params: tuple = (seq,)
+        if tables is not None:
+            tables = tuple(tables)
+            if not tables:
+                return [], seq
+            sql += f" AND table_name IN ({', '.join(['?'] * len(tables))})"
+            params += tables
+        sql += " ORDER BY seq LIMIT ?"
+        rows = [dict(row) for row in self.execute_query(sql, params + (limit,)).fetchall()]
+        return rows, rows[-1]['seq'] if rows else seq
+    
+    def latest_change_seq(self) -> int:
+        """Sequence number of the newest change-log entry (0 when empty)"""
+        row = self.execute_query("SELECT seq FROM sqlite_sequence WHERE name = 'changes'").fetchone()
+        return row[0] if row else 0
+    
+    def ack_changes(self, consumer: str, seq: int) -> None:
+        """
+        Record how far a named consumer has processed the change log
+        
+        Entries are only compacted once every registered consumer is past them.
+        
+        Args:
+            consumer: Stable consumer name, e.g. 'ai_triage'
+            seq: Last sequence number the consumer has fully processed
+        """
+        with self.transaction():
+            self.execute_query(
+                "INSERT INTO change_consumers (name, seq) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET seq = MAX(seq, excluded.seq), "
+                "updated_at = CURRENT_TIMESTAMP",
+                (consumer, seq)
+            )
+    
+    def consumer_position(self, consumer: str) -> int:
+        """Last sequence number acknowledged by a consumer (0 if it never acked)"""
+        row = self.execute_query(
+            "SELECT seq FROM change_consumers WHERE name = ?", (consumer,)
+        ).fetchone()
+        return row[0] if row else 0
+    
+    def compact_changes(self, upto: Optional[int] = None) -> int:
+        """
+        Delete change-log entries every consumer has processed
+        
+        Args:
+            upto: Delete entries up to this seq instead of the slowest
+                  consumer's position
+        
+        Returns:
+            int: Number of entries deleted
+        """
+        with self.transaction():
+            if upto is None:
+                upto = self.execute_query("SELECT MIN(seq) FROM change_consumers").fetchone()[0]
+                if upto is None:
+                    return 0  # no registered consumers: nothing is known to be consumed
+            return self.execute_query("DELETE FROM changes WHERE seq <= ?", (upto,)).rowcount
+    
     def close(self) -> None:
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Close all pooled database connections"""
+        self.disable_write_behind()
+        self._pool.close_all()
+        self._readers.close_all()
+        if self._snapshot is not None:
+            self._snapshot.close()
+        if self._change_detector is not None:
+            self._change_detector.close()
     
     def __enter__(self):
         """Context manager entry"""
@@ -1,6 +1,20 @@
 # Services package - Business logic and coordination classes
 from .database_manager import DatabaseManager
+from .connection_pool import ConnectionPool
+from .pragma_profile import PragmaProfile
+from .schema_migrator import SchemaMigrator, Migration
+from .query_cache import QueryCache
+from .statement_registry import StatementRegistry
+from .write_queue import WriteQueue
+from .retry_policy import RetryPolicy, DatabaseBusyError
+from .snapshot_replica import SnapshotReplica
+from .search_service import SearchService
+from .summary_service import SummaryService
+from .rollup_service import RollupService
+from .archive_service import ArchiveService
+from .backup_service import BackupService
+from .maintenance_scheduler import MaintenanceScheduler
 from .auth_manager import AuthManager
 from .ai_assistant import AIAssistant
 
-__all__ = ['DatabaseManager', 'AuthManager', 'AIAssistant']
\ No newline at end of file
+__all__ = ['DatabaseManager', 'ConnectionPool', 'PragmaProfile', 'SchemaMigrator', 'Migration', 'QueryCache', 'StatementRegistry', 'WriteQueue', 'RetryPolicy', 'DatabaseBusyError', 'SnapshotReplica', 'SearchService', 'SummaryService', 'RollupService', 'ArchiveService', 'BackupService', 'MaintenanceScheduler', 'AuthManager', 'AIAssistant']
\ No newline at end of file
@@ -0,0 +1,391 @@
+"""
+Maintenance Scheduler Service Class
+Runs rollup refreshes, PRAGMA optimize, ANALYZE, incremental vacuum and WAL checkpoints while the app is idle
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from services.connection_pool import read_only_uri
+from services.database_manager import DatabaseManager
+from services.pragma_profile import PragmaProfile
+from services.rollup_service import RollupService
+
+class MaintenanceCancelled(Exception):
+    """Raised when a maintenance task gives way to user requests"""
+
+class MaintenanceScheduler:
+    """Background thread that keeps planner statistics fresh and the files compact"""
+    
+    # Default seconds between two runs of each task, in the order they run
+    DEFAULT_INTERVALS = {
+        'rollups': 30.0,
+        'checkpoint': 60.0,
+        'optimize': 3600.0,
+        'vacuum': 600.0,
+        'analyze': 86400.0,
+    }
+    SCHEMAS = ('main', 'archive')
+    
+    def __init__(self, db_manager: DatabaseManager, idle_seconds: float = 5.0,
+                 poll_interval: float = 1.0, intervals: Optional[Dict[str, float]] = None,
+                 vacuum_pages: int = 256, full_vacuum_fraction: float = 0.25,
+                 analysis_limit: int = 400):
+        """
+        Initialize MaintenanceScheduler with database manager
+        
+        Args:
+            db_manager: DatabaseManager instance whose files are maintained
+            idle_seconds: Seconds without a connection request before tasks may run
+            poll_interval: Seconds between idle checks in the background thread
+            intervals: Seconds between runs per task (overrides DEFAULT_INTERVALS;
+                       None disables a task)
+            vacuum_pages: Free pages released per incremental_vacuum step
+            full_vacuum_fraction: Free-page share at which a database without
+                                  incremental auto_vacuum is rebuilt with VACUUM
+                                  (which also switches it to incremental)
+            analysis_limit: Rows PRAGMA optimize samples per index (0 = no limit)
+        """
+        self.db_manager = db_manager
+        self.idle_seconds = idle_seconds
+        self.poll_interval = poll_interval
+        self.intervals = dict(self.DEFAULT_INTERVALS)
+        self.intervals.update(intervals or {})
+        self.vacuum_pages = vacuum_pages
+        self.full_vacuum_fraction = full_vacuum_fraction
+        self.analysis_limit = analysis_limit
+        
+        self._tasks = {
+            'rollups': self._rollups,
+            'checkpoint': self._checkpoint,
+            'optimize': self._optimize,
+            'vacuum': self._vacuum,
+            'analyze': self._analyze,
+        }
+        unknown = set(self.intervals) - set(self._tasks)
+        if unknown:
+            raise ValueError(f"Unknown maintenance task(s): {', '.join(sorted(unknown))}")
+        
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._started_at = 0.0
+        self._yield_to_users = False
+        self._last_run: Dict[str, Optional[float]] = {name: None for name in self._tasks}
+        self._stats = {name: {'runs': 0, 'cancelled': 0, 'failures': 0, 'last_run': None,
+                              'last_seconds': None, 'last_result': None}
+                       for name in self._tasks}
+    
+    # ------------------------------------------------------------------
+    # Background thread
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Start the background thread (no-op if it is already running)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="db-maintenance", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Stop the background thread, interrupting a running task
+        
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def _loop(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            for name in self.due():
+                if self._stop.is_set() or self.db_manager.idle_seconds() < self.idle_seconds:
+                    break
+                try:
+                    self._run(name, yield_to_users=True)
+                except Exception:
+                    pass  # recorded in stats(); the thread keeps serving the other tasks
+    
+    def due(self) -> List[str]:
+        """
+        Get the tasks whose interval has elapsed (or that never ran)
+        
+        Returns:
+            List[str]: Task names in run order
+        """
+        now = time.monotonic()
+        return [name for name, interval in self.intervals.items()
+                if interval is not None and (self._last_run[name] is None
+                                             or now - self._last_run[name] >= interval)]
+    
+    # ------------------------------------------------------------------
+    # Running tasks
+    # ------------------------------------------------------------------
+    def run(self, task: str, yield_to_users: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Run one task now
+        
+        Args:
+            task: 'rollups', 'checkpoint', 'optimize', 'vacuum' or 'analyze'
+            yield_to_users: Cancel the task as soon as another thread asks for a
+                            connection (the background thread always does)
+        
+        Returns:
+            Dict: Task result, or None if it was cancelled
+        """
+        if task not in self._tasks:
+            raise ValueError(f"Unknown maintenance task: {task}")
+        return self._run(task, yield_to_users)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Dedicated autocommit connection, outside the pool so it is not counted as activity"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_manager.db_path, isolation_level=None,
+                                   check_same_thread=False)
+            self.db_manager.profile.apply(conn)
+            # Never wait on a lock: a busy database means someone is using it
+            conn.execute("PRAGMA busy_timeout = 0")
+            conn.execute(f"PRAGMA analysis_limit = {int(self.analysis_limit)}")
+            conn.execute("ATTACH DATABASE ? AS archive", (self.db_manager.archive_path,))
+            conn.set_progress_handler(self._should_interrupt, 1000)
+            self._conn = conn
+        return self._conn
+    
+    def _should_interrupt(self) -> int:
+        """Progress handler: a non-zero return aborts the running statement"""
+        if not self._yield_to_users:
+            return 0
+        return int(self._stop.is_set() or self.db_manager.last_activity > self._started_at)
+    
+    def _cancel_point(self) -> None:
+        """Cancellation point between the steps of a task"""
+        if self._should_interrupt():
+            raise MaintenanceCancelled()
+    
+    def _run(self, name: str, yield_to_users: bool) -> Optional[Dict[str, Any]]:
+        stats = self._stats[name]
+        with self._lock:
+            self._yield_to_users = yield_to_users
+            self._started_at = time.monotonic()
+            started = time.perf_counter()
+            try:
+                result = self._tasks[name](self._connection())
+            except MaintenanceCancelled:
+                stats['cancelled'] += 1
+                return None
+            except sqlite3.OperationalError as e:
+                message = str(e).lower()
+                if 'interrupted' in message or 'locked' in message or 'busy' in message:
+                    stats['cancelled'] += 1  # retried in the next idle window
+                    return None
+                self._record_failure(name, e)
+                raise
+            except Exception as e:
+                self._record_failure(name, e)
+                raise
+            finally:
+                if self._conn is not None and self._conn.in_transaction:
+                    self._conn.rollback()
+                # Only a running task gives way to users
+                self._yield_to_users = False
+                self._started_at = 0.0
+            self._last_run[name] = time.monotonic()
+            stats['runs'] += 1
+            stats['last_run'] = datetime.now().isoformat(timespec='seconds')
+            stats['last_seconds'] = round(time.perf_counter() - started, 4)
+            stats['last_result'] = result
+            return result
+    
+    def _record_failure(self, name: str, error: Exception) -> None:
+        # Counts as a run for scheduling, so a broken task waits a full interval
+        self._last_run[name] = time.monotonic()
+        self._stats[name]['failures'] += 1
+        self._stats[name]['last_result'] = {'error': str(error)}
+    
+    # ------------------------------------------------------------------
+    # Tasks
+    # ------------------------------------------------------------------
+    def _rollups(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """Recount the trend buckets of the days written since the last run"""
+        return {'days': RollupService(self.db_manager).refresh(conn)}
+    
+    def _checkpoint(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """
+        Copy WAL frames back into the database files
+        
+        PASSIVE never waits for readers or writers; when it got through the
+        whole log the file is truncated too, so an idle app does not keep a
+        large -wal file around.
+        """
+        result = {}
+        for schema in self.SCHEMAS:
+            busy, log_frames, checkpointed = conn.execute(
+                f"PRAGMA {schema}.wal_checkpoint(PASSIVE)"
+            ).fetchone()
+            truncated = False
+            if not busy and log_frames > 0 and checkpointed == log_frames:
+                self._cancel_point()
+                truncated = conn.execute(
+                    f"PRAGMA {schema}.wal_checkpoint(TRUNCATE)"
+                ).fetchone()[0] == 0
+            result[schema] = {'log_frames': log_frames, 'checkpointed': checkpointed,
+                              'busy': bool(busy), 'truncated': truncated}
+        return result
+    
+    def _optimize(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """Let SQLite re-analyze the tables whose statistics have drifted"""
+        conn.execute("PRAGMA optimize")
+        return {'analyzed': self._stat1_tables(conn)}
+    
+    def _analyze(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """Full ANALYZE of every table, without the sampling limit"""
+        conn.execute("PRAGMA analysis_limit = 0")
+        try:
+            for schema in self.SCHEMAS:
+                self._cancel_point()
+                conn.execute(f"ANALYZE {schema}")
+        finally:
+            conn.execute(f"PRAGMA analysis_limit = {int(self.analysis_limit)}")
+        return {'analyzed': self._stat1_tables(conn)}
+    
+    @staticmethod
+    def _stat1_tables(conn: sqlite3.Connection) -> int:
+        total = 0
+        for schema in MaintenanceScheduler.SCHEMAS:
+            try:
+                total += conn.execute(
+                    f"SELECT COUNT(DISTINCT tbl) FROM {schema}.sqlite_stat1"
+                ).fetchone()[0]
+            except sqlite3.OperationalError:
+                pass  # never analyzed
+        return total
+    
+    def _vacuum(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """
+        Return free pages to the file system
+        
+        Databases in incremental auto_vacuum mode give back vacuum_pages at a
+        time, with a cancellation point between steps. A database created
+        before auto_vacuum was configured is rebuilt once with VACUUM when
+        enough of it is free, which also switches it to incremental mode.
+        """
+        result = {}
+        for schema in self.SCHEMAS:
+            before = self._pragma(conn, schema, 'freelist_count')
+            mode = self._auto_vacuum_mode(self._pragma(conn, schema, 'auto_vacuum'))
+            action = None
+            if before and mode == 'INCREMENTAL':
+                action = 'incremental'
+                while self._pragma(conn, schema, 'freelist_count'):
+                    self._cancel_point()
+                    # executescript steps the pragma to completion; execute() frees one page
+                    conn.executescript(f"PRAGMA {schema}.incremental_vacuum({int(self.vacuum_pages)})")
+            elif (mode == 'NONE' and self.full_vacuum_fraction is not None
+                  and before >= self.full_vacuum_fraction * self._pragma(conn, schema, 'page_count')
+                  and before > 0):
+                action = 'full'
+                self._cancel_point()
+                conn.execute(f"PRAGMA {schema}.auto_vacuum = {self.db_manager.profile.auto_vacuum}")
+                conn.execute(f"VACUUM {schema}")
+            result[schema] = {'action': action, 'free_pages_before': before,
+                              'free_pages_after': self._pragma(conn, schema, 'freelist_count')}
+        return result
+    
+    @staticmethod
+    def _auto_vacuum_mode(value: int) -> str:
+        return PragmaProfile.AUTO_VACUUM_MODES[value] if 0 <= value < 3 else str(value)
+    
+    @staticmethod
+    def _pragma(conn: sqlite3.Connection, schema: str, name: str) -> Any:
+        return conn.execute(f"PRAGMA {schema}.{name}").fetchone()[0]
+    
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def report(self, tables: bool = True) -> Dict[str, Any]:
+        """
+        Report file size and fragmentation of the main and archive databases
+        
+        Args:
+            tables: Include per-table page usage (a full scan of the b-tree pages;
+                    None if SQLite was built without the dbstat table)
+        
+        Returns:
+            Dict: Per schema, page size and counts, free pages and their share,
+                  auto_vacuum mode, file and WAL bytes, and the tables with the
+                  most unused bytes
+        """
+        paths = {'main': self.db_manager.db_path, 'archive': self.db_manager.archive_path}
+        # A connection of its own: not interrupted on user activity and not
+        # waiting behind a running VACUUM or ANALYZE
+        conn = sqlite3.connect(read_only_uri(paths['main']), uri=True)
+        try:
+            conn.execute("ATTACH DATABASE ? AS archive", (read_only_uri(paths['archive']),))
+            report = {}
+            for schema in self.SCHEMAS:
+                page_size = self._pragma(conn, schema, 'page_size')
+                page_count = self._pragma(conn, schema, 'page_count')
+                freelist = self._pragma(conn, schema, 'freelist_count')
+                wal_path = paths[schema] + "-wal"
+                entry = {
+                    'page_size': page_size,
+                    'page_count': page_count,
+                    'freelist_count': freelist,
+                    'free_fraction': round(freelist / page_count, 4) if page_count else 0.0,
+                    'auto_vacuum': self._auto_vacuum_mode(self._pragma(conn, schema, 'auto_vacuum')),
+                    'file_bytes': page_size * page_count,
+                    'wal_bytes': os.path.getsize(wal_path) if os.path.exists(wal_path) else 0,
+                }
+                if tables:
+                    entry['tables'] = self._table_usage(conn, schema)
+                report[schema] = entry
+            return report
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def _table_usage(conn: sqlite3.Connection, schema: str,
+                     top: int = 10) -> Optional[List[Dict[str, Any]]]:
+        try:
+            rows = conn.execute(
+                "SELECT name, pageno, pgsize, unused FROM dbstat(?, 1) "
+                "ORDER BY unused DESC LIMIT ?", (schema, top)
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            if 'no such table: dbstat' not in str(e):
+                raise
+            return None  # no dbstat in this SQLite build
+        return [{'name': name, 'pages': pages, 'bytes': size, 'unused_bytes': unused,
+                 'unused_fraction': round(unused / size, 4) if size else 0.0}
+                for name, pages, size, unused in rows]
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics
+        
+        Returns:
+            Dict: Whether the thread runs, seconds the app has been idle, tasks
+                  due now, and per task runs, cancellations, failures and the
+                  time, duration and result of the last run
+        """
+        return {
+            'running': self.running,
+            'idle_seconds': round(self.db_manager.idle_seconds(), 1),
+            'due': self.due(),
+            'tasks': {name: dict(stats) for name, stats in self._stats.items()},
+        }
@@ -0,0 +1,439 @@
+"""
+Platform Schema Migrations
+Ordered list of schema versions for database/platform.db
+Add new changes as a new Migration at the end; never edit an applied one
+"""
+from services.schema_migrator import Migration
+
+DOMAIN_TABLES = ['users', 'cyber_incidents', 'datasets_metadata', 'it_tickets']
+
+def _change_counter_statements():
+    """Counter table plus one trigger per table and write kind"""
+    statements = [
+        """
+        CREATE TABLE IF NOT EXISTS table_change_counters (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        """
+    ]
+    for table in DOMAIN_TABLES:
+        statements.append(
+            f"INSERT OR IGNORE INTO table_change_counters (table_name, version) VALUES ('{table}', 0)"
+        )
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_counter
+        AFTER {event} ON {table}
+        BEGIN
+            UPDATE table_change_counters SET version = version + 1
+            WHERE table_name = '{table}';
+        END
+        """)
+    return statements
+
+# FTS5 index -> (content table, indexed columns, BM25 weight per column)
+SEARCH_INDEXES = {
+    'search_incidents': ('cyber_incidents', ('title', 'description'), (10.0, 1.0)),
+    'search_tickets': ('it_tickets', ('title', 'description', 'assigned_to'), (10.0, 1.0, 2.0)),
+    'search_datasets': ('datasets_metadata', ('name', 'description', 'source'), (10.0, 1.0, 2.0)),
+}
+
+def _search_index_statements():
+    """External-content FTS5 tables kept in sync with their source tables by trigger"""
+    statements = []
+    for index, (table, columns, weights) in SEARCH_INDEXES.items():
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f'new.{column}' for column in columns)
+        old_values = ', '.join(f'old.{column}' for column in columns)
+        statements.append(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5(
+            {column_list},
+            content='{table}', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2', prefix='3'
+        )
+        """)
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_insert_search
+        AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO {index} (rowid, {column_list}) VALUES (new.id, {new_values});
+        END
+        """)
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_delete_search
+        AFTER DELETE ON {table}
+        BEGIN
+            INSERT INTO {index} ({index}, rowid, {column_list})
+            VALUES ('delete', old.id, {old_values});
+        END
+        """)
+        # Only edits to indexed text re-index a row; status changes stay cheap
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_update_search
+        AFTER UPDATE OF {column_list} ON {table}
+        BEGIN
+            INSERT INTO {index} ({index}, rowid, {column_list})
+            VALUES ('delete', old.id, {old_values});
+            INSERT INTO {index} (rowid, {column_list}) VALUES (new.id, {new_values});
+        END
+        """)
+        bm25 = ', '.join(str(weight) for weight in weights)
+        statements.append(f"INSERT INTO {index} ({index}, rank) VALUES ('rank', 'bm25({bm25})')")
+        statements.append(f"INSERT INTO {index} ({index}) VALUES ('rebuild')")
+    return statements
+
+# Domain table -> (status column or None, facet column) counted in domain_summary
+SUMMARY_TABLES = {
+    'cyber_incidents': ('status', 'severity'),
+    'it_tickets': ('status', 'priority'),
+    'datasets_metadata': (None, 'category'),
+}
+
+def summary_source_sql(table: str) -> str:
+    """Exact per (status, facet) counts of a domain table, in domain_summary's shape"""
+    status, facet = SUMMARY_TABLES[table]
+    status_expr = f"COALESCE({status}, '')" if status else "''"
+    return (f"SELECT '{table}' AS table_name, {status_expr} AS status, "
+            f"COALESCE({facet}, '') AS facet, COUNT(*) AS count "
+            f"FROM {table} GROUP BY 2, 3")
+
+def _summary_delta(table: str, row: str, delta: int) -> str:
+    """Trigger body statements adding delta to the summary row of old/new"""
+    status, facet = SUMMARY_TABLES[table]
+    status_expr = f"COALESCE({row}.{status}, '')" if status else "''"
+    facet_expr = f"COALESCE({row}.{facet}, '')"
+    statement = (f"INSERT INTO domain_summary (table_name, status, facet, count) "
+                 f"VALUES ('{table}', {status_expr}, {facet_expr}, {delta}) "
+                 f"ON CONFLICT (table_name, status, facet) DO UPDATE SET count = count + {delta};")
+    if delta < 0:
+        statement += (f" DELETE FROM domain_summary WHERE table_name = '{table}' "
+                      f"AND status = {status_expr} AND facet = {facet_expr} AND count <= 0;")
+    return statement
+
+def _summary_statements():
+    """Summary table, its maintenance triggers and the initial counts"""
+    statements = [
+        """
+        CREATE TABLE IF NOT EXISTS domain_summary (
+            table_name TEXT NOT NULL,
+            status TEXT NOT NULL,
+            facet TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (table_name, status, facet)
+        ) WITHOUT ROWID
+        """
+    ]
+    for table, (status, facet) in SUMMARY_TABLES.items():
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_insert_summary
+        AFTER INSERT ON {table}
+        BEGIN
+            {_summary_delta(table, 'new', 1)}
+        END
+        """)
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_delete_summary
+        AFTER DELETE ON {table}
+        BEGIN
+            {_summary_delta(table, 'old', -1)}
+        END
+        """)
+        watched = [column for column in (status, facet) if column]
+        changed = ' OR '.join(f"old.{column} IS NOT new.{column}" for column in watched)
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_update_summary
+        AFTER UPDATE OF {', '.join(watched)} ON {table}
+        WHEN {changed}
+        BEGIN
+            {_summary_delta(table, 'old', -1)}
+            {_summary_delta(table, 'new', 1)}
+        END
+        """)
+        statements.append(f"INSERT OR REPLACE INTO domain_summary {summary_source_sql(table)}")
+    return statements
+
+# Domain table -> date column bucketed by the trend rollups (facet as in SUMMARY_TABLES)
+ROLLUP_DATE_COLUMNS = {
+    'cyber_incidents': 'date',
+    'it_tickets': 'created_date',
+    'datasets_metadata': 'created_at',
+}
+
+def _mark_dirty(table: str, row: str) -> str:
+    """Trigger body statement recording the day of old/new as needing a recount"""
+    day = f"date({row}.{ROLLUP_DATE_COLUMNS[table]})"
+    return (f"INSERT OR IGNORE INTO rollup_dirty (table_name, day) "
+            f"SELECT '{table}', {day} WHERE {day} IS NOT NULL;")
+
+def _rollup_statements():
+    """Bucket and dirty-day tables, the triggers marking days, and every existing day marked"""
+    statements = [
+        """
+        CREATE TABLE IF NOT EXISTS rollup_buckets (
+            table_name TEXT NOT NULL,
+            grain TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            facet TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (table_name, grain, bucket, facet)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS rollup_dirty (
+            table_name TEXT NOT NULL,
+            day TEXT NOT NULL,
+            PRIMARY KEY (table_name, day)
+        ) WITHOUT ROWID
+        """,
+    ]
+    for table, date_column in ROLLUP_DATE_COLUMNS.items():
+        facet = SUMMARY_TABLES[table][1]
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_insert_rollup
+        AFTER INSERT ON {table}
+        BEGIN
+            {_mark_dirty(table, 'new')}
+        END
+        """)
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_delete_rollup
+        AFTER DELETE ON {table}
+        BEGIN
+            {_mark_dirty(table, 'old')}
+        END
+        """)
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_update_rollup
+        AFTER UPDATE OF {date_column}, {facet} ON {table}
+        WHEN old.{date_column} IS NOT new.{date_column} OR old.{facet} IS NOT new.{facet}
+        BEGIN
+            {_mark_dirty(table, 'old')}
+            {_mark_dirty(table, 'new')}
+        END
+        """)
+        statements.append(
+            f"INSERT OR IGNORE INTO rollup_dirty (table_name, day) "
+            f"SELECT DISTINCT '{table}', date({date_column}) FROM {table} "
+            f"WHERE date({date_column}) IS NOT NULL"
+        )
+    return statements
+
+def _rollup_day_index_statements():
+    """Indexes on the day expression the rollups bucket by, so a recount seeks each dirty day"""
+    return [f"CREATE INDEX IF NOT EXISTS idx_{table}_day ON {table} (date({date_column}))"
+            for table, date_column in ROLLUP_DATE_COLUMNS.items()]
+
+def _change_log_statements():
+    """Append-only change log, consumer positions and one trigger per table and write kind"""
+    statements = [
+        # AUTOINCREMENT: sequence numbers are never reused, even after compaction
+        """
+        CREATE TABLE IF NOT EXISTS changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            op TEXT NOT NULL,
+            changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS change_consumers (
+            name TEXT PRIMARY KEY,
+            seq INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID
+        """,
+    ]
+    for table in DOMAIN_TABLES:
+        for event, row in (('INSERT', 'new'), ('UPDATE', 'new'), ('DELETE', 'old')):
+            statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_cdc
+        AFTER {event} ON {table}
+        BEGIN
+            INSERT INTO changes (table_name, row_id, op) VALUES ('{table}', {row}.id, '{event}');
+        END
+        """)
+    return statements
+
+# Statuses after which a record can move to archive.db
+CLOSED_STATUSES = ('Resolved', 'Closed')
+
+# Archived table -> (hot + cold view, cold-only view); the TEMP views are
+# created on every connection once archive.db is attached
+ARCHIVE_TABLES = {
+    'cyber_incidents': ('incidents_all', 'incidents_archive'),
+    'it_tickets': ('tickets_all', 'tickets_archive'),
+}
+
+def _closed_at_statements():
+    """closed_at columns stamped by trigger when a record enters or leaves a closed status"""
+    closed = ', '.join(f"'{status}'" for status in CLOSED_STATUSES)
+    statements = []
+    for table, index in (('cyber_incidents', 'idx_incidents_closed'),
+                         ('it_tickets', 'idx_tickets_closed')):
+        statements.append(f"ALTER TABLE {table} ADD COLUMN closed_at TIMESTAMP")
+        statements.append(f"CREATE INDEX IF NOT EXISTS {index} ON {table} (status, closed_at)")
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_insert_closed
+        AFTER INSERT ON {table}
+        WHEN new.status IN ({closed}) AND new.closed_at IS NULL
+        BEGIN
+            UPDATE {table} SET closed_at = CURRENT_TIMESTAMP WHERE id = new.id;
+        END
+        """)
+        statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_update_closed
+        AFTER UPDATE OF status ON {table}
+        WHEN COALESCE(new.status IN ({closed}), 0) != COALESCE(old.status IN ({closed}), 0)
+        BEGIN
+            UPDATE {table}
+            SET closed_at = CASE WHEN new.status IN ({closed}) THEN CURRENT_TIMESTAMP END
+            WHERE id = new.id;
+        END
+        """)
+        # The real close time of existing records is unknown; starting the clock
+        # now never archives anything early
+        statements.append(
+            f"UPDATE {table} SET closed_at = CURRENT_TIMESTAMP "
+            f"WHERE status IN ({closed}) AND closed_at IS NULL"
+        )
+    return statements
+
+# Domain table -> column holding the record's id in the system it was imported
+# from (the CSV exports); unique, so re-imports upsert instead of duplicating
+EXTERNAL_KEYS = {
+    'cyber_incidents': 'incident_id',
+    'it_tickets': 'ticket_id',
+    'datasets_metadata': 'dataset_id',
+}
+
+def _external_key_statements():
+    """External id columns with unique indexes (NULL for records created in the app)"""
+    statements = []
+    for table, column in EXTERNAL_KEYS.items():
+        statements.append(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+        statements.append(f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{table}_{column} "
+                          f"ON {table} ({column})")
+    return statements
+
+# Free-form date text column -> integer Unix-seconds column derived from it.
+# The epoch columns are VIRTUAL generated columns: SQLite computes them on
+# read and keeps their index current on every write, so the text formats
+# written by strftime/isoformat/CURRENT_TIMESTAMP all land on one indexed
+# scale (unparseable text gives NULL). Naive times are read as UTC.
+EPOCH_COLUMNS = {
+    'cyber_incidents': {'date': 'date_epoch'},
+    'it_tickets': {'created_date': 'created_date_epoch'},
+    'datasets_metadata': {'created_at': 'created_at_epoch'},
+}
+
+def _epoch_column_statements():
+    """Generated epoch columns with the indexes that serve date-range queries"""
+    statements = []
+    for table, columns in EPOCH_COLUMNS.items():
+        for column, epoch_column in columns.items():
+            statements.append(
+                f"ALTER TABLE {table} ADD COLUMN {epoch_column} INTEGER "
+                f"GENERATED ALWAYS AS (CAST(strftime('%s', {column}) AS INTEGER)) VIRTUAL"
+            )
+            statements.append(f"CREATE INDEX IF NOT EXISTS idx_{table}_{epoch_column} "
+                              f"ON {table} ({epoch_column})")
+    return statements
+
+# Tables maintained by triggers from other tables: cached reads of the derived
+# table must be dropped whenever a source table changes
+DERIVED_TABLES = {
+    **{index: (table,) for index, (table, _, _) in SEARCH_INDEXES.items()},
+    'domain_summary': tuple(SUMMARY_TABLES),
+    'rollup_buckets': tuple(ROLLUP_DATE_COLUMNS),
+    'changes': tuple(DOMAIN_TABLES),
+    # archive.db only changes when records move out of their hot table
+    **{view: (table,) for table, views in ARCHIVE_TABLES.items() for view in views},
+    'archive_counts': tuple(ARCHIVE_TABLES),
+}
+
+MIGRATIONS = [
+    Migration(1, "Base tables", [
+        # Users table
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            role TEXT DEFAULT 'user',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # Cyber incidents table
+        """
+        CREATE TABLE IF NOT EXISTS cyber_incidents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            status TEXT DEFAULT 'Open',
+            description TEXT,
+            reported_by TEXT,
+            date TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # Datasets metadata table
+        """
+        CREATE TABLE IF NOT EXISTS datasets_metadata (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            source TEXT,
+            category TEXT,
+            size INTEGER,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # IT tickets table
+        """
+        CREATE TABLE IF NOT EXISTS it_tickets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            status TEXT DEFAULT 'Open',
+            assigned_to TEXT,
+            description TEXT,
+            created_date TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ]),
+    Migration(2, "Indexes on hot filter and sort columns", [
+        "CREATE INDEX IF NOT EXISTS idx_incidents_date ON cyber_incidents (date)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_status_date ON cyber_incidents (status, date)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_severity ON cyber_incidents (severity)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_created_date ON it_tickets (created_date)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_status_created ON it_tickets (status, created_date)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_priority ON it_tickets (priority)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_assigned_to ON it_tickets (assigned_to)",
+        "CREATE INDEX IF NOT EXISTS idx_datasets_created_at ON datasets_metadata (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_datasets_category ON datasets_metadata (category)",
+    ]),
+    Migration(3, "Per-table change counters for cross-process cache invalidation",
+              _change_counter_statements()),
+    Migration(4, "FTS5 search indexes over incidents, tickets and datasets",
+              _search_index_statements()),
+    Migration(5, "Trigger-maintained status/severity/priority/category counts",
+              _summary_statements()),
+    Migration(6, "Day/week/month trend rollups refreshed from dirty days",
+              _rollup_statements()),
+    Migration(7, "Change-data-capture log of domain table writes",
+              _change_log_statements()),
+    Migration(8, "closed_at on incidents and tickets for hot/cold archival",
+              _closed_at_statements()),
+    Migration(9, "Unique external ids for idempotent CSV imports",
+              _external_key_statements()),
+    Migration(10, "Indexed integer epoch columns for date-range queries",
+              _epoch_column_statements()),
+    Migration(11, "Day-expression indexes for rollup recounts",
+              _rollup_day_index_statements()),
+    # Nothing to change in platform.db: the version bump makes DatabaseManager
+    # re-run its archive.db schema check, which adds the count table
+    Migration(12, "Trigger-maintained row counts of the archive.db tables"),
+]
@@ -0,0 +1,24 @@
+"""
+Page Queries
+SQL the Streamlit pages run directly, kept here so the query plan tests
+check exactly the statements the pages issue
+"""
+
+# Listings, newest first ({where} is a DatabaseManager.date_range filter).
+# All-time listings stop at the most recent LISTING_LIMIT records
+LISTING_LIMIT = 1000
+INCIDENTS = "SELECT * FROM cyber_incidents ORDER BY date DESC LIMIT ?"
+INCIDENTS_IN_PERIOD = "SELECT * FROM cyber_incidents WHERE {where} ORDER BY date_epoch DESC, id DESC"
+TICKETS = "SELECT * FROM it_tickets ORDER BY created_date DESC LIMIT ?"
+TICKETS_IN_PERIOD = "SELECT * FROM it_tickets WHERE {where} ORDER BY created_date_epoch DESC, id DESC"
+DATASETS = "SELECT * FROM datasets_metadata ORDER BY created_at DESC LIMIT ?"
+
+# Single records
+INCIDENT_BY_ID = "SELECT * FROM cyber_incidents WHERE id = ?"
+TICKET_BY_ID = "SELECT * FROM it_tickets WHERE id = ?"
+DATASET_BY_ID = "SELECT * FROM datasets_metadata WHERE id = ?"
+
+# Pickers: ids and labels of the most recent PICKER_LIMIT records
+PICKER_LIMIT = 500
+INCIDENT_PICKER = "SELECT id, title FROM cyber_incidents ORDER BY date DESC LIMIT ?"
+DATASET_PICKER = "SELECT id, name FROM datasets_metadata ORDER BY created_at DESC LIMIT ?"
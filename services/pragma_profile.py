@@ -0,0 +1,130 @@
+"""
+SQLite PRAGMA Performance Profile
+Groups the connection-level tuning knobs applied to every new connection
+"""
+import sqlite3
+from typing import Any, Dict
+
+class PragmaProfile:
+    """Tunable set of SQLite PRAGMAs applied on connect"""
+    
+    SYNCHRONOUS_LEVELS = ['OFF', 'NORMAL', 'FULL', 'EXTRA']
+    TEMP_STORE_VALUES = ['DEFAULT', 'FILE', 'MEMORY']
+    JOURNAL_MODES = ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF']
+    AUTO_VACUUM_MODES = ['NONE', 'FULL', 'INCREMENTAL']
+    
+    def __init__(self, journal_mode: str = "WAL", synchronous: str = "NORMAL",
+                 cache_size: int = -20000, temp_store: str = "MEMORY",
+                 mmap_size: int = 128 * 1024 * 1024, busy_timeout: int = 5000,
+                 auto_vacuum: str = "INCREMENTAL"):
+        """
+        Initialize a PragmaProfile
+        
+        Args:
+            journal_mode: Journal mode (WAL lets readers run alongside the writer)
+            synchronous: Sync level (OFF/NORMAL/FULL/EXTRA); NORMAL is safe under WAL
+            cache_size: Page cache size; negative values are KiB, positive are pages
+            temp_store: Where temp tables and indexes live (DEFAULT/FILE/MEMORY)
+            mmap_size: Bytes of the database file to memory-map (0 disables)
+            busy_timeout: Milliseconds to wait on a locked database before erroring
+            auto_vacuum: Free-page handling (NONE/FULL/INCREMENTAL); only takes effect
+                         on a new database or at the next VACUUM
+        """
+        journal_mode = journal_mode.upper()
+        synchronous = synchronous.upper()
+        temp_store = temp_store.upper()
+        auto_vacuum = auto_vacuum.upper()
+        if journal_mode not in self.JOURNAL_MODES:
+            raise ValueError(f"Unknown journal_mode: {journal_mode}")
+        if synchronous not in self.SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unknown synchronous level: {synchronous}")
+        if temp_store not in self.TEMP_STORE_VALUES:
+            raise ValueError(f"Unknown temp_store: {temp_store}")
+        if auto_vacuum not in self.AUTO_VACUUM_MODES:
+            raise ValueError(f"Unknown auto_vacuum mode: {auto_vacuum}")
+        
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.cache_size = int(cache_size)
+        self.temp_store = temp_store
+        self.mmap_size = int(mmap_size)
+        self.busy_timeout = int(busy_timeout)
+        self.auto_vacuum = auto_vacuum
+    
+    def apply(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply the profile to a connection
+        
+        Args:
+            conn: Freshly opened connection (must not be inside a transaction)
+        """
+        conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+        # Before journal_mode: switching to WAL writes the header of a new file
+        conn.execute(f"PRAGMA auto_vacuum = {self.auto_vacuum}")
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA cache_size = {self.cache_size}")
+        conn.execute(f"PRAGMA temp_store = {self.temp_store}")
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+    
+    def apply_read_only(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply the profile to a read-only connection
+        
+        The journal mode and sync level belong to the writer and cannot be
+        changed from a read-only connection, so only the read-side PRAGMAs are set.
+        
+        Args:
+            conn: Freshly opened read-only connection
+        """
+        conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+        conn.execute(f"PRAGMA cache_size = {self.cache_size}")
+        conn.execute(f"PRAGMA temp_store = {self.temp_store}")
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+    
+    @staticmethod
+    def read(conn: sqlite3.Connection) -> Dict[str, Any]:
+        """
+        Read the effective PRAGMA values from a connection
+        
+        Args:
+            conn: Connection to inspect
+        
+        Returns:
+            Dict: Current value of each tuned PRAGMA
+        """
+        def pragma(name: str) -> Any:
+            row = conn.execute(f"PRAGMA {name}").fetchone()
+            return row[0] if row else None
+        
+        synchronous = pragma('synchronous')
+        temp_store = pragma('temp_store')
+        auto_vacuum = pragma('auto_vacuum')
+        return {
+            'journal_mode': str(pragma('journal_mode')).upper(),
+            'synchronous': PragmaProfile.SYNCHRONOUS_LEVELS[synchronous]
+            if isinstance(synchronous, int) and synchronous < 4 else synchronous,
+            'cache_size': pragma('cache_size'),
+            'temp_store': PragmaProfile.TEMP_STORE_VALUES[temp_store]
+            if isinstance(temp_store, int) and temp_store < 3 else temp_store,
+            'mmap_size': pragma('mmap_size'),
+            'busy_timeout': pragma('busy_timeout'),
+            'auto_vacuum': PragmaProfile.AUTO_VACUUM_MODES[auto_vacuum]
+            if isinstance(auto_vacuum, int) and auto_vacuum < 3 else auto_vacuum,
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert profile to dictionary"""
+        return {
+            'journal_mode': self.journal_mode,
+            'synchronous': self.synchronous,
+            'cache_size': self.cache_size,
+            'temp_store': self.temp_store,
+            'mmap_size': self.mmap_size,
+            'busy_timeout': self.busy_timeout,
+            'auto_vacuum': self.auto_vacuum,
+        }
+    
+    def __str__(self) -> str:
+        return (f"PragmaProfile(journal_mode='{self.journal_mode}', "
+                f"synchronous='{self.synchronous}', cache_size={self.cache_size})")
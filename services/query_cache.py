@@ -0,0 +1,230 @@
+"""
+Query Cache Service Class
+Read-through cache for SELECT results, invalidated by per-table write versions
+"""
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+_TABLE_PATTERN = re.compile(r'\b(?:FROM|JOIN)\s+["`\[]?(\w+)', re.IGNORECASE)
+_WRITE_PATTERN = re.compile(
+    r'^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)'
+    r'\s+["`\[]?(\w+)',
+    re.IGNORECASE
+)
+
+def tables_read_by(sql: str) -> FrozenSet[str]:
+    """Names of the tables a SELECT reads from"""
+    return frozenset(name.lower() for name in _TABLE_PATTERN.findall(sql))
+
+def table_written_by(sql: str) -> Optional[str]:
+    """Name of the table an INSERT/UPDATE/DELETE writes to, if any"""
+    match = _WRITE_PATTERN.match(sql)
+    return match.group(1).lower() if match else None
+
+class _Entry:
+    """One cached result with the table versions it was computed against"""
+    
+    __slots__ = ('value', 'versions', 'expires_at', 'size')
+    
+    def __init__(self, value: Any, versions: Tuple[Tuple[str, int], ...],
+                 expires_at: float, size: int):
+        self.value = value
+        self.versions = versions
+        self.expires_at = expires_at
+        self.size = size
+
+class QueryCache:
+    """LRU + TTL cache of query results keyed by (sql, params)"""
+    
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 60.0,
+                 max_bytes: int = 32 * 1024 * 1024):
+        """
+        Initialize QueryCache
+        
+        Args:
+            max_entries: Maximum number of cached results
+            ttl_seconds: Lifetime of an entry even if its tables never change
+            max_bytes: Approximate memory cap across all entries
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, _Entry]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._bytes = 0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0,
+        }
+    
+    @staticmethod
+    def make_key(sql: str, params: Optional[tuple], kind: str = "rows") -> tuple:
+        """Build a cache key; kind separates results of different shapes for the same SQL"""
+        return (kind, sql, tuple(params) if params else ())
+    
+    # Items sized per container; longer results are sampled and extrapolated
+    SIZE_SAMPLE = 64
+    
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        """
+        Rough byte size of a result, down to the cell values
+        
+        Covers every cached form: (names, row tuples), (names, one row) and
+        (names, column tuples). A list or tuple with more than SIZE_SAMPLE
+        items is sized from evenly spaced samples.
+        """
+        size = sys.getsizeof(value)
+        if isinstance(value, dict):
+            items = list(value.values())
+        elif isinstance(value, (list, tuple)):
+            items = value
+        else:
+            return size
+        count = len(items)
+        if count > QueryCache.SIZE_SAMPLE:
+            step = count / QueryCache.SIZE_SAMPLE
+            sample = [items[int(i * step)] for i in range(QueryCache.SIZE_SAMPLE)]
+            sampled = sum(QueryCache._estimate_size(item) for item in sample)
+            return size + sampled * count // len(sample)
+        return size + sum(QueryCache._estimate_size(item) for item in items)
+    
+    def snapshot(self, tables: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+        """
+        Capture current versions of tables before running a query
+        
+        Args:
+            tables: Tables the query reads
+        
+        Returns:
+            Tuple: (table, version) pairs to pass to put()
+        """
+        with self._lock:
+            return tuple((table, self._versions.get(table, 0)) for table in sorted(tables))
+    
+    def get(self, key: tuple) -> Tuple[bool, Any]:
+        """
+        Look up a cached result
+        
+        Args:
+            key: Key from make_key()
+        
+        Returns:
+            Tuple: (hit, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return False, None
+            if entry.expires_at < time.monotonic():
+                self._drop(key)
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return False, None
+            if any(self._versions.get(table, 0) != version for table, version in entry.versions):
+                self._drop(key)
+                self._stats['invalidations'] += 1
+                self._stats['misses'] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return True, entry.value
+    
+    def put(self, key: tuple, value: Any, versions: Tuple[Tuple[str, int], ...]) -> None:
+        """
+        Store a result computed against the given table versions
+        
+        Args:
+            key: Key from make_key()
+            value: Query result
+            versions: Snapshot taken before the query ran
+        """
+        size = self._estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            # A write landed while the query ran; the result may already be stale
+            if any(self._versions.get(table, 0) != version for table, version in versions):
+                return
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(value, versions, time.monotonic() + self.ttl_seconds, size)
+            self._bytes += size
+            self._stats['stores'] += 1
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._stats['evictions'] += 1
+    
+    def _drop(self, key: tuple) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+    
+    def add_dependency(self, derived: str, *sources: str) -> None:
+        """
+        Declare a table whose rows are maintained from other tables (e.g. by trigger)
+        
+        Args:
+            derived: Table written as a side effect of writes to sources
+            sources: Tables whose writes change derived
+        """
+        with self._lock:
+            for source in sources:
+                self._dependents.setdefault(source.lower(), set()).add(derived.lower())
+    
+    def bump(self, *tables: str) -> None:
+        """
+        Mark tables as changed so results that read them are discarded
+        
+        Tables that depend on a changed table are marked as well.
+        
+        Args:
+            tables: Names of written tables
+        """
+        with self._lock:
+            changed = set()
+            for table in tables:
+                table = table.lower()
+                changed.add(table)
+                changed.update(self._dependents.get(table, ()))
+            for table in changed:
+                self._versions[table] = self._versions.get(table, 0) + 1
+    
+    def table_version(self, table: str) -> int:
+        """Current write version of a table"""
+        with self._lock:
+            return self._versions.get(table.lower(), 0)
+    
+    def clear(self) -> None:
+        """Drop every cached result"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        
+        Returns:
+            Dict: Hit/miss/eviction counters, hit rate, entries and bytes used
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['hits'] + stats['misses']
+            stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+        return stats
\ No newline at end of file
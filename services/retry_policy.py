@@ -0,0 +1,107 @@
+"""
+Retry Policy Service Class
+Retries work that failed on a locked/busy SQLite database, with jittered backoff
+"""
+import random
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict
+
+class DatabaseBusyError(sqlite3.OperationalError):
+    """Raised when an operation is still locked out after every retry"""
+
+class RetryPolicy:
+    """Jittered exponential backoff for SQLITE_BUSY / SQLITE_LOCKED errors"""
+    
+    BUSY_MESSAGES = ('database is locked', 'database table is locked', 'database is busy')
+    
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.05,
+                 max_delay: float = 1.0, jitter: float = 0.5):
+        """
+        Initialize RetryPolicy
+        
+        Args:
+            max_attempts: Total tries including the first (1 disables retrying)
+            base_delay: Sleep before the first retry, doubled each attempt
+            max_delay: Upper bound on a single sleep
+            jitter: Fraction of each sleep randomised so contending sessions spread out
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        
+        self._lock = threading.Lock()
+        self._stats = {
+            'lock_errors': 0,
+            'retries': 0,
+            'recovered': 0,
+            'failures': 0,
+            'wait_seconds': 0.0,
+        }
+    
+    @classmethod
+    def is_busy(cls, exc: BaseException) -> bool:
+        """Check whether an exception is a lock/busy error worth retrying"""
+        if isinstance(exc, DatabaseBusyError) or not isinstance(exc, sqlite3.OperationalError):
+            return False
+        message = str(exc).lower()
+        return any(text in message for text in cls.BUSY_MESSAGES)
+    
+    def delay(self, attempt: int) -> float:
+        """Backoff before retry number attempt (1-based)"""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * (1 - self.jitter + random.random() * self.jitter)
+    
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+    
+    def run(self, operation: Callable[[], Any]) -> Any:
+        """
+        Run an idempotent operation, retrying it while the database is locked
+        
+        Args:
+            operation: Callable that can safely be repeated from the start
+        
+        Returns:
+            Any: The operation's return value
+        
+        Raises:
+            DatabaseBusyError: The database stayed locked for every attempt
+        """
+        attempt = 1
+        while True:
+            try:
+                result = operation()
+            except sqlite3.OperationalError as exc:
+                if not self.is_busy(exc):
+                    raise
+                self._count('lock_errors')
+                if attempt >= self.max_attempts:
+                    self._count('failures')
+                    raise DatabaseBusyError(
+                        f"Database still locked after {attempt} attempts: {exc}"
+                    ) from exc
+                pause = self.delay(attempt)
+                self._count('retries')
+                self._count('wait_seconds', pause)
+                time.sleep(pause)
+                attempt += 1
+                continue
+            if attempt > 1:
+                self._count('recovered')
+            return result
+    
+    def stats(self) -> Dict[str, float]:
+        """
+        Get lock-contention statistics
+        
+        Returns:
+            Dict: Lock errors seen, retries, recoveries, final failures and time spent waiting
+        """
+        with self._lock:
+            return dict(self._stats)
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Rollup Service Class
+Day/week/month trend counts refreshed incrementally from the days that changed
+"""
+import sqlite3
+from typing import Any, Dict, List, Optional
+from services.database_manager import DatabaseManager
+from services.migrations import ROLLUP_DATE_COLUMNS, SUMMARY_TABLES, ARCHIVE_TABLES
+
+class RollupService:
+    """Time-bucketed counts per domain table and severity/priority/category"""
+    
+    # Coarser grains: bucket start for a day, and the length of one bucket
+    GRAINS = {
+        'week': ("date({}, 'weekday 0', '-6 days')", '+7 days'),  # weeks start on Monday
+        'month': ("date({}, 'start of month')", '+1 month'),
+    }
+    
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize RollupService with database manager
+        
+        Args:
+            db_manager: DatabaseManager instance for data access
+        """
+        self.db_manager = db_manager
+    
+    def refresh(self, conn: Optional[sqlite3.Connection] = None) -> Dict[str, int]:
+        """
+        Recount the buckets touched since the last refresh
+        
+        Triggers record each day whose rows were inserted, deleted or
+        re-dated; only those days are recounted (an index seek per day)
+        and only the weeks and months containing them are re-summed from
+        the day buckets. This takes the write lock, so it runs from the
+        maintenance scheduler and after bulk writes, never from a read.
+        
+        Args:
+            conn: Autocommit connection with archive.db attached to run on
+                  (the maintenance scheduler's); by default a transaction()
+                  on the calling thread's connection
+        
+        Returns:
+            Dict: Number of days recounted per table (empty when nothing changed)
+        """
+        if conn is None:
+            if not self.db_manager.exists('rollup_dirty'):
+                return {}
+            with self.db_manager.transaction() as conn:
+                refreshed = self._refresh(conn)
+        else:
+            if not conn.execute("SELECT EXISTS (SELECT 1 FROM rollup_dirty)").fetchone()[0]:
+                return {}
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                refreshed = self._refresh(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+        self.db_manager.invalidate('rollup_buckets')
+        return refreshed
+        
+    def _refresh(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        refreshed = {}
+        for table, date_column in ROLLUP_DATE_COLUMNS.items():
+            days = conn.execute(
+                "SELECT COUNT(*) FROM rollup_dirty WHERE table_name = ?", (table,)
+            ).fetchone()[0]
+            if not days:
+                continue
+            self._refresh_days(conn, table, date_column)
+            for grain in self.GRAINS:
+                self._refresh_grain(conn, table, grain)
+            conn.execute("DELETE FROM rollup_dirty WHERE table_name = ?", (table,))
+            refreshed[table] = days
+        return refreshed
+    
+    @staticmethod
+    def _sources(table: str) -> List[str]:
+        """Tables holding a domain's rows: archived records still count towards trends"""
+        if table in ARCHIVE_TABLES:
+            return [f"main.{table}", f"archive.{table}"]
+        return [f"main.{table}"]
+    
+    def _refresh_days(self, conn, table: str, date_column: str) -> None:
+        facet = SUMMARY_TABLES[table][1]
+        conn.execute(
+            "DELETE FROM rollup_buckets WHERE table_name = ? AND grain = 'day' "
+            "AND bucket IN (SELECT day FROM rollup_dirty WHERE table_name = ?)",
+            (table, table)
+        )
+        # Rows are matched on the same date() expression the triggers mark
+        # days with, so offsets and other formats land in the right bucket.
+        # CROSS JOIN keeps the dirty days outermost and the unary + lets the
+        # idx_<table>_day expression index serve each day.
+        per_source = " UNION ALL ".join(f"""
+                SELECT d.day AS day, COALESCE(t.{facet}, '') AS facet
+                FROM rollup_dirty d
+                CROSS JOIN {source} t ON date(t.{date_column}) = +d.day
+                WHERE d.table_name = ?""" for source in self._sources(table))
+        conn.execute(f"""
+            INSERT INTO rollup_buckets (table_name, grain, bucket, facet, count)
+            SELECT ?, 'day', day, facet, COUNT(*) FROM ({per_source})
+            GROUP BY day, facet
+        """, (table,) + (table,) * len(self._sources(table)))
+    
+    def _refresh_grain(self, conn, table: str, grain: str) -> None:
+        start, length = self.GRAINS[grain]
+        touched = (f"SELECT DISTINCT {start.format('day')} FROM rollup_dirty "
+                   f"WHERE table_name = ?")
+        conn.execute(
+            f"DELETE FROM rollup_buckets WHERE table_name = ? AND grain = ? "
+            f"AND bucket IN ({touched})",
+            (table, grain, table)
+        )
+        conn.execute(f"""
+            WITH touched (bucket) AS ({touched})
+            INSERT INTO rollup_buckets (table_name, grain, bucket, facet, count)
+            SELECT ?, ?, touched.bucket, b.facet, SUM(b.count)
+            FROM touched
+            JOIN rollup_buckets b ON b.table_name = ? AND b.grain = 'day'
+                                 AND b.bucket >= touched.bucket
+                                 AND b.bucket < date(touched.bucket, '{length}')
+            GROUP BY touched.bucket, b.facet
+        """, (table, table, grain, table))
+    
+    def series(self, table: str, grain: str = 'day', start: Optional[str] = None,
+               end: Optional[str] = None, by_facet: bool = False) -> List[Dict[str, Any]]:
+        """
+        Counts per bucket over a date range
+        
+        Reads only the stored buckets in the range, so the cost depends on
+        the range and grain, not on how much history the table holds. This
+        is a pure read (safe inside read_only()); buckets reflect the last
+        refresh().
+        
+        Args:
+            table: Domain table name
+            grain: 'day', 'week' or 'month'
+            start: First bucket date to include (YYYY-MM-DD), None for the earliest
+            end: Last bucket date to include (YYYY-MM-DD), None for the latest
+            by_facet: Split each bucket by severity/priority/category
+        
+        Returns:
+            List[Dict]: Rows with bucket and count (plus facet when by_facet),
+                        oldest first; empty buckets are omitted
+        """
+        if table not in ROLLUP_DATE_COLUMNS:
+            raise ValueError(f"No rollups are kept for table: {table}")
+        if grain != 'day' and grain not in self.GRAINS:
+            raise ValueError(f"Unknown grain: {grain}")
+        
+        sql = "SELECT bucket, "
+        sql += "facet, count " if by_facet else "SUM(count) AS count "
+        sql += "FROM rollup_buckets WHERE table_name = ? AND grain = ?"
+        params: tuple = (table, grain)
+        if start is not None:
+            sql += " AND bucket >= ?"
+            params += (start,)
+        if end is not None:
+            sql += " AND bucket <= ?"
+            params += (end,)
+        sql += " ORDER BY bucket, facet" if by_facet else " GROUP BY bucket ORDER BY bucket"
+        rows = self.db_manager.fetch_all(sql, params)
+        if by_facet:
+            for row in rows:
+                row['facet'] = row['facet'] if row['facet'] != '' else None
+        return rows
+    
+    def rebuild(self) -> Dict[str, int]:
+        """
+        Recount every bucket from scratch
+        
+        Returns:
+            Dict: Number of days recounted per table
+        """
+        with self.db_manager.transaction() as conn:
+            conn.execute("DELETE FROM rollup_buckets")
+            for table, date_column in ROLLUP_DATE_COLUMNS.items():
+                for source in self._sources(table):
+                    conn.execute(
+                        f"INSERT OR IGNORE INTO rollup_dirty (table_name, day) "
+                        f"SELECT DISTINCT ?, date({date_column}) FROM {source} "
+                        f"WHERE date({date_column}) IS NOT NULL",
+                        (table,)
+                    )
+        return self.refresh()
@@ -0,0 +1,68 @@
+"""
+Row Types
+Builds result rows in the form a caller asks for, compiled once per query shape
+"""
+import keyword
+from collections import namedtuple
+from dataclasses import make_dataclass
+from functools import lru_cache
+from typing import Any, Callable, List, Sequence, Tuple
+
+# Result forms accepted by DatabaseManager's fetch methods, cheapest first
+ROW_TYPES = ('tuple', 'namedtuple', 'dataclass', 'dict')
+
+def _field_names(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Column names usable as attributes ("COUNT(*)" or duplicates become column_<position>)"""
+    fields, seen = [], set()
+    for position, name in enumerate(names):
+        if (not name.isidentifier() or keyword.iskeyword(name)
+                or name.startswith('_') or name in seen):
+            name = f"column_{position}"
+        seen.add(name)
+        fields.append(name)
+    return tuple(fields)
+
+@lru_cache(maxsize=512)
+def row_class(names: Tuple[str, ...], row_type: str) -> type:
+    """
+    Get the namedtuple or slotted dataclass for a result's column names
+    
+    Classes are cached per column tuple, so every query returning the same
+    shape shares one class instead of building it per call.
+    
+    Args:
+        names: Column names from cursor.description
+        row_type: 'namedtuple' or 'dataclass'
+    
+    Returns:
+        type: Row class taking the column values positionally
+    """
+    fields = _field_names(names)
+    if row_type == 'namedtuple':
+        return namedtuple('Row', fields)
+    if row_type == 'dataclass':
+        return make_dataclass('Row', fields, slots=True)
+    raise ValueError(f"No row class for row type: {row_type}")
+
+def row_builder(names: Tuple[str, ...], row_type: str) -> Callable[[Sequence[tuple]], List[Any]]:
+    """
+    Get a function turning plain result tuples into rows of row_type
+    
+    Args:
+        names: Column names from cursor.description
+        row_type: One of ROW_TYPES
+    
+    Returns:
+        Callable: Maps a list of tuples to a new list of rows
+    """
+    if row_type == 'tuple':
+        return list  # tuples are immutable: only the list is copied
+    if row_type == 'dict':
+        return lambda rows: [dict(zip(names, row)) for row in rows]
+    if row_type == 'namedtuple':
+        make = row_class(names, row_type)._make
+        return lambda rows: list(map(make, rows))
+    if row_type == 'dataclass':
+        cls = row_class(names, row_type)
+        return lambda rows: [cls(*row) for row in rows]
+    raise ValueError(f"Unknown row type: {row_type} (expected one of {', '.join(ROW_TYPES)})")
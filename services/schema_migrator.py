@@ -0,0 +1,105 @@
+"""
+Schema Migrator Service Class
+Applies ordered, versioned schema migrations tracked in PRAGMA user_version
+"""
+import sqlite3
+from typing import Callable, List, Optional, Sequence
+
+class Migration:
+    """A single numbered schema change"""
+    
+    def __init__(self, version: int, description: str,
+                 statements: Sequence[str] = (),
+                 apply: Optional[Callable[[sqlite3.Connection], None]] = None):
+        """
+        Initialize a Migration
+        
+        Args:
+            version: Schema version this migration upgrades to (1, 2, 3...)
+            description: Short human-readable summary
+            statements: SQL statements executed in order
+            apply: Optional Python step run after the statements (for backfills)
+        """
+        self.version = version
+        self.description = description
+        self.statements = list(statements)
+        self.apply = apply
+    
+    def run(self, conn: sqlite3.Connection) -> None:
+        """Execute this migration on an open transaction"""
+        for statement in self.statements:
+            conn.execute(statement)
+        if self.apply:
+            self.apply(conn)
+    
+    def __str__(self) -> str:
+        return f"Migration(version={self.version}, description='{self.description}')"
+
+class SchemaMigrator:
+    """Brings a database up to the latest schema version exactly once"""
+    
+    def __init__(self, migrations: Sequence[Migration]):
+        """
+        Initialize SchemaMigrator
+        
+        Args:
+            migrations: Migrations with consecutive versions starting at 1
+        """
+        ordered = sorted(migrations, key=lambda m: m.version)
+        for expected, migration in enumerate(ordered, start=1):
+            if migration.version != expected:
+                raise ValueError(f"Migration versions must be consecutive; "
+                                 f"expected {expected}, got {migration.version}")
+        self.migrations: List[Migration] = ordered
+    
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+    
+    @staticmethod
+    def current_version(conn: sqlite3.Connection) -> int:
+        """Read the schema version stored in the database header"""
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    
+    def is_current(self, conn: sqlite3.Connection) -> bool:
+        """Check whether the database is already at the latest version"""
+        return self.current_version(conn) >= self.latest_version
+    
+    def pending(self, conn: sqlite3.Connection) -> List[Migration]:
+        """List migrations not yet applied to the database"""
+        version = self.current_version(conn)
+        return [m for m in self.migrations if m.version > version]
+    
+    def migrate(self, conn: sqlite3.Connection) -> List[int]:
+        """
+        Apply all pending migrations
+        
+        An up-to-date database costs a single PRAGMA read. Otherwise each
+        migration runs in its own write transaction, and the version is
+        re-read under the write lock so concurrent processes never apply
+        the same step twice.
+        
+        Args:
+            conn: Connection to migrate (must not be inside a transaction)
+        
+        Returns:
+            List[int]: Versions applied by this call
+        """
+        if self.is_current(conn):
+            return []
+        
+        applied = []
+        for migration in self.pending(conn):
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self.current_version(conn) >= migration.version:
+                    conn.rollback()
+                    continue
+                migration.run(conn)
+                conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            applied.append(migration.version)
+        return applied
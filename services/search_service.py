@@ -0,0 +1,124 @@
+"""
+Search Service Class
+Ranked full-text search across incidents, tickets and datasets using FTS5
+"""
+import heapq
+import re
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from services.database_manager import DatabaseManager
+from services.migrations import SEARCH_INDEXES
+
+_TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+class SearchService:
+    """Unified BM25-ranked search over the domain tables"""
+    
+    # domain -> (FTS5 index, label expression over the content row d)
+    DOMAINS = {
+        'incidents': ('search_incidents', "d.severity || ' · ' || d.status"),
+        'tickets': ('search_tickets', "d.priority || ' · ' || d.status"),
+        'datasets': ('search_datasets', "COALESCE(d.category, '')"),
+    }
+    HIGHLIGHT = ('**', '**')
+    # Shorter trailing terms match whole words only; a 1-2 letter prefix
+    # expands to most of the vocabulary and has to score every match
+    MIN_PREFIX_LENGTH = 3
+    SNIPPET_TOKENS = 16
+    
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize SearchService with database manager
+        
+        Args:
+            db_manager: DatabaseManager instance for data access
+        """
+        self.db_manager = db_manager
+    
+    @classmethod
+    def build_match(cls, text: str) -> Optional[str]:
+        """
+        Turn free text into a safe FTS5 MATCH expression
+        
+        Every word is quoted, so operators and stray quotes in the input
+        cannot cause syntax errors; all words must match and the last one
+        also matches as a prefix (search-as-you-type).
+        
+        Args:
+            text: Text typed into the search box
+        
+        Returns:
+            Optional[str]: MATCH expression, or None if there is nothing to search for
+        """
+        terms = _TERM_PATTERN.findall(text or '')
+        if not terms:
+            return None
+        parts = [f'"{term}"' for term in terms]
+        if len(terms[-1]) >= cls.MIN_PREFIX_LENGTH:
+            parts[-1] += '*'
+        return ' '.join(parts)
+    
+    def _domain_sql(self, domain: str) -> str:
+        """Top-k query for one domain, ordered by the index's configured bm25 rank"""
+        index, label = self.DOMAINS[domain]
+        table = SEARCH_INDEXES[index][0]
+        start, end = self.HIGHLIGHT
+        return f"""
+            SELECT '{domain}' AS domain, d.id AS id,
+                   highlight({index}, 0, '{start}', '{end}') AS title,
+                   snippet({index}, -1, '{start}', '{end}', '…', {self.SNIPPET_TOKENS}) AS snippet,
+                   {label} AS label, {index}.rank AS rank
+            FROM {index} JOIN {table} d ON d.id = {index}.rowid
+            WHERE {index} MATCH ?
+            ORDER BY rank LIMIT ?
+        """
+    
+    def search(self, text: str, domains: Iterable[str] = None, limit: int = 20,
+               offset: int = 0) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Search one or more domains and merge the results by relevance
+        
+        Each domain contributes only its own best offset + limit rows (FTS5
+        serves ORDER BY rank LIMIT from the index), so cost follows the
+        page depth rather than the table size. The already ranked lists are
+        merged here rather than re-sorted by SQLite in a temporary B-tree.
+        
+        Args:
+            text: Text typed into the search box
+            domains: Subset of DOMAINS to search (default: all)
+            limit: Results per page
+            offset: Results to skip (the next_offset of the previous page)
+        
+        Returns:
+            Tuple: (results, next_offset); next_offset is None on the last page.
+                   Each result has domain, id, title, snippet, label and rank.
+        """
+        match = self.build_match(text)
+        if match is None:
+            return [], None
+        domains = list(domains) if domains else list(self.DOMAINS)
+        unknown = [domain for domain in domains if domain not in self.DOMAINS]
+        if unknown:
+            raise ValueError(f"Unknown search domain(s): {', '.join(unknown)}")
+        
+        depth = offset + limit + 1
+        ranked = [self.db_manager.fetch_all(self._domain_sql(domain), (match, depth))
+                  for domain in domains]
+        rows = list(islice(heapq.merge(*ranked, key=itemgetter('rank')), offset, depth))
+        if len(rows) <= limit:
+            return rows, None
+        return rows[:limit], offset + limit
+    
+    def rebuild(self) -> None:
+        """Rebuild every search index from its table (after writes that bypassed the triggers)"""
+        with self.db_manager.transaction() as conn:
+            for index in SEARCH_INDEXES:
+                conn.execute(f"INSERT INTO {index} ({index}) VALUES ('rebuild')")
+        self.db_manager.invalidate(*SEARCH_INDEXES)
+    
+    def optimize(self) -> None:
+        """Merge each index's b-trees into one, making later queries faster"""
+        with self.db_manager.transaction() as conn:
+            for index in SEARCH_INDEXES:
+                conn.execute(f"INSERT INTO {index} ({index}) VALUES ('optimize')")
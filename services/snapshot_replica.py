@@ -0,0 +1,124 @@
+"""
+Snapshot Replica Service Class
+Keeps a copy of the database, refreshed in the background, for heavy analytical reads
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from services.connection_pool import read_only_uri
+
+class SnapshotReplica:
+    """Copy of the live database made with the sqlite3 online backup API"""
+    
+    def __init__(self, source_path: str, snapshot_path: Optional[str] = None,
+                 refresh_interval: float = 60.0):
+        """
+        Initialize SnapshotReplica, take the first copy and start refreshing it
+        
+        Readers never pay for a copy: a background thread brings the snapshot
+        up to date every refresh_interval seconds, and readers only see a new
+        copy once its backup has committed.
+        
+        Args:
+            source_path: Path to the live database file
+            snapshot_path: Where to keep the copy (defaults to <name>.snapshot<ext>
+                           next to the source)
+            refresh_interval: Seconds between two background refreshes
+        """
+        if snapshot_path is None:
+            root, ext = os.path.splitext(source_path)
+            snapshot_path = f"{root}.snapshot{ext or '.db'}"
+        self.source_path = source_path
+        self.snapshot_path = snapshot_path
+        self.refresh_interval = refresh_interval
+        
+        self._lock = threading.Lock()
+        self._source: Optional[sqlite3.Connection] = None
+        self._target: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._refreshed_at = 0.0
+        self._stats = {'refreshes': 0, 'skipped': 0, 'failures': 0, 'copy_seconds': 0.0}
+        self.refresh()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="db-snapshot", daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh(force=False)
+            except sqlite3.Error:
+                with self._lock:
+                    self._stats['failures'] += 1  # the next interval tries again
+    
+    def _connections(self):
+        if self._source is None:
+            # Read-only: the copy never takes a write lock on the live database
+            self._source = sqlite3.connect(read_only_uri(self.source_path), uri=True,
+                                           check_same_thread=False)
+        if self._target is None:
+            self._target = sqlite3.connect(self.snapshot_path, check_same_thread=False)
+            # WAL on the copy lets readers keep going while it is refreshed
+            self._target.execute("PRAGMA journal_mode = WAL")
+        return self._source, self._target
+    
+    def refresh(self, force: bool = True) -> bool:
+        """
+        Copy the live database into the snapshot
+        
+        PRAGMA data_version on the private source connection only moves when
+        someone else commits, so an unchanged database is not copied again.
+        
+        Args:
+            force: Copy even if nothing was committed since the last refresh
+        
+        Returns:
+            bool: True if a new copy was taken
+        """
+        with self._lock:
+            source, target = self._connections()
+            data_version = source.execute("PRAGMA data_version").fetchone()[0]
+            if not force and data_version == self._data_version:
+                self._refreshed_at = time.monotonic()
+                self._stats['skipped'] += 1
+                return False
+            started = time.monotonic()
+            source.backup(target)
+            self._data_version = data_version
+            self._refreshed_at = time.monotonic()
+            self._stats['refreshes'] += 1
+            self._stats['copy_seconds'] += self._refreshed_at - started
+            return True
+    
+    def age(self) -> float:
+        """Seconds since the snapshot was last brought up to date"""
+        return time.monotonic() - self._refreshed_at
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get snapshot statistics
+        
+        Returns:
+            Dict: Copies taken, refreshes skipped or failed, time spent copying
+                  and current age
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['age_seconds'] = self.age()
+        stats['snapshot_path'] = self.snapshot_path
+        return stats
+    
+    def close(self) -> None:
+        """Stop refreshing and close the replica's private connections (the snapshot file is kept)"""
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+        with self._lock:
+            for conn in (self._source, self._target):
+                if conn is not None:
+                    conn.close()
+            self._source = None
+            self._target = None
+            self._data_version = None
@@ -0,0 +1,140 @@
+"""
+Statement Registry Service Class
+Validates table/column names against the live schema and caches generated SQL
+"""
+import sqlite3
+import threading
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+class StatementRegistry:
+    """Compiles and caches SQL text for the generic write helpers"""
+    
+    def __init__(self):
+        """Initialize an empty registry (call refresh() to load the schema)"""
+        self._lock = threading.Lock()
+        self._columns: Dict[str, FrozenSet[str]] = {}
+        self._statements: Dict[tuple, str] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'schema_loads': 0}
+        self._loader = None
+    
+    def refresh(self, conn: sqlite3.Connection) -> None:
+        """
+        Load table and column names from the live schema
+        
+        Args:
+            conn: Connection used to read sqlite_master and table_info
+        """
+        tables = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'view') "
+            "AND name NOT LIKE 'sqlite_%'"
+        ).fetchall()]
+        columns = {}
+        for table in tables:
+            info = conn.execute(f'PRAGMA table_info("{table}")').fetchall()
+            columns[table] = frozenset(row[1] for row in info)
+        with self._lock:
+            if columns != self._columns:
+                self._statements.clear()
+            self._columns = columns
+            self._stats['schema_loads'] += 1
+    
+    def set_loader(self, loader) -> None:
+        """Provide a callable returning a connection, used to reload an unknown table"""
+        self._loader = loader
+    
+    def _check(self, table: str, columns: Iterable[str]) -> None:
+        known = self._columns.get(table)
+        if known is None and self._loader is not None:
+            # The schema may have been migrated by another process since the last load
+            self.refresh(self._loader())
+            known = self._columns.get(table)
+        if known is None:
+            raise ValueError(f"Unknown table: {table}")
+        unknown = [column for column in columns if column not in known]
+        if unknown:
+            raise ValueError(f"Unknown column(s) for {table}: {', '.join(unknown)}")
+    
+    def _compile(self, key: tuple, table: str, columns: Tuple[str, ...], build) -> str:
+        with self._lock:
+            sql = self._statements.get(key)
+            if sql is not None:
+                self._stats['hits'] += 1
+                return sql
+            self._stats['misses'] += 1
+        self._check(table, columns)
+        sql = build()
+        with self._lock:
+            self._statements[key] = sql
+        return sql
+    
+    def insert(self, table: str, columns: Tuple[str, ...]) -> str:
+        """INSERT for a table and column tuple"""
+        return self._compile(
+            ('insert', table, columns), table, columns,
+            lambda: f"INSERT INTO {table} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join(['?' for _ in columns])})"
+        )
+    
+    def update(self, table: str, columns: Tuple[str, ...]) -> str:
+        """UPDATE by id for a table and column tuple"""
+        return self._compile(
+            ('update', table, columns), table, columns,
+            lambda: f"UPDATE {table} SET {', '.join(f'{c} = ?' for c in columns)} WHERE id = ?"
+        )
+    
+    def upsert(self, table: str, columns: Tuple[str, ...], conflict_keys: Tuple[str, ...],
+               update_columns: Tuple[str, ...]) -> str:
+        """INSERT ... ON CONFLICT DO UPDATE that skips rows whose values are unchanged"""
+        def build():
+            sql = (f"INSERT INTO {table} ({', '.join(columns)}) "
+                   f"VALUES ({', '.join(['?' for _ in columns])}) "
+                   f"ON CONFLICT ({', '.join(conflict_keys)}) ")
+            if not update_columns:
+                return sql + "DO NOTHING"
+            return (sql + f"DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in update_columns)} "
+                    f"WHERE {' OR '.join(f'{c} IS NOT excluded.{c}' for c in update_columns)}")
+        return self._compile(
+            ('upsert', table, columns, conflict_keys, update_columns), table,
+            columns + conflict_keys + update_columns, build
+        )
+    
+    def delete(self, table: str) -> str:
+        """DELETE by id for a table"""
+        return self._compile(
+            ('delete', table), table, (),
+            lambda: f"DELETE FROM {table} WHERE id = ?"
+        )
+    
+    def update_in(self, table: str, columns: Tuple[str, ...], id_count: int) -> str:
+        """UPDATE for a batch of id_count ids"""
+        return self._compile(
+            ('update_in', table, columns, id_count), table, columns,
+            lambda: f"UPDATE {table} SET {', '.join(f'{c} = ?' for c in columns)} "
+                    f"WHERE id IN ({', '.join(['?'] * id_count)})"
+        )
+    
+    def delete_in(self, table: str, id_count: int) -> str:
+        """DELETE for a batch of id_count ids"""
+        return self._compile(
+            ('delete_in', table, id_count), table, (),
+            lambda: f"DELETE FROM {table} WHERE id IN ({', '.join(['?'] * id_count)})"
+        )
+    
+    def columns(self, table: str) -> FrozenSet[str]:
+        """Known columns of a table (validates the table name)"""
+        self._check(table, ())
+        return self._columns[table]
+    
+    def stats(self) -> Dict[str, float]:
+        """
+        Get registry statistics
+        
+        Returns:
+            Dict: Hits, misses, hit rate, cached statement count and schema loads
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['hits'] + stats['misses']
+            stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+            stats['statements'] = len(self._statements)
+        return stats
\ No newline at end of file
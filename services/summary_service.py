@@ -0,0 +1,108 @@
+"""
+Summary Service Class
+Dashboard counts read from the trigger-maintained domain_summary table
+"""
+from typing import Any, Dict, Iterable, List, Tuple
+from services.database_manager import DatabaseManager
+from services.migrations import SUMMARY_TABLES, summary_source_sql
+
+class SummaryService:
+    """Precomputed per status x severity/priority/category counts"""
+    
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize SummaryService with database manager
+        
+        Args:
+            db_manager: DatabaseManager instance for data access
+        """
+        self.db_manager = db_manager
+    
+    @staticmethod
+    def _check_table(table: str) -> None:
+        if table not in SUMMARY_TABLES:
+            raise ValueError(f"No summary is kept for table: {table}")
+    
+    def counts(self, table: str, dimension: str) -> Dict[Any, int]:
+        """
+        Row counts of a table grouped by its status or facet column
+        
+        Args:
+            table: Domain table name
+            dimension: 'status' or the table's facet column (severity, priority, category)
+        
+        Returns:
+            Dict: Mapping of value to row count, largest first (NULL values map to None)
+        """
+        self._check_table(table)
+        status, facet = SUMMARY_TABLES[table]
+        if dimension == status:
+            group = 'status'
+        elif dimension == facet:
+            group = 'facet'
+        else:
+            raise ValueError(f"{table} has no summary by {dimension}")
+        # A table has at most a few dozen summary rows: read them by primary
+        # key prefix and group here instead of sorting in a temporary B-tree
+        totals: Dict[Any, int] = {}
+        for value, count in self.db_manager.fetch_all(
+            f"SELECT {group}, count FROM domain_summary WHERE table_name = ?",
+            (table,), row_type='tuple'
+        ):
+            value = value if value != '' else None
+            totals[value] = totals.get(value, 0) + count
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+    
+    def total(self, table: str, statuses: Iterable[str] = None) -> int:
+        """
+        Number of rows in a table, optionally only those in the given statuses
+        
+        Args:
+            table: Domain table name
+            statuses: Status values to include (default: all rows)
+        
+        Returns:
+            int: Row count
+        """
+        self._check_table(table)
+        sql = "SELECT COALESCE(SUM(count), 0) AS total FROM domain_summary WHERE table_name = ?"
+        params: tuple = (table,)
+        if statuses is not None:
+            statuses = tuple(statuses)
+            if not statuses:
+                return 0
+            sql += f" AND status IN ({', '.join(['?'] * len(statuses))})"
+            params += statuses
+        return self.db_manager.fetch_one(sql, params)['total']
+    
+    def verify(self) -> Dict[str, List[Tuple[str, str, int, int]]]:
+        """
+        Compare the summary against a full recount of every table
+        
+        Returns:
+            Dict: Per table, the (status, facet, summary count, actual count)
+                  rows that disagree; empty lists when the summary is exact
+        """
+        mismatches = {}
+        for table in SUMMARY_TABLES:
+            actual = {(status, facet): count for _, status, facet, count
+                      in self.db_manager.fetch_all(summary_source_sql(table), row_type='tuple')}
+            stored = {(status, facet): count for status, facet, count
+                      in self.db_manager.fetch_all(
+                          "SELECT status, facet, count FROM domain_summary WHERE table_name = ?",
+                          (table,), row_type='tuple'
+                      )}
+            mismatches[table] = sorted(
+                (status, facet, stored.get((status, facet), 0), actual.get((status, facet), 0))
+                for status, facet in set(actual) | set(stored)
+                if stored.get((status, facet), 0) != actual.get((status, facet), 0)
+            )
+        return mismatches
+    
+    def rebuild(self) -> None:
+        """Recount every table into the summary (after writes that bypassed the triggers)"""
+        with self.db_manager.transaction() as conn:
+            conn.execute("DELETE FROM domain_summary")
+            for table in SUMMARY_TABLES:
+                conn.execute(f"INSERT INTO domain_summary {summary_source_sql(table)}")
+        self.db_manager.invalidate('domain_summary')
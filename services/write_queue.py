@@ -0,0 +1,131 @@
+"""
+Write Queue Service Class
+Funnels writes through one writer thread that commits them in groups
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_STOP = object()
+
+class WriteQueue:
+    """Single-writer queue with group commit"""
+    
+    def __init__(self, run_batch: Callable[[List[Callable[[], Any]]], List[Tuple[bool, Any]]],
+                 max_batch: int = 256, max_delay: float = 0.005):
+        """
+        Initialize WriteQueue
+        
+        Args:
+            run_batch: Executes a list of operations in one transaction on the
+                       writer thread and returns (ok, result-or-exception) per operation
+            max_batch: Most operations merged into one commit
+            max_delay: Seconds the writer waits for more work before committing
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.run_batch = run_batch
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        
+        self._queue: "queue.Queue" = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._stats = {'operations': 0, 'batches': 0, 'largest_batch': 0, 'failed_batches': 0}
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+    
+    @property
+    def thread(self) -> threading.Thread:
+        return self._thread
+    
+    def submit(self, operation: Callable[[], Any]) -> Future:
+        """
+        Queue a write operation
+        
+        Args:
+            operation: Callable run on the writer thread inside a group transaction
+        
+        Returns:
+            Future: Resolves to the operation's return value once its group commits
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("Write queue has been stopped")
+        future: Future = Future()
+        self._queue.put((operation, future))
+        return future
+    
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until every write submitted so far is committed
+        
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        self.submit(lambda: None).result(timeout)
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Commit outstanding writes and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+    
+    def _collect(self, first) -> Tuple[list, bool]:
+        """Gather a batch starting with first, until max_batch or max_delay"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+    
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch, stopping = self._collect(item)
+            live = [(operation, future) for operation, future in batch
+                    if future.set_running_or_notify_cancel()]
+            if not live:
+                continue
+            try:
+                outcomes = self.run_batch([operation for operation, _ in live])
+            except BaseException as exc:
+                # The group commit itself failed; nothing in it was written
+                with self._stats_lock:
+                    self._stats['failed_batches'] += 1
+                for _, future in live:
+                    future.set_exception(exc)
+                continue
+            
+            with self._stats_lock:
+                self._stats['operations'] += len(live)
+                self._stats['batches'] += 1
+                self._stats['largest_batch'] = max(self._stats['largest_batch'], len(live))
+            for (_, future), (ok, value) in zip(live, outcomes):
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+    
+    def stats(self) -> Dict[str, float]:
+        """
+        Get writer statistics
+        
+        Returns:
+            Dict: Operations, commits, mean/largest group size and queue depth
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['mean_batch'] = stats['operations'] / stats['batches'] if stats['batches'] else 0.0
+        stats['queued'] = self._queue.qsize()
+        return stats
\ No newline at end of file
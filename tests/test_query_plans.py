@@ -0,0 +1,147 @@
+"""
+Query plan checks for the SQL the pages run
+Seeds a database, records every read the pages' queries and services issue
+and asserts that SQLite answers each one from an index: no full table
+scans, no temporary B-tree sorts.
+    
+    python -m unittest tests.test_query_plans
+    QUERY_PLAN_ROWS=1000000 python -m unittest tests.test_query_plans   (full size, slow)
+"""
+import os
+import random
+import re
+import shutil
+import tempfile
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+from services import page_queries
+from services.archive_service import ArchiveService
+from services.database_manager import DatabaseManager
+from services.migrations import EPOCH_COLUMNS
+from services.rollup_service import RollupService
+from services.search_service import SearchService
+from services.summary_service import SummaryService
+
+# Rows seeded for the checks; the full-size run is opt-in as it takes minutes
+ROWS = int(os.environ.get('QUERY_PLAN_ROWS', 20_000))
+WORDS = ("phishing malware ransomware printer network login password outage "
+         "email vpn database server laptop").split()
+FIRST_DAY = date(2023, 1, 1)
+
+def _seed(db_manager: DatabaseManager, rows: int) -> None:
+    """Insert rows records split 40/40/20 over incidents, tickets and datasets"""
+    rnd = random.Random(1)
+    
+    def day(i: int) -> str:
+        return (FIRST_DAY + timedelta(days=i % 700)).isoformat()
+    
+    def text() -> str:
+        return ' '.join(rnd.choices(WORDS, k=8))
+    
+    db_manager.insert_many('cyber_incidents', ({
+        'title': f"{rnd.choice(WORDS)} {rnd.choice(WORDS)} {i}",
+        'severity': rnd.choice(['Low', 'Medium', 'High', 'Critical']),
+        'status': rnd.choice(['Open', 'In Progress', 'Resolved', 'Closed']),
+        'description': text(), 'reported_by': f"user{i % 50}", 'date': day(i),
+    } for i in range(rows * 4 // 10)), chunk_size=10000)
+    db_manager.insert_many('it_tickets', ({
+        'title': f"{rnd.choice(WORDS)} issue {i}",
+        'priority': rnd.choice(['Low', 'Medium', 'High', 'Critical']),
+        'status': rnd.choice(['Open', 'In Progress', 'Resolved', 'Closed']),
+        'assigned_to': f"staff{i % 30}", 'description': text(), 'created_date': day(i),
+    } for i in range(rows * 4 // 10)), chunk_size=10000)
+    db_manager.insert_many('datasets_metadata', ({
+        'name': f"dataset {i}", 'source': 'api',
+        'category': rnd.choice(['Raw Data', 'Processed', 'Training']),
+        'size': i * 10, 'description': text(),
+    } for i in range(rows * 2 // 10)), chunk_size=10000)
+    
+    # Move a slice of the closed records to the archive so its views have data
+    for table in ('cyber_incidents', 'it_tickets'):
+        db_manager.execute_query(f"UPDATE {table} SET closed_at = '2020-01-01' "
+                                 f"WHERE status = 'Closed' AND id % 10 = 0")
+    ArchiveService(db_manager).archive()
+    RollupService(db_manager).refresh()
+    db_manager.execute_query("ANALYZE")
+    db_manager.execute_query("ANALYZE archive")
+
+class QueryPlanTest(unittest.TestCase):
+    """Every page query on a large database is served by an index"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.db_manager = DatabaseManager(os.path.join(cls.directory, 'platform.db'),
+                                         cache_results=False)
+        _seed(cls.db_manager, ROWS)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.db_manager.close()
+        shutil.rmtree(cls.directory, ignore_errors=True)
+    
+    def _page_queries(self):
+        """The statements in services.page_queries with parameters filled in"""
+        period_start = FIRST_DAY + timedelta(days=600)
+        for name, sql in vars(page_queries).items():
+            if not name.isupper() or not isinstance(sql, str):
+                continue
+            params: tuple = ()
+            if '{where}' in sql:
+                table = re.search(r'FROM (\w+)', sql).group(1)
+                (column,) = EPOCH_COLUMNS[table]
+                where, params = self.db_manager.date_range(table, column, start=period_start)
+                sql = sql.format(where=where)
+            limit = (page_queries.PICKER_LIMIT if name.endswith('_PICKER')
+                     else page_queries.LISTING_LIMIT)
+            params += (limit,) * (sql.count('?') - len(params))
+            yield sql, params
+    
+    def _service_reads(self):
+        """The reads the search, archive, home and analytics pages make through services"""
+        db_manager = self.db_manager
+        issued = []
+        execute = DatabaseManager._execute
+        
+        def record(manager, sql, params=None, *args, **kwargs):
+            if sql.lstrip().upper().startswith('SELECT'):
+                issued.append((sql, tuple(params or ())))
+            return execute(manager, sql, params, *args, **kwargs)
+        
+        with mock.patch.object(DatabaseManager, '_execute', record):
+            search_service = SearchService(db_manager)
+            search_service.search('phishing mal')
+            search_service.search('network', ['tickets'], offset=20)
+            
+            archive_service = ArchiveService(db_manager)
+            for table in ('cyber_incidents', 'it_tickets'):
+                _, next_key = archive_service.browse(table)
+                archive_service.browse(table, after_key=next_key)
+            archive_service.stats()
+            
+            summary_service = SummaryService(db_manager)
+            for table, dimensions in (('cyber_incidents', ('status', 'severity')),
+                                      ('it_tickets', ('status', 'priority')),
+                                      ('datasets_metadata', ('category',))):
+                summary_service.total(table)
+                summary_service.total(table, ('Open', 'In Progress'))
+                for dimension in dimensions:
+                    summary_service.counts(table, dimension)
+            
+            for grain in ('day', 'week', 'month'):
+                RollupService(db_manager).series('cyber_incidents', grain)
+        return list(dict.fromkeys(issued))
+    
+    def test_page_queries_use_indexes(self):
+        queries = list(self._page_queries())
+        self.assertTrue(queries)
+        self.assertEqual(self.db_manager.verify_query_plans(queries), {})
+    
+    def test_service_queries_use_indexes(self):
+        queries = self._service_reads()
+        self.assertTrue(queries)
+        self.assertEqual(self.db_manager.verify_query_plans(queries), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+# verify_summaries.py
+# Check (and optionally rebuild) the trigger-maintained dashboard counts
+#   python verify_summaries.py            report mismatches
+#   python verify_summaries.py --rebuild  recount every table
+import sys
+from services.database_manager import DatabaseManager
+from services.summary_service import SummaryService
+
+db_manager = DatabaseManager('database/platform.db')
+summary_service = SummaryService(db_manager)
+
+if '--rebuild' in sys.argv:
+    summary_service.rebuild()
+    print("🔄 Summary counts rebuilt")
+
+mismatches = summary_service.verify()
+for table, rows in mismatches.items():
+    if not rows:
+        print(f"✅ {table}: summary matches")
+        continue
+    print(f"❌ {table}: {len(rows)} mismatched group(s)")
+    for status, facet, stored, actual in rows:
+        print(f"   status={status!r} facet={facet!r}: summary {stored}, actual {actual}")
+
+db_manager.close()
+sys.exit(1 if any(mismatches.values()) else 0)